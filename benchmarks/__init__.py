@@ -0,0 +1 @@
+"""Benchmarks of diophila against a local stand-in for the OpenAlex API."""
@@ -0,0 +1,125 @@
+"""Benchmark diophila against a local fake OpenAlex API, without network access.
+
+Usage:
+    python -m benchmarks.run [--latency 0.005] [--entity-bytes 4000] [--error-rate 0.01]
+                             [--cursor-pages 20] [--repeat 50] [--workers 4]
+                             [--transport requests|urllib3|httpx]
+
+Reports requests/s, entities/s, peak (Python) memory and the 50th/99th latency
+percentiles for single entities, groups, basic paging and cursor paging.
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from benchmarks.fake_server import FakeOpenAlex
+from diophila import (MetricsCollector, RateLimiter,
+                      RequestsTransport, Urllib3Transport, HTTPXTransport)
+from diophila.api_caller import APICaller
+from diophila.endpoints import Works
+
+TRANSPORTS = {'requests': RequestsTransport, 'urllib3': Urllib3Transport, 'httpx': HTTPXTransport}
+
+
+def measure(name: str, call: Callable[[], int], metrics: MetricsCollector, paging: str) -> dict:
+    """ Run a benchmark twice, returning its measurements.
+
+    Tracing memory allocations slows down decoding JSON considerably,
+    so the first run is timed and the second one measures the peak memory.
+
+    Args:
+        name (str): name of the benchmark.
+        call (Callable[[], int]): runs the benchmark, returning the number of entities received.
+        metrics (MetricsCollector): hook of the API caller used by `call`.
+        paging (str): paging mode of the requests to report the latencies of.
+    """
+    start = time.perf_counter()
+    entities = call()
+    seconds = time.perf_counter() - start
+    summary = metrics.summary().get(f"works {paging}", {})
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'benchmark': name,
+            'requests/s': summary.get('requests', 0) / seconds,
+            'entities/s': entities / seconds,
+            'peak MiB': peak / 2 ** 20,
+            'p50 ms': summary.get('p50', 0) * 1000,
+            'p99 ms': summary.get('p99', 0) * 1000,
+            'retries': summary.get('retries', 0)}
+
+
+def benchmarks(args) -> Tuple[Tuple[str, str, Callable[[Works], int]], ...]:
+    """ Get the benchmarks as (name, paging mode, call) triples."""
+    def single(works):
+        for number in range(1, args.repeat + 1):
+            works.get_single(f"W{number}")
+        return args.repeat
+
+    def groups(works):
+        return sum(len(works.get_groups("publication_year")['group_by'])
+                   for _ in range(args.repeat))
+
+    def basic_paging(works):
+        pages = works.get_list(per_page=200, pages=list(range(1, args.cursor_pages + 1)),
+                               workers=args.workers)
+        return sum(len(page['results']) for page in pages)
+
+    def cursor_paging(works):
+        return sum(len(page['results']) for page in works.get_list(per_page=200))
+
+    def cursor_streaming(works):
+        return sum(1 for _ in works.get_list(per_page=200, stream=True))
+
+    return (("single", "single", single),
+            ("group_by", "group", groups),
+            ("basic paging", "basic", basic_paging),
+            ("cursor paging", "cursor", cursor_paging),
+            ("cursor streaming", "stream", cursor_streaming))
+
+
+def main(argv=None) -> None:
+    """ Run all benchmarks and print a table of the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds every response of the fake server is delayed by")
+    parser.add_argument("--entity-bytes", type=int, default=0,
+                        help="minimum size of every entity in bytes")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="share of requests answered with '429 Too Many Requests'")
+    parser.add_argument("--cursor-pages", type=int, default=20,
+                        help="number of pages of every list")
+    parser.add_argument("--repeat", type=int, default=50,
+                        help="number of single entity and group_by requests")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="number of pages requested concurrently by basic paging")
+    parser.add_argument("--transport", choices=sorted(TRANSPORTS), default="requests",
+                        help="transport the requests are sent with")
+    args = parser.parse_args(argv)
+
+    results = []
+    with FakeOpenAlex(latency=args.latency, entity_bytes=args.entity_bytes,
+                      error_rate=args.error_rate, cursor_pages=args.cursor_pages,
+                      count=args.cursor_pages * 200) as server:
+        for name, paging, call in benchmarks(args):
+            metrics = MetricsCollector()
+            # no throttling, but retry the errors of the fake server
+            rate_limiter = RateLimiter(per_second=1e9, per_day=None, burst=1000, max_retries=10)
+            api_caller = APICaller(server.url, rate_limiter=rate_limiter, hooks=[metrics],
+                                   transport=TRANSPORTS[args.transport]())
+            works = Works(api_caller)
+            results.append(measure(name, lambda: call(works), metrics, paging))
+
+    columns = list(results[0])
+    print(" | ".join(f"{column:>16}" for column in columns))
+    for result in results:
+        print(" | ".join(f"{value:>16.1f}" if isinstance(value, float) else f"{value:>16}"
+                         for value in result.values()))
+
+
+if __name__ == "__main__":
+    main()
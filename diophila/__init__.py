@@ -1 +1,13 @@
-from diophila.openalex import OpenAlex
\ No newline at end of file
+from diophila.openalex import OpenAlex
+from diophila.async_openalex import AsyncOpenAlex
+from diophila.cache import ResponseCache, SQLiteCache
+from diophila.rate_limiter import RateLimiter, DailyLimitExceeded
+from diophila.export import JSONLWriter, ParquetWriter, export_entities
+from diophila.models import Author, Concept, Institution, Venue, Work, to_model, to_models
+from diophila.abstracts import reconstruct_abstract, reconstruct_abstracts, with_abstracts
+from diophila.citations import CitationCrawler, CitationGraph
+from diophila.ids import pack_id, unpack_id, to_packed_ids, IdSet, IdMap
+from diophila.metrics import RequestEvent, RequestHook, MetricsCollector
+from diophila.transports import RequestsTransport, Urllib3Transport, HTTPXTransport, ReplayTransport
+from diophila.query import Query, not_, gt, lt, between
+from diophila.cursor_index import CursorIndex, SQLiteCursorIndex
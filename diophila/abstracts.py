@@ -0,0 +1,66 @@
+"""This module reconstructs abstracts of works from their inverted index."""
+from itertools import chain
+from typing import Optional, List, Iterable, Iterator
+
+
+def reconstruct_abstract(inverted_index: Optional[dict]) -> Optional[str]:
+    """ Reconstruct the plaintext abstract of a work from its `abstract_inverted_index`.
+
+    Args:
+        inverted_index (Optional[dict]): dict mapping every word of the abstract
+            to the list of its positions.
+
+    Returns:
+        str containing the abstract, or None if the work has no abstract.
+    """
+    if not inverted_index:
+        return None
+    # place every word directly at its position instead of sorting (word, position) pairs
+    length = max(chain.from_iterable(inverted_index.values()), default=-1) + 1
+    words = [None] * length
+    for word, positions in inverted_index.items():
+        for position in positions:
+            words[position] = word
+    if None in words:  # skip gaps in the positions
+        return " ".join(word for word in words if word is not None)
+    return " ".join(words)
+
+
+def reconstruct_abstracts(works: Iterable[dict]) -> List[Optional[str]]:
+    """ Reconstruct the plaintext abstracts of many works e.g. of a whole page at once.
+
+    Args:
+        works (Iterable[dict]): dicts from JSON describing works, containing
+            the 'abstract_inverted_index' field.
+
+    Returns:
+        list of the abstracts, None for works without an abstract.
+    """
+    return [reconstruct_abstract(work.get('abstract_inverted_index')) for work in works]
+
+
+def with_abstracts(items: Iterable[dict],
+                   field: str = "abstract",
+                   drop_inverted_index: bool = False) -> Iterator[dict]:
+    """ Add the reconstructed abstract to every work of a list, a page at a time.
+
+    Args:
+        items (Iterable[dict]): pages or single works e.g. from `get_list_of_works`
+            or `iter_works`.
+        field (str): name of the field the abstract is stored in, defaults to 'abstract'.
+        drop_inverted_index (bool): remove the 'abstract_inverted_index' field
+            after reconstructing the abstract, defaults to False.
+
+    Returns:
+        Generator, yielding copies of the pages (or works) with the abstracts added.
+        The given pages and works are not modified, as they may be shared with a cache.
+    """
+    for item in items:
+        # pages hold their works in 'results', single works are handled as they are
+        is_page = 'meta' in item and 'results' in item
+        works = item['results'] if is_page else [item]
+        works = [{**{key: value for key, value in work.items()
+                     if not (drop_inverted_index and key == 'abstract_inverted_index')},
+                  field: abstract}
+                 for work, abstract in zip(works, reconstruct_abstracts(works))]
+        yield {**item, 'results': works} if is_page else works[0]
@@ -1,10 +1,21 @@
 """This module wraps all API calls to the OpenAlex API."""
+from collections import deque
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Iterable
-import requests
 
+from diophila.cache import _BaseCache
+from diophila.checkpoint import Checkpoint, CheckpointedItems
+from diophila.cursor_index import _BaseCursorIndex
+from diophila.metrics import RequestEvent, RequestHook
+from diophila.prefetch import prefetch
+from diophila.rate_limiter import RateLimiter
+from diophila.streaming import ResultsParser
+from diophila.transports import _BaseTransport, RequestsTransport
 
-class APICaller:
-    """This class wraps all API calls to the OpenAlex API."""
+
+class _BaseAPICaller:
+    """Base class for API callers, holding everything independent of the HTTP client."""
 
     # Basic paging only works for to read the first 10,000 results of any list.
     # see https://docs.openalex.org/api#basic-paging
@@ -14,12 +25,118 @@ class APICaller:
     # see https://docs.openalex.org/api#basic-paging
     PER_PAGE_MAX = 200
 
-    def __init__(self, base_url: str, email: Optional[str] = None) -> object:
-        """ Init API caller, preferably with an email to get into the polite pool."""
+    # size of the chunks a response body is read in when streaming
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # whether `get` and `get_all` return awaitables instead of results
+    is_async = False
+
+    def __init__(self, base_url: str,
+                 email: Optional[str] = None,
+                 keep_alive: bool = True,
+                 cache: Optional[_BaseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 hooks: Optional[List[RequestHook]] = None,
+                 cursor_index: Optional[_BaseCursorIndex] = None):
         self.base_url = base_url
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks or [])
+        self.cursor_index = cursor_index
         self.headers = {'Accept': 'application/json'}
         if email:
             self.headers['User-Agent'] = f'mailto:{email}'
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
+
+    def _notify(self, stage: str, event: RequestEvent) -> None:
+        """Helper method passing an event to the 'on_start' or 'on_end' method of all hooks."""
+        for hook in self.hooks:
+            getattr(hook, stage)(event)
+
+    @staticmethod
+    def _validators(headers) -> dict:
+        """Helper method extracting the headers used to revalidate a cached response."""
+        return {'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+
+    def _validate_per_page_param(self, per_page: int) -> Optional[int]:
+        """Helper method validating the 'per_page' parameter."""
+        if not per_page or per_page <= 0:
+            return 25   # set to default
+        if 0 < per_page <= self.PER_PAGE_MAX:
+            return per_page
+        # elif per_page > self.PER_PAGE_MAX:
+        return self.PER_PAGE_MAX
+
+    def _has_deep_pages(self, pages: List[int], per_page: int) -> bool:
+        """Helper method checking if pages beyond basic paging can be served
+        by jumping to cursors recorded in the cursor index."""
+        max_pages = self.PAGING_RESULTS_MAX / per_page
+        return self.cursor_index is not None and any(page > max_pages for page in pages)
+
+    def _validate_pages(self, pages, per_page):
+        """Helper method validating the 'pages' parameter."""
+        max_pages = self.PAGING_RESULTS_MAX / per_page
+        valid_pages = [page for page in pages if 0 < page <= max_pages]
+        return valid_pages
+
+
+class APICaller(_BaseAPICaller):
+    """This class wraps all API calls to the OpenAlex API."""
+
+    def __init__(self, base_url: str,
+                 email: Optional[str] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 cache: Optional[_BaseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 hooks: Optional[List[RequestHook]] = None,
+                 transport: Optional[_BaseTransport] = None,
+                 cursor_index: Optional[_BaseCursorIndex] = None) -> object:
+        """ Init API caller, preferably with an email to get into the polite pool.
+
+        Args:
+            base_url (str): base URL of the OpenAlex API.
+            email (Optional[str]): email address of the user that will be added
+                        in the request header to get into the polite pool, optional.
+            pool_connections (int): number of connection pools (one per host) to cache.
+            pool_maxsize (int): maximum number of connections kept alive per host.
+            keep_alive (bool): reuse connections between requests. If False,
+                        every request opens (and closes) its own connection.
+            cache (Optional[_BaseCache]): cache for responses e.g. a ResponseCache
+                        or SQLiteCache, optional.
+            rate_limiter (Optional[RateLimiter]): limiter pacing the requests, optional.
+                        Can be shared with other API callers.
+            hooks (Optional[List[RequestHook]]): hooks called at the start and end
+                        of every request e.g. a MetricsCollector, optional.
+            transport (Optional[_BaseTransport]): transport sending the requests e.g.
+                        an Urllib3Transport, HTTPXTransport or ReplayTransport, optional.
+                        Defaults to a RequestsTransport using `pool_connections`
+                        and `pool_maxsize`.
+            cursor_index (Optional[_BaseCursorIndex]): index recording the cursors of
+                        the pages of lists, used to serve pages beyond basic paging, optional.
+        """
+        super().__init__(base_url, email, keep_alive, cache, rate_limiter, hooks, cursor_index)
+        self.transport = transport or RequestsTransport(pool_connections, pool_maxsize)
+
+    @property
+    def session(self):
+        """ Session of the RequestsTransport, None if another transport is used."""
+        return getattr(self.transport, "session", None)
+
+    def close(self) -> None:
+        """ Close the underlying transport and all pooled connections,
+        persisting the daily count of the rate limiter (if any)."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.close()
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def get(self, path: str, params: Optional[dict] = None) -> dict:
         """ Make a GET request to the API.
@@ -32,18 +149,82 @@ class APICaller:
         Returns:
             JSON object from HTTP response.
          """
-        response = requests.get(url=f"{self.base_url}/{path}",
-                                params=params,
-                                headers=self.headers)
+        event = RequestEvent(path, params)
+        self._notify("on_start", event)
+        error = None
+        try:
+            return self.__get(path, params, event)
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            event.finish(error)
+            self._notify("on_end", event)
+
+    def __get(self, path: str, params: Optional[dict], event: RequestEvent) -> dict:
+        """Helper method answering a GET request from the cache or the API."""
+        use_cache = self.cache is not None and self.cache.is_cacheable(path)
+        headers = self.headers
+        if use_cache:
+            result = self.cache.get(path, params)
+            if result is not None:
+                event.cache = "hit"
+                return result
+            event.cache = "miss"
+            # revalidate an expired response instead of downloading it again
+            headers = {**self.headers, **self.cache.validators(path, params)}
+
+        response = self._send(path, params, headers, event)
+        if use_cache and response.status_code == 304:
+            result = self.cache.revalidate(path, params)
+            if result is not None:
+                event.cache = "revalidated"
+                return result
+            # cached response vanished in the meantime, ask again unconditionally
+            response = self._send(path, params, self.headers, event)
         response.raise_for_status()
+        started = time.perf_counter()
         result = response.json()
+        event.decode_time += time.perf_counter() - started
+        event.bytes += len(response.content)
+        if use_cache:
+            self.cache.set(path, params, result, len(response.content),
+                           self._validators(response.headers))
         return result
 
+    def _send(self, path: str, params: Optional[dict], headers: dict,
+              event: RequestEvent, stream: bool = False):
+        """ Send a GET request, paced by the rate limiter (if any) and retried
+        if the API answers with '429 Too Many Requests'. """
+        retries = self.rate_limiter.max_retries if self.rate_limiter is not None else 0
+        for attempt in range(retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = self.transport.get(url=f"{self.base_url}/{path}",
+                                          params=params,
+                                          headers=headers,
+                                          stream=stream)
+            event.status = response.status_code
+            if response.status_code != 429 or attempt == retries:
+                break
+            event.retries += 1
+            response.close()
+            retry_after = response.headers.get('Retry-After')
+            self.rate_limiter.penalize(RateLimiter.parse_retry_after(retry_after))
+
+        if self.rate_limiter is not None and response.status_code != 429:
+            self.rate_limiter.record_success()
+        return response
+
     def get_all(self,
                 path: str,
                 params: dict,
                 per_page: Optional[int] = None,
-                pages: Optional[List[int]] = None) -> Iterable:
+                pages: Optional[List[int]] = None,
+                workers: Optional[int] = None,
+                stream: bool = False,
+                checkpoint: Optional[str] = None,
+                resume: bool = False) -> Iterable:
         """ Make multiple GET requests to the API to paginate through results.
 
         Args:
@@ -53,48 +234,195 @@ class APICaller:
             per_page (Optional[int]): number of entities per page. Needs to be in [1;200].
                 Defaults to 25.
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
-                If empty, cursor pagination will be used.
+                If empty, cursor pagination will be used. Pages beyond the first 10,000
+                results are skipped, unless the API caller has a cursor index: then they
+                are fetched (one after the other) by cursor pagination, starting from
+                the closest page whose cursor is known.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+                Should not exceed the connection pool size.
+            stream (bool): yield single entities instead of pages, defaults to False.
+                Every response is decoded incrementally, so that only a single entity
+                needs to be held in memory at a time. Responses are not cached.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional. A page counts as done once the next
+                page is requested, i.e. after the consumer handled it. `prefetch` (and so
+                `export_entities`) doesn't fetch ahead with a checkpoint, to keep this true.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of entities.
+            Generator, each item a dict from JSON representing a (partial) list of entities,
+            or a single entity if `stream` is set.
+
+        Raises:
+            ValueError: if `stream` is combined with `workers`.
+                        if `checkpoint` is combined with `pages`.
+                        if `resume` is set without `checkpoint`.
+                        if the progress saved in `checkpoint` belongs to a different query.
          """
-        params['per_page'] = self.__validate_per_page_param(per_page)
+        params['per_page'] = self._validate_per_page_param(per_page)
+        if stream and workers and workers > 1:
+            raise ValueError("Streaming can not be combined with fetching pages concurrently.")
+        if checkpoint and pages:
+            raise ValueError("Checkpoints are only supported with cursor pagination.")
+        if resume and not checkpoint:
+            raise ValueError("Resuming requires a checkpoint.")
+        checkpoint = Checkpoint(checkpoint, path, params, resume) if checkpoint else None
+        if stream and checkpoint:
+            return CheckpointedItems(self.__do_streaming(path, params, pages, checkpoint),
+                                     checkpoint)
+        if stream:
+            return self.__do_streaming(path, params, pages, checkpoint)
+        if pages and self._has_deep_pages(pages, params['per_page']):
+            return self.__do_indexed_paging(path, params, pages)
+        if pages and workers and workers > 1:
+            return self.__do_concurrent_basic_paging(path, params, pages, workers)
         if pages:
             return self.__do_basic_paging(path, params, pages)
+        if checkpoint:
+            return CheckpointedItems(self.__do_cursor_paging(path, params, checkpoint),
+                                     checkpoint)
         # else:
-        return self.__do_cursor_paging(path, params)
+        return self.__do_cursor_paging(path, params, checkpoint)
+
+    def iter_all(self,
+                 path: str,
+                 params: dict,
+                 per_page: Optional[int] = None,
+                 pages: Optional[List[int]] = None,
+                 prefetch_depth: int = 2) -> Iterable[dict]:
+        """ Make multiple GET requests to the API to paginate through results,
+        fetching the next pages in the background while the current one is processed.
+
+        Args:
+            path (str): path that will be concatenated to the base URL of the OpenAlex API.
+            params (dict): dictionary containing items that will be constructed
+                        into a query string.
+            per_page (Optional[int]): number of entities per page. Needs to be in [1;200].
+                Defaults to 25.
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single entity.
+         """
+        pages = prefetch(self.get_all(path, params, per_page, pages), prefetch_depth)
+        return (entity for page in pages for entity in page['results'])
 
     def __do_basic_paging(self, path: str, params: dict, pages: List[int]):
         """ Use basic pagination to loop thought the specified result pages. """
-        pages = self.__validate_pages(pages, params['per_page'])
+        pages = self._validate_pages(pages, params['per_page'])
         for page in pages:
             params['page'] = page
             yield self.get(path, params)
 
-    def __do_cursor_paging(self, path: str, params: dict):
-        """ Use cursor pagination to loop thought the results. """
-        params['cursor'] = "*"  # start cursor pagination
-        while True:
+    def __do_concurrent_basic_paging(self, path: str, params: dict,
+                                     pages: List[int], workers: int):
+        """ Use basic pagination to fetch up to `workers` pages at once,
+        yielding them in the order they were requested. """
+        pages = self._validate_pages(pages, params['per_page'])
+        executor = ThreadPoolExecutor(max_workers=workers)
+        in_flight = deque()
+        try:
+            for page in pages:
+                in_flight.append(executor.submit(self.get, path, {**params, 'page': page}))
+                if len(in_flight) >= workers:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __do_streaming(self, path: str, params: dict, pages: Optional[List[int]],
+                         checkpoint: Optional[Checkpoint] = None):
+        """ Use basic or cursor pagination, yielding every entity as soon as it is decoded. """
+        if pages:
+            for page in self._validate_pages(pages, params['per_page']):
+                params['page'] = page
+                yield from self.__stream(path, params, ResultsParser())
+            return
+
+        # start (or resume) cursor pagination
+        params['cursor'] = checkpoint.cursor if checkpoint else "*"
+        while params['cursor']:
+            parser = ResultsParser()
+            entities = 0
+            for entity in self.__stream(path, params, parser):
+                entities += 1
+                yield entity
+            params['cursor'] = parser.fields['meta']['next_cursor']
+            if checkpoint:
+                checkpoint.advance(params['cursor'], entities)
+
+    def __stream(self, path: str, params: dict, parser: ResultsParser):
+        """ Make a GET request to the API, feeding the response body to `parser`
+        and yielding the entities from its results as soon as they are decoded. """
+        event = RequestEvent(path, params, paging="stream")
+        self._notify("on_start", event)
+        error = None
+        try:
+            with self._send(path, params, self.headers, event, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                    started = time.perf_counter()
+                    entities = parser.feed(chunk)
+                    event.decode_time += time.perf_counter() - started
+                    event.bytes += len(chunk)
+                    yield from entities
+                parser.close()
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            event.finish(error)
+            self._notify("on_end", event)
+
+    def __do_cursor_paging(self, path: str, params: dict,
+                           checkpoint: Optional[Checkpoint] = None):
+        """ Use cursor pagination to loop thought the results,
+        saving the progress to `checkpoint` (if any) after every page. """
+        # start (or resume) cursor pagination
+        params['cursor'] = checkpoint.cursor if checkpoint else "*"
+        page = checkpoint.pages + 1 if checkpoint else 1
+        while params['cursor']:
             json_response = self.get(path, params)
             yield json_response
 
-            next_cursor = json_response['meta']['next_cursor']
-            if not next_cursor:
-                break
+            # responses without a next cursor (e.g. of groups) end pagination
+            params['cursor'] = json_response['meta'].get('next_cursor')
+            page += 1
+            if self.cursor_index is not None:
+                self.cursor_index.record(path, params, page, params['cursor'])
+            if checkpoint:
+                checkpoint.advance(params['cursor'], len(json_response['results']))
 
-            params['cursor'] = next_cursor
-
-    def __validate_per_page_param(self, per_page: int) -> Optional[int]:
-        """Helper method validating the 'per_page' parameter."""
-        if not per_page or per_page <= 0:
-            return 25   # set to default
-        if 0 < per_page <= self.PER_PAGE_MAX:
-            return per_page
-        # elif per_page > self.PER_PAGE_MAX:
-        return self.PER_PAGE_MAX
+    def __do_indexed_paging(self, path: str, params: dict, pages: List[int]):
+        """ Use basic pagination for the first 10,000 results and cursor pagination,
+        starting from the closest known cursor, for the pages beyond. """
+        max_pages = self.PAGING_RESULTS_MAX / params['per_page']
+        for page in pages:
+            if 0 < page <= max_pages:
+                yield self.get(path, {**params, 'page': page})
+            elif page > max_pages:
+                json_response = self.__get_deep_page(path, params, page)
+                # pages beyond the last page of the list are skipped
+                if json_response is not None:
+                    yield json_response
 
-    def __validate_pages(self, pages, per_page):
-        """Helper method validating the 'pages' parameter."""
-        max_pages = self.PAGING_RESULTS_MAX / per_page
-        valid_pages = [page for page in pages if 0 < page <= max_pages]
-        return valid_pages
+    def __get_deep_page(self, path: str, params: dict, page: int) -> Optional[dict]:
+        """ Walk from the closest page with a known cursor to `page` by cursor pagination,
+        recording the cursor of every page on the way. """
+        known_page, cursor = self.cursor_index.nearest(path, params, page)
+        params = dict(params)
+        while cursor is not None:
+            params['cursor'] = cursor
+            json_response = self.get(path, params)
+            cursor = json_response['meta'].get('next_cursor')
+            self.cursor_index.record(path, params, known_page + 1, cursor)
+            if known_page == page:
+                # copy the response, it may be shared with the cache
+                return {**json_response, 'meta': {**json_response['meta'], 'page': page}}
+            known_page += 1
+        return None
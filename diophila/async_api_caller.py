@@ -0,0 +1,391 @@
+"""This module wraps all API calls to the OpenAlex API for use with asyncio."""
+import asyncio
+import contextlib
+import json
+import time
+from collections import deque
+from typing import Optional, List, AsyncIterator
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, see extras_require "async"
+    aiohttp = None
+
+from diophila.api_caller import _BaseAPICaller
+from diophila.cache import _BaseCache
+from diophila.checkpoint import Checkpoint
+from diophila.cursor_index import _BaseCursorIndex
+from diophila.metrics import RequestEvent, RequestHook
+from diophila.prefetch import aprefetch
+from diophila.rate_limiter import RateLimiter
+from diophila.streaming import ResultsParser
+
+
+class AsyncAPICaller(_BaseAPICaller):
+    """This class wraps all API calls to the OpenAlex API using asyncio."""
+
+    is_async = True
+
+    def __init__(self, base_url: str,
+                 email: Optional[str] = None,
+                 max_concurrency: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 cache: Optional[_BaseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 hooks: Optional[List[RequestHook]] = None,
+                 cursor_index: Optional[_BaseCursorIndex] = None) -> object:
+        """ Init async API caller, preferably with an email to get into the polite pool.
+
+        Args:
+            base_url (str): base URL of the OpenAlex API.
+            email (Optional[str]): email address of the user that will be added
+                        in the request header to get into the polite pool, optional.
+            max_concurrency (int): maximum number of requests in flight at the same time.
+            pool_maxsize (int): maximum number of connections kept alive per host.
+            keep_alive (bool): reuse connections between requests.
+            cache (Optional[_BaseCache]): cache for responses e.g. a ResponseCache
+                        or SQLiteCache, optional.
+            rate_limiter (Optional[RateLimiter]): limiter pacing the requests, optional.
+                        Can be shared with other API callers.
+            hooks (Optional[List[RequestHook]]): hooks called at the start and end
+                        of every request e.g. a MetricsCollector, optional.
+            cursor_index (Optional[_BaseCursorIndex]): index recording the cursors of
+                        the pages of lists, used to serve pages beyond basic paging, optional.
+
+        Raises:
+            ImportError: if aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncAPICaller requires aiohttp. "
+                              "Install it with 'pip install diophila[async]'.")
+        super().__init__(base_url, email, keep_alive, cache, rate_limiter, hooks, cursor_index)
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        # session and semaphore need a running event loop, so they are created lazily
+        self._session = None
+        self._semaphore = None
+
+    def _get_session(self):
+        """Helper method creating the client session on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize,
+                                             force_close=not self.keep_alive)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  headers=self.headers)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        """ Close the underlying session and all pooled connections,
+        persisting the daily count of the rate limiter (if any)."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get(self, path: str, params: Optional[dict] = None) -> dict:
+        """ Make a GET request to the API.
+
+        Args:
+            path (str): path that will be concatenated to the base URL of the OpenAlex API.
+            params (Optional[dict]): dictionary containing items that will be constructed
+                        into a query string, optional.
+
+        Returns:
+            JSON object from HTTP response.
+         """
+        event = RequestEvent(path, params)
+        self._notify("on_start", event)
+        error = None
+        try:
+            return await self.__get(path, params, event)
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            event.finish(error)
+            self._notify("on_end", event)
+
+    async def __get(self, path: str, params: Optional[dict], event: RequestEvent) -> dict:
+        """Helper method answering a GET request from the cache or the API."""
+        use_cache = self.cache is not None and self.cache.is_cacheable(path)
+        headers = {}
+        if use_cache:
+            result = self.cache.get(path, params)
+            if result is not None:
+                event.cache = "hit"
+                return result
+            event.cache = "miss"
+            # revalidate an expired response instead of downloading it again
+            headers = self.cache.validators(path, params)
+
+        result = await self.__request(path, params, headers, use_cache, event)
+        if result is None:
+            # cached response vanished after '304 Not Modified', ask again unconditionally
+            result = await self.__request(path, params, {}, use_cache, event)
+        return result
+
+    async def __request(self, path: str, params: Optional[dict],
+                        headers: dict, use_cache: bool, event: RequestEvent) -> Optional[dict]:
+        """Helper method sending a single request and caching its response."""
+        async with self._send(path, params, headers, event) as response:
+            if use_cache and response.status == 304:
+                result = self.cache.revalidate(path, params)
+                if result is not None:
+                    event.cache = "revalidated"
+                return result
+            response.raise_for_status()
+            body = await response.read()
+            started = time.perf_counter()
+            result = json.loads(body)
+            event.decode_time += time.perf_counter() - started
+            event.bytes += len(body)
+            if use_cache:
+                self.cache.set(path, params, result, len(body),
+                               self._validators(response.headers))
+            return result
+
+    @contextlib.asynccontextmanager
+    async def _send(self, path: str, params: Optional[dict], headers: dict,
+                    event: RequestEvent):
+        """ Send a GET request, limited by `max_concurrency`, paced by the rate limiter (if any)
+        and retried if the API answers with '429 Too Many Requests'. """
+        session = self._get_session()
+        # aiohttp does not drop empty parameters the way requests does
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        retries = self.rate_limiter.max_retries if self.rate_limiter is not None else 0
+        async with self._semaphore:
+            for attempt in range(retries + 1):
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                response = await session.get(f"{self.base_url}/{path}",
+                                             params=params, headers=headers)
+                event.status = response.status
+                if response.status != 429 or attempt == retries:
+                    break
+                event.retries += 1
+                response.release()
+                retry_after = response.headers.get('Retry-After')
+                self.rate_limiter.penalize(RateLimiter.parse_retry_after(retry_after))
+
+            if self.rate_limiter is not None and response.status != 429:
+                self.rate_limiter.record_success()
+            try:
+                yield response
+            finally:
+                response.release()
+
+    def get_all(self,
+                path: str,
+                params: dict,
+                per_page: Optional[int] = None,
+                pages: Optional[List[int]] = None,
+                workers: Optional[int] = None,
+                stream: bool = False,
+                checkpoint: Optional[str] = None,
+                resume: bool = False) -> AsyncIterator[dict]:
+        """ Make multiple GET requests to the API to paginate through results.
+
+        Args:
+            path (str): path that will be concatenated to the base URL of the OpenAlex API.
+            params (dict): dictionary containing items that will be constructed
+                        into a query string.
+            per_page (Optional[int]): number of entities per page. Needs to be in [1;200].
+                Defaults to 25.
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used. Pages beyond the first 10,000
+                results are skipped, unless the API caller has a cursor index: then they
+                are fetched (one after the other) by cursor pagination, starting from
+                the closest page whose cursor is known.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+            stream (bool): yield single entities instead of pages, defaults to False.
+                Every response is decoded incrementally, so that only a single entity
+                needs to be held in memory at a time. Responses are not cached.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+
+        Returns:
+            Async generator, each item a dict from JSON representing a (partial) list of entities,
+            or a single entity if `stream` is set.
+
+        Raises:
+            ValueError: if `stream` is combined with `workers`.
+                        if `checkpoint` is combined with `pages`.
+                        if `resume` is set without `checkpoint`.
+                        if the progress saved in `checkpoint` belongs to a different query.
+         """
+        params['per_page'] = self._validate_per_page_param(per_page)
+        if stream and workers and workers > 1:
+            raise ValueError("Streaming can not be combined with fetching pages concurrently.")
+        if checkpoint and pages:
+            raise ValueError("Checkpoints are only supported with cursor pagination.")
+        if resume and not checkpoint:
+            raise ValueError("Resuming requires a checkpoint.")
+        checkpoint = Checkpoint(checkpoint, path, params, resume) if checkpoint else None
+        if stream:
+            return self.__do_streaming(path, params, pages, checkpoint)
+        if pages and self._has_deep_pages(pages, params['per_page']):
+            return self.__do_indexed_paging(path, params, pages)
+        if pages and workers and workers > 1:
+            return self.__do_concurrent_basic_paging(path, params, pages, workers)
+        if pages:
+            return self.__do_basic_paging(path, params, pages)
+        # else:
+        return self.__do_cursor_paging(path, params, checkpoint)
+
+    async def iter_all(self,
+                       path: str,
+                       params: dict,
+                       per_page: Optional[int] = None,
+                       pages: Optional[List[int]] = None,
+                       prefetch_depth: int = 2) -> AsyncIterator[dict]:
+        """ Make multiple GET requests to the API to paginate through results,
+        fetching the next pages in the background while the current one is processed.
+
+        Args:
+            path (str): path that will be concatenated to the base URL of the OpenAlex API.
+            params (dict): dictionary containing items that will be constructed
+                        into a query string.
+            per_page (Optional[int]): number of entities per page. Needs to be in [1;200].
+                Defaults to 25.
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+
+        Returns:
+            Async generator, each item a dict from JSON representing a single entity.
+         """
+        async for page in aprefetch(self.get_all(path, params, per_page, pages), prefetch_depth):
+            for entity in page['results']:
+                yield entity
+
+    async def __do_basic_paging(self, path: str, params: dict, pages: List[int]):
+        """ Use basic pagination to loop thought the specified result pages. """
+        pages = self._validate_pages(pages, params['per_page'])
+        for page in pages:
+            params['page'] = page
+            yield await self.get(path, params)
+
+    async def __do_concurrent_basic_paging(self, path: str, params: dict,
+                                           pages: List[int], workers: int):
+        """ Use basic pagination to fetch up to `workers` pages at once,
+        yielding them in the order they were requested. """
+        pages = self._validate_pages(pages, params['per_page'])
+        in_flight = deque()
+        try:
+            for page in pages:
+                in_flight.append(asyncio.ensure_future(self.get(path, {**params, 'page': page})))
+                if len(in_flight) >= workers:
+                    yield await in_flight.popleft()
+            while in_flight:
+                yield await in_flight.popleft()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def __do_streaming(self, path: str, params: dict, pages: Optional[List[int]],
+                             checkpoint: Optional[Checkpoint] = None):
+        """ Use basic or cursor pagination, yielding every entity as soon as it is decoded. """
+        if pages:
+            for page in self._validate_pages(pages, params['per_page']):
+                params['page'] = page
+                async for entity in self.__stream(path, params, ResultsParser()):
+                    yield entity
+            return
+
+        # start (or resume) cursor pagination
+        params['cursor'] = checkpoint.cursor if checkpoint else "*"
+        while params['cursor']:
+            parser = ResultsParser()
+            entities = 0
+            async for entity in self.__stream(path, params, parser):
+                entities += 1
+                yield entity
+            params['cursor'] = parser.fields['meta']['next_cursor']
+            if checkpoint:
+                checkpoint.advance(params['cursor'], entities)
+
+    async def __stream(self, path: str, params: dict, parser: ResultsParser):
+        """ Make a GET request to the API, feeding the response body to `parser`
+        and yielding the entities from its results as soon as they are decoded. """
+        event = RequestEvent(path, params, paging="stream")
+        self._notify("on_start", event)
+        error = None
+        try:
+            async with self._send(path, params, {}, event) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                    started = time.perf_counter()
+                    entities = parser.feed(chunk)
+                    event.decode_time += time.perf_counter() - started
+                    event.bytes += len(chunk)
+                    for entity in entities:
+                        yield entity
+                parser.close()
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            event.finish(error)
+            self._notify("on_end", event)
+
+    async def __do_cursor_paging(self, path: str, params: dict,
+                                 checkpoint: Optional[Checkpoint] = None):
+        """ Use cursor pagination to loop thought the results,
+        saving the progress to `checkpoint` (if any) after every page. """
+        # start (or resume) cursor pagination
+        params['cursor'] = checkpoint.cursor if checkpoint else "*"
+        page = checkpoint.pages + 1 if checkpoint else 1
+        while params['cursor']:
+            json_response = await self.get(path, params)
+            yield json_response
+
+            # responses without a next cursor (e.g. of groups) end pagination
+            params['cursor'] = json_response['meta'].get('next_cursor')
+            page += 1
+            if self.cursor_index is not None:
+                self.cursor_index.record(path, params, page, params['cursor'])
+            if checkpoint:
+                checkpoint.advance(params['cursor'], len(json_response['results']))
+
+    async def __do_indexed_paging(self, path: str, params: dict, pages: List[int]):
+        """ Use basic pagination for the first 10,000 results and cursor pagination,
+        starting from the closest known cursor, for the pages beyond. """
+        max_pages = self.PAGING_RESULTS_MAX / params['per_page']
+        for page in pages:
+            if 0 < page <= max_pages:
+                yield await self.get(path, {**params, 'page': page})
+            elif page > max_pages:
+                json_response = await self.__get_deep_page(path, params, page)
+                # pages beyond the last page of the list are skipped
+                if json_response is not None:
+                    yield json_response
+
+    async def __get_deep_page(self, path: str, params: dict, page: int) -> Optional[dict]:
+        """ Walk from the closest page with a known cursor to `page` by cursor pagination,
+        recording the cursor of every page on the way. """
+        known_page, cursor = self.cursor_index.nearest(path, params, page)
+        params = dict(params)
+        while cursor is not None:
+            params['cursor'] = cursor
+            json_response = await self.get(path, params)
+            cursor = json_response['meta'].get('next_cursor')
+            self.cursor_index.record(path, params, known_page + 1, cursor)
+            if known_page == page:
+                # copy the response, it may be shared with the cache
+                return {**json_response, 'meta': {**json_response['meta'], 'page': page}}
+            known_page += 1
+        return None
@@ -0,0 +1,76 @@
+"""This module wraps the OpenAlex API for use with asyncio."""
+from typing import Optional, List
+
+from diophila.async_api_caller import AsyncAPICaller
+from diophila.cache import _BaseCache
+from diophila.cursor_index import _BaseCursorIndex
+from diophila.metrics import RequestHook
+from diophila.rate_limiter import RateLimiter
+from diophila.openalex import OpenAlex
+
+
+class AsyncOpenAlex(OpenAlex):
+    """This class wraps the OpenAlex API for use with asyncio.
+
+    It offers the same methods as `OpenAlex`, but every `get_random_<entity>`,
+    `get_single_<entity>` and `get_groups_of_<entities>` method returns a coroutine
+    and every `get_list_of_<entities>` method returns an async generator:
+
+        async with AsyncOpenAlex() as openalex:
+            work = await openalex.get_single_work("W2741809807")
+            async for page in openalex.get_list_of_works(filters):
+                ...
+    """
+
+    def __init__(self, email: Optional[str] = None,
+                 max_concurrency: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 cache: Optional[_BaseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 hooks: Optional[List[RequestHook]] = None,
+                 cursor_index: Optional[_BaseCursorIndex] = None) -> object:
+        """ Init async wrapper, preferably with an email to get into the polite pool.
+
+        Args:
+            email (Optional[str]): email address of the user that will be added
+                        in the request header to get into the polite pool, optional.
+            max_concurrency (int): maximum number of requests in flight at the same time.
+            pool_maxsize (int): maximum number of connections kept alive per host.
+            keep_alive (bool): reuse connections between requests, defaults to True.
+            cache (Optional[_BaseCache]): cache for responses e.g. a ResponseCache
+                        or SQLiteCache, optional.
+                        Random entities are never cached.
+            rate_limiter (Optional[RateLimiter]): limiter pacing the requests to stay within
+                        the rate limits of the API, optional. Can be shared between clients.
+            hooks (Optional[List[RequestHook]]): hooks called at the start and end of every
+                        request e.g. a MetricsCollector, optional.
+            cursor_index (Optional[_BaseCursorIndex]): index recording the cursors of
+                        the pages of lists e.g. a CursorIndex or SQLiteCursorIndex, optional.
+                        Allows requesting pages beyond the first 10,000 results.
+
+        Returns:
+            object wrapping the OpenAlex API.
+        """
+        # pylint: disable=super-init-not-called
+        self._api_caller = AsyncAPICaller("https://api.openalex.org", email,
+                                          max_concurrency=max_concurrency,
+                                          pool_maxsize=pool_maxsize,
+                                          keep_alive=keep_alive,
+                                          cache=cache,
+                                          rate_limiter=rate_limiter,
+                                          hooks=hooks,
+                                          cursor_index=cursor_index)
+
+    async def close(self) -> None:
+        """ Close all pooled connections to the API."""
+        await self._api_caller.close()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' together with AsyncOpenAlex.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
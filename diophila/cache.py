@@ -0,0 +1,255 @@
+"""This module caches responses of the OpenAlex API."""
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional, Dict
+from urllib.parse import urlencode
+
+
+def make_cache_key(path: str, params: Optional[dict] = None) -> str:
+    """ Build a canonical key for a request, so that equivalent queries share a key.
+
+    Empty parameters are dropped, parameters are sorted by name and the
+    (AND-combined) items of the 'filter' parameter are sorted as well.
+    The order of 'sort' items is kept as it determines the sort priority.
+
+    Args:
+        path (str): path that will be concatenated to the base URL of the OpenAlex API.
+        params (Optional[dict]): dictionary containing the query parameters, optional.
+
+    Returns:
+        str uniquely identifying the request.
+    """
+    params = {k: v for k, v in (params or {}).items() if v is not None}
+    if params.get('filter'):
+        params['filter'] = ",".join(sorted(str(params['filter']).split(",")))
+    query_string = urlencode(sorted(params.items()))
+    return f"{path}?{query_string}" if query_string else path
+
+
+class _BaseCache:
+    """Base class for response caches."""
+
+    def __init__(self, ttl: Optional[float] = None, ttls: Optional[Dict[str, float]] = None):
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @staticmethod
+    def is_cacheable(path: str) -> bool:
+        """ Random entities are different on every request and must never be cached."""
+        return not path.endswith("/random")
+
+    def _ttl_for(self, path: str) -> Optional[float]:
+        """Helper method looking up the time to live for responses of an endpoint."""
+        # paths of API URLs may carry a query string e.g. 'works?filter=...'
+        return self.ttls.get(path.split("?", 1)[0].split("/", 1)[0], self.ttl)
+
+    def get(self, path: str, params: Optional[dict] = None):
+        """ Get a cached response, or None if there is no valid one."""
+        raise NotImplementedError
+
+    def set(self, path: str, params: Optional[dict], value,
+            size: int = 0, validators: Optional[dict] = None) -> None:
+        """ Cache a response of `size` bytes, together with the 'ETag' and 'Last-Modified'
+        response headers in `validators` used to revalidate it once it expired."""
+        raise NotImplementedError
+
+    def validators(self, path: str, params: Optional[dict] = None) -> dict:
+        """ Get headers for a conditional request revalidating an expired response."""
+        # pylint: disable=unused-argument
+        return {}
+
+    def revalidate(self, path: str, params: Optional[dict] = None):
+        """ Mark an expired response as valid again after the API answered
+        a conditional request with '304 Not Modified' and return it."""
+        # pylint: disable=unused-argument
+        return None
+
+
+class ResponseCache(_BaseCache):
+    """In-memory LRU cache for responses of the OpenAlex API.
+
+    Responses are kept until they expire or until the cache exceeds `max_entries`
+    or `max_bytes`, in which case the least recently used responses are evicted.
+    Cached responses are shared between callers and should be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 1024,
+                 max_bytes: Optional[int] = None,
+                 ttl: Optional[float] = None,
+                 ttls: Optional[Dict[str, float]] = None) -> object:
+        """ Init cache.
+
+        Args:
+            max_entries (int): maximum number of cached responses.
+            max_bytes (Optional[int]): maximum total size of the cached response bodies
+                        in bytes, optional.
+            ttl (Optional[float]): number of seconds a response stays valid, optional.
+                        If empty, responses don't expire.
+            ttls (Optional[Dict[str, float]]): number of seconds a response stays valid
+                        per endpoint name e.g. {"works": 3600}, overriding `ttl`, optional.
+        """
+        super().__init__(ttl, ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str, params: Optional[dict] = None):
+        """ Get a cached response, or None if there is no valid one."""
+        key = make_cache_key(path, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[2] is None or entry[2] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:  # expired
+                self.__remove(key)
+            self.misses += 1
+            return None
+
+    def set(self, path: str, params: Optional[dict], value,
+            size: int = 0, validators: Optional[dict] = None) -> None:
+        """ Cache a response of `size` bytes. Expired responses are dropped,
+        so `validators` are not needed."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # would evict everything else and still not fit
+
+        key = make_cache_key(path, params)
+        ttl = self._ttl_for(path)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self.__remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self.size += size
+            while (len(self._entries) > self.max_entries
+                   or (self.max_bytes is not None and self.size > self.max_bytes)):
+                self.__remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """ Remove all cached responses and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.size = self.hits = self.misses = 0
+
+    def __remove(self, key: str) -> None:
+        """Helper method removing an entry, needs to be called holding the lock."""
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+
+class SQLiteCache(_BaseCache):
+    """Persistent cache for responses of the OpenAlex API, stored in a SQLite database.
+
+    Response bodies are stored compressed. Expired responses are kept, so they can be
+    revalidated with a conditional request ('If-None-Match' / 'If-Modified-Since')
+    instead of downloading them again if the API reports them as unchanged.
+    """
+
+    def __init__(self, filename: str,
+                 ttl: Optional[float] = 86400,
+                 ttls: Optional[Dict[str, float]] = None,
+                 compress_level: int = 6) -> object:
+        """ Init cache, creating the database if it doesn't exist yet.
+
+        Args:
+            filename (str): path to the SQLite database file.
+            ttl (Optional[float]): number of seconds a response stays valid before it
+                        needs to be revalidated, defaults to one day.
+                        If empty, responses don't expire.
+            ttls (Optional[Dict[str, float]]): number of seconds a response stays valid
+                        per endpoint name e.g. {"works": 3600}, overriding `ttl`, optional.
+            compress_level (int): zlib compression level of the stored bodies, in [0;9].
+        """
+        super().__init__(ttl, ttls)
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS responses ("
+                                     "key TEXT PRIMARY KEY, body BLOB, expires_at REAL, "
+                                     "etag TEXT, last_modified TEXT)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, path: str, params: Optional[dict] = None):
+        """ Get a cached response, or None if there is no valid one."""
+        row = self.__select(path, params, "body, expires_at")
+        if row is not None and (row[1] is None or row[1] > time.time()):
+            self.hits += 1
+            return json.loads(zlib.decompress(row[0]))
+        self.misses += 1
+        return None
+
+    def set(self, path: str, params: Optional[dict], value,
+            size: int = 0, validators: Optional[dict] = None) -> None:
+        """ Cache a response, together with the 'ETag' and 'Last-Modified'
+        response headers in `validators` used to revalidate it once it expired."""
+        validators = validators or {}
+        body = zlib.compress(json.dumps(value, separators=(",", ":")).encode(),
+                             self.compress_level)
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                                     (make_cache_key(path, params), body,
+                                      self.__expires_at(path),
+                                      validators.get('etag'), validators.get('last_modified')))
+
+    def validators(self, path: str, params: Optional[dict] = None) -> dict:
+        """ Get headers for a conditional request revalidating an expired response."""
+        row = self.__select(path, params, "etag, last_modified")
+        headers = {}
+        if row is not None and row[0]:
+            headers['If-None-Match'] = row[0]
+        if row is not None and row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def revalidate(self, path: str, params: Optional[dict] = None):
+        """ Mark an expired response as valid again after the API answered
+        a conditional request with '304 Not Modified' and return it."""
+        key = make_cache_key(path, params)
+        with self._lock, self._connection:
+            self._connection.execute("UPDATE responses SET expires_at = ? WHERE key = ?",
+                                     (self.__expires_at(path), key))
+        row = self.__select(path, params, "body")
+        if row is None:
+            return None
+        self.revalidations += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def clear(self) -> None:
+        """ Remove all cached responses and reset the counters."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+        self.hits = self.misses = self.revalidations = 0
+
+    def close(self) -> None:
+        """ Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __select(self, path: str, params: Optional[dict], columns: str):
+        """Helper method selecting columns of the entry cached for a request."""
+        with self._lock:
+            return self._connection.execute(f"SELECT {columns} FROM responses WHERE key = ?",
+                                            (make_cache_key(path, params),)).fetchone()
+
+    def __expires_at(self, path: str) -> Optional[float]:
+        """Helper method calculating when a response that is stored now expires."""
+        ttl = self._ttl_for(path)
+        return time.time() + ttl if ttl is not None else None
@@ -0,0 +1,102 @@
+"""This module saves the progress of cursor paginated harvests, so they can be resumed."""
+import json
+import os
+from typing import Optional, Iterator
+
+from diophila.cache import make_cache_key
+
+
+class Checkpoint:
+    """Progress of a cursor paginated harvest, saved to a file after every page.
+
+    The file holds a fingerprint of the query, the cursor of the next page and
+    the number of pages and entities emitted so far. It is replaced atomically,
+    so a crash never leaves a partially written checkpoint behind.
+    A page counts as emitted once the consumer asks for the next one, hence
+    after resuming, at most the page that was processed during the crash is emitted again.
+    """
+
+    def __init__(self, filename: str, path: str, params: dict, resume: bool = False):
+        """ Init checkpoint for a query.
+
+        Args:
+            filename (str): path to the file the progress is saved in.
+            path (str): path of the query.
+            params (dict): parameters of the query, 'cursor' and 'page' are ignored.
+            resume (bool): continue from the progress saved in `filename` (if it exists),
+                        instead of starting from the first page. Defaults to False.
+
+        Raises:
+            ValueError: if the progress saved in `filename` belongs to a different query.
+        """
+        self.filename = filename
+        self.fingerprint = make_cache_key(path, {k: v for k, v in params.items()
+                                                 if k not in ('cursor', 'page')})
+        self.cursor: Optional[str] = "*"
+        self.pages = 0
+        self.entities = 0
+        if resume and os.path.exists(filename):
+            self.__load()
+
+    @property
+    def done(self) -> bool:
+        """ Whether all pages have been emitted."""
+        return self.cursor is None
+
+    def advance(self, next_cursor: Optional[str], entities: int) -> None:
+        """ Record that a page was emitted and save the progress.
+
+        Args:
+            next_cursor (Optional[str]): cursor of the next page, None after the last page.
+            entities (int): number of entities on the emitted page.
+        """
+        self.cursor = next_cursor
+        self.pages += 1
+        self.entities += entities
+        self.__save()
+
+    def __load(self) -> None:
+        """Helper method loading the progress from the checkpoint file."""
+        with open(self.filename, encoding="utf-8") as checkpoint_file:
+            state = json.load(checkpoint_file)
+        if state.get('fingerprint') != self.fingerprint:
+            raise ValueError(f"Checkpoint {self.filename} belongs to a different query: "
+                             f"{state.get('fingerprint')}")
+        self.cursor = state['cursor']
+        self.pages = state['pages']
+        self.entities = state['entities']
+
+    def __save(self) -> None:
+        """Helper method atomically writing the progress to the checkpoint file."""
+        tmp_file = f"{self.filename}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as checkpoint_file:
+            json.dump({'fingerprint': self.fingerprint,
+                       'cursor': self.cursor,
+                       'pages': self.pages,
+                       'entities': self.entities}, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(tmp_file, self.filename)
+
+
+class CheckpointedItems:
+    """Pages (or entities) of a harvest whose progress is saved to a `Checkpoint`.
+
+    The checkpoint of an item is only advanced when the consumer asks for the next one,
+    i.e. after it handled the item. Consumers fetching items ahead in the background
+    (e.g. `prefetch`) would advance it too early, so they iterate these items directly.
+    """
+
+    def __init__(self, items: Iterator[dict], checkpoint: Checkpoint):
+        self.items = items
+        self.checkpoint = checkpoint
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> dict:
+        return next(self.items)
+
+    def close(self) -> None:
+        """ Stop the harvest, the progress saved so far is kept."""
+        self.items.close()
@@ -0,0 +1,205 @@
+"""This module crawls the citation graph of works of the OpenAlex API."""
+from array import array
+from typing import Optional, List, Iterable, Dict, Set, Tuple
+
+from diophila.endpoints import Works
+from diophila.prefetch import merge
+
+
+def _short_id(openalex_id: str) -> str:
+    """Helper function reducing an OpenAlex ID to its short form e.g. 'W2741809807'."""
+    return str(openalex_id).rsplit("/", 1)[-1].upper()
+
+
+class CitationGraph:
+    """Citation graph of works in compressed sparse row (CSR) format.
+
+    Works are numbered from 0 to `num_nodes` - 1 in `nodes`. The works referenced
+    by node `i` are `indices[indptr[i]:indptr[i + 1]]`, so edges point from
+    the citing work to the cited work.
+    """
+
+    def __init__(self, nodes: List[str], indptr: array, indices: array):
+        self.nodes = nodes
+        self.indptr = indptr
+        self.indices = indices
+        self._index = None
+
+    @classmethod
+    def from_edges(cls, nodes: List[str], edges: Iterable[Tuple[int, int]]) -> "CitationGraph":
+        """ Build a graph from (citing node, cited node) pairs.
+
+        Args:
+            nodes (List[str]): OpenAlex IDs of the works, numbered by their position.
+            edges (Iterable[Tuple[int, int]]): pairs of node numbers.
+
+        Returns:
+            CitationGraph containing the edges.
+        """
+        edges = sorted(edges)
+        indptr = array("q", [0] * (len(nodes) + 1))
+        for source, _ in edges:
+            indptr[source + 1] += 1
+        for node in range(len(nodes)):
+            indptr[node + 1] += indptr[node]
+        indices = array("q", (target for _, target in edges))
+        return cls(nodes, indptr, indices)
+
+    @property
+    def num_nodes(self) -> int:
+        """ Number of works in the graph."""
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        """ Number of citations in the graph."""
+        return len(self.indices)
+
+    def index(self, openalex_id: str) -> int:
+        """ Get the node number of a work.
+
+        Raises:
+            KeyError: if the work is not part of the graph.
+        """
+        if self._index is None:
+            self._index = {node: number for number, node in enumerate(self.nodes)}
+        return self._index[_short_id(openalex_id)]
+
+    def references(self, node: int) -> array:
+        """ Get the node numbers of the works cited by `node`."""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def edge_arrays(self) -> Tuple[array, array]:
+        """ Get all edges as two arrays of citing and cited node numbers."""
+        sources = array("q")
+        for node in range(self.num_nodes):
+            sources.extend([node] * (self.indptr[node + 1] - self.indptr[node]))
+        return sources, array("q", self.indices)
+
+    def transpose(self) -> "CitationGraph":
+        """ Get the graph with reversed edges, listing the works citing each node."""
+        sources, targets = self.edge_arrays()
+        return CitationGraph.from_edges(self.nodes, zip(targets, sources))
+
+
+class CitationCrawler:
+    """Expands seed works along their references and citations."""
+
+    # fields needed to expand a work
+    SELECT = ["id", "ids", "referenced_works"]
+    DIRECTIONS = ("references", "cited_by", "both")
+
+    def __init__(self, api_caller, workers: int = 4):
+        """ Init crawler.
+
+        Args:
+            api_caller: (synchronous) API caller used to send the requests.
+            workers (int): number of requests sent concurrently.
+
+        Raises:
+            TypeError: if `api_caller` is asynchronous.
+        """
+        if getattr(api_caller, "is_async", False):
+            raise TypeError("CitationCrawler requires a synchronous API caller.")
+        self.works = Works(api_caller)
+        self.workers = workers
+
+    def crawl(self, seed_ids: Iterable[str],
+              depth: int = 1,
+              direction: str = "both",
+              max_nodes: Optional[int] = None) -> CitationGraph:
+        """ Crawl the citation graph around the seed works, level by level.
+
+        Every level looks up the works referenced by the current frontier in batches
+        of OR-filters (`get_many`) and pages through the works citing it
+        (`cites` filter), each work is only expanded once.
+
+        Args:
+            seed_ids (Iterable[str]): OpenAlex IDs of the works to start from.
+            depth (int): number of levels to expand, defaults to 1.
+            direction (str): 'references', 'cited_by' or 'both', defaults to 'both'.
+            max_nodes (Optional[int]): maximum number of works in the graph, optional.
+                Once reached, no more works are added and no more pages of citing works
+                are requested, so citations between works found by then may be missing.
+
+        Returns:
+            CitationGraph of all works found and the citations between them.
+
+        Raises:
+            ValueError: if `direction` is not valid.
+        """
+        if direction not in self.DIRECTIONS:
+            raise ValueError(f"Value for 'direction' not valid. Valid values are {self.DIRECTIONS}")
+        nodes: List[str] = []
+        index: Dict[str, int] = {}
+        edges: Set[Tuple[int, int]] = set()
+
+        def is_full() -> bool:
+            """Check whether the graph holds `max_nodes` works."""
+            return bool(max_nodes) and len(nodes) >= max_nodes
+
+        def add(openalex_id: str) -> bool:
+            """Add a work, returning whether it is new."""
+            if openalex_id in index or is_full():
+                return False
+            index[openalex_id] = len(nodes)
+            nodes.append(openalex_id)
+            return True
+
+        frontier = [openalex_id for openalex_id in map(_short_id, seed_ids) if add(openalex_id)]
+        for _ in range(depth):
+            if not frontier:
+                break
+            new_nodes = []
+            if direction in ("references", "both"):
+                new_nodes += self.__expand_references(frontier, index, edges, add)
+            if direction in ("cited_by", "both"):
+                new_nodes += self.__expand_citations(frontier, index, edges, add, is_full)
+            frontier = new_nodes
+        return CitationGraph.from_edges(nodes, edges)
+
+    def __expand_references(self, frontier: List[str], index: Dict[str, int],
+                            edges: Set[Tuple[int, int]], add) -> List[str]:
+        """ Add the works referenced by the frontier, returning the new ones."""
+        new_nodes = []
+        found = self.works.get_many(frontier, workers=self.workers, select=self.SELECT)
+        for openalex_id, work in found.items():
+            if work is None:
+                continue
+            for reference in map(_short_id, work.get('referenced_works') or []):
+                if add(reference):
+                    new_nodes.append(reference)
+                if reference in index:
+                    edges.add((index[openalex_id], index[reference]))
+        return new_nodes
+
+    def __expand_citations(self, frontier: List[str], index: Dict[str, int],
+                           edges: Set[Tuple[int, int]], add, is_full) -> List[str]:
+        """ Add the works citing the frontier, returning the new ones.
+        Stops requesting pages once the graph is full."""
+        new_nodes = []
+        if is_full():
+            return new_nodes
+        batch_size = self.works.OR_VALUES_MAX
+        lists = (self.works.get_list(filters={'cites': "|".join(frontier[i:i + batch_size])},
+                                     per_page=self.works.api_caller.PER_PAGE_MAX,
+                                     select=self.SELECT)
+                 for i in range(0, len(frontier), batch_size))
+        pages = merge(lists, self.workers)
+        try:
+            for page in pages:
+                for work in page['results']:
+                    citing = _short_id(work['id'])
+                    if add(citing):
+                        new_nodes.append(citing)
+                    if citing not in index:
+                        continue
+                    for reference in map(_short_id, work.get('referenced_works') or []):
+                        if reference in index:
+                            edges.add((index[citing], index[reference]))
+                # once the graph is full, further pages could only add edges, not works
+                if is_full():
+                    break
+        finally:
+            pages.close()
+        return new_nodes
@@ -0,0 +1,127 @@
+"""This module records the cursors of the pages of lists, to jump to pages beyond basic paging."""
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from diophila.cache import make_cache_key
+
+
+def query_fingerprint(path: str, params: Optional[dict] = None) -> str:
+    """ Build a key identifying a list independent of the page requested.
+
+    Args:
+        path (str): path of the query.
+        params (Optional[dict]): parameters of the query, 'cursor' and 'page' are ignored.
+            'per_page' is kept, as the pages of a list depend on it.
+
+    Returns:
+        str uniquely identifying the list.
+    """
+    return make_cache_key(path, {key: value for key, value in (params or {}).items()
+                                 if key not in ('cursor', 'page')})
+
+
+class _BaseCursorIndex:
+    """Base class for cursor indexes, mapping the page numbers of lists to their cursors.
+
+    The cursor of page 1 is always '*'. A page recorded with the cursor None
+    is known to be beyond the last page of the list.
+    """
+
+    def nearest(self, path: str, params: dict, page: int) -> Tuple[int, Optional[str]]:
+        """ Find the known page closest to (but not after) `page`.
+
+        Args:
+            path (str): path of the query.
+            params (dict): parameters of the query including 'per_page'.
+            page (int): page number looked for.
+
+        Returns:
+            tuple of the page number and its cursor, (1, '*') if no page is known.
+        """
+        raise NotImplementedError
+
+    def record(self, path: str, params: dict, page: int, cursor: Optional[str]) -> None:
+        """ Record the cursor of a page, None if the page is beyond the last page."""
+        raise NotImplementedError
+
+
+class CursorIndex(_BaseCursorIndex):
+    """In-memory cursor index, keeping the cursors of the `max_lists` most recently used lists."""
+
+    def __init__(self, max_lists: int = 128):
+        """ Init cursor index.
+
+        Args:
+            max_lists (int): maximum number of lists whose cursors are kept,
+                        the least recently used lists are evicted first.
+        """
+        self.max_lists = max_lists
+        self._lock = threading.Lock()
+        # cursors of the pages 1, 2, ... of every list, walked consecutively
+        self._cursors: "OrderedDict[str, list]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def nearest(self, path: str, params: dict, page: int) -> Tuple[int, Optional[str]]:
+        fingerprint = query_fingerprint(path, params)
+        with self._lock:
+            cursors = self._cursors.get(fingerprint)
+            if not cursors:
+                return 1, "*"
+            self._cursors.move_to_end(fingerprint)
+            known_page = min(page, len(cursors))
+            return known_page, cursors[known_page - 1]
+
+    def record(self, path: str, params: dict, page: int, cursor: Optional[str]) -> None:
+        fingerprint = query_fingerprint(path, params)
+        with self._lock:
+            cursors = self._cursors.setdefault(fingerprint, ["*"])
+            self._cursors.move_to_end(fingerprint)
+            # pages are walked consecutively, so only the next unknown page can be recorded
+            if page == len(cursors) + 1:
+                cursors.append(cursor)
+            while len(self._cursors) > self.max_lists:
+                self._cursors.popitem(last=False)
+
+
+class SQLiteCursorIndex(_BaseCursorIndex):
+    """Persistent cursor index, stored in a SQLite database, so that cursors
+    survive restarts and can be shared between processes."""
+
+    def __init__(self, filename: str):
+        """ Init cursor index, creating the database if it doesn't exist yet.
+
+        Args:
+            filename (str): path to the SQLite database file.
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS cursors ("
+                                     "fingerprint TEXT, page INTEGER, cursor TEXT, "
+                                     "PRIMARY KEY (fingerprint, page))")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(DISTINCT fingerprint) FROM cursors").fetchone()[0]
+
+    def nearest(self, path: str, params: dict, page: int) -> Tuple[int, Optional[str]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT page, cursor FROM cursors WHERE fingerprint = ? AND page <= ? "
+                "ORDER BY page DESC LIMIT 1", (query_fingerprint(path, params), page)).fetchone()
+        return (row[0], row[1]) if row is not None else (1, "*")
+
+    def record(self, path: str, params: dict, page: int, cursor: Optional[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)",
+                                     (query_fingerprint(path, params), page, cursor))
+
+    def close(self) -> None:
+        """ Close the database connection."""
+        self._connection.close()
@@ -1,5 +1,11 @@
 """This module wraps all endpoints of the OpenAlex API and their parameters."""
-from typing import Optional, List, Iterable
+import asyncio
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Iterable, Dict, Tuple
+
+from diophila.prefetch import merge, amerge
 
 
 class _Endpoint:
@@ -10,10 +16,12 @@ class _Endpoint:
     id_attrs: tuple = ()
     filter_attrs: tuple = ()
     groupable_attrs: tuple = ()
+    selectable_attrs: tuple = ()
 
     # make sure every endpoint includes required parameters and overwrites empty values
     def __init_subclass__(cls,
-                          required=('name', 'id_attrs', 'filter_attrs', 'groupable_attrs'),
+                          required=('name', 'id_attrs', 'filter_attrs', 'groupable_attrs',
+                                    'selectable_attrs'),
                           **kwargs):
         """ Helper method making sure that the required class variables
          are present (overwritten) in every subclass."""
@@ -21,6 +29,10 @@ class _Endpoint:
             if not getattr(cls, req):
                 raise TypeError(f"Can't instantiate subclass {cls.__name__}"
                                 f" without {req} attribute defined")
+        # sets of the attributes, so that validating parameters doesn't scan tuples
+        cls.filter_keys = frozenset(cls.filter_attrs)
+        cls.groupable_keys = frozenset(cls.groupable_attrs)
+        cls.selectable_keys = frozenset(cls.selectable_attrs)
         return super().__init_subclass__(**kwargs)
 
     # Attributes that can be used to sort entities,
@@ -35,8 +47,29 @@ class _Endpoint:
     # Attributes that can be used to sort entities when using group_by,
     # see https://docs.openalex.org/api/get-groups-of-entities#sorting-groups
     sortable_attrs_for_groups = ("count", "key")
+    # Fields of a group that can be selected,
+    # see https://docs.openalex.org/api/get-groups-of-entities
+    selectable_attrs_for_groups = ("count", "key", "key_display_name")
     # sort directions
     sortable_drctns = ("asc", "desc")
+    sortable_keys = frozenset(sortable_attrs)
+    sortable_keys_for_groups = frozenset(sortable_attrs_for_groups)
+    selectable_keys_for_groups = frozenset(selectable_attrs_for_groups)
+    sortable_drctns_keys = frozenset(sortable_drctns)
+
+    # ID types that can be looked up in batches, mapped to the filter attribute used to do so
+    id_filter_attrs: dict = {}
+    # Maximum number of values that can be combined with OR ('|') in a single filter,
+    # see https://docs.openalex.org/api/get-lists-of-entities/filter-entity-lists
+    OR_VALUES_MAX = 50
+    # Number of shards a sharded list is split into per worker, so that workers
+    # finishing early can pick up more shards
+    SHARDS_PER_WORKER = 4
+    # Maximum size of a single sample, see
+    # https://docs.openalex.org/api/get-lists-of-entities/sample-entity-lists
+    SAMPLE_MAX = 10000
+    # Number of minimal count requests `count_many` sends concurrently by default
+    COUNT_WORKERS = 4
 
     # --------------------------------------------------------------------------
     # ----------------------------- QUERY  METHODS -----------------------------
@@ -50,7 +83,9 @@ class _Endpoint:
         return self.api_caller.get(random_path)
 
     # Get single entity: By ID
-    def get_single(self, id_value: str, id_type: Optional[str] = None) -> dict:
+    def get_single(self, id_value: str,
+                   id_type: Optional[str] = None,
+                   select: Optional[List[str]] = None) -> dict:
         """ Get a specific entity by using one of its IDs.
 
         Args:
@@ -59,6 +94,8 @@ class _Endpoint:
                         Will be used as a namespace for the `id_value`.
                         `id_type` can be left out if `id_value` is a supported external ID
                          (URL) or OpenAlex ID.
+            select (Optional[List[str]]): fields of the entity to return, optional.
+                        If empty, all fields are returned.
 
         Returns:
             dict from JSON describing the entity.
@@ -67,29 +104,266 @@ class _Endpoint:
             ValueError: if `id_value` is empty or None.
                         if 'id_type' is not specified in the list of IDs for this endpoint.
                         if 'id_type' is empty or None and id_value is not a URL or OpenAlex ID.
+                        if `select` contains fields that are not selectable for this endpoint.
         """
         if not id_value:
             raise ValueError("'id_value' argument can not be empty")  # fail fast
+        params = {'select': self._build_select_param(select, self.selectable_attrs,
+                                                       self.selectable_keys)}
 
         # if user specified the id_type, use it as namespace in front of the id_value
         if id_type and id_type in self.id_attrs:
             single_path = f'{self.name}/{id_type}:{id_value}'
-            return self.api_caller.get(single_path)
+            return self.api_caller.get(single_path, params)
 
         # id_type can only be left out if id_value is a URL
         # or OpenAlex ID (starting with endpoint name's first letter)
         if not id_type and id_value.lower().startswith((self.name[0], "http")):
             single_path = f'{self.name}/{id_value}'
-            return self.api_caller.get(single_path)
+            return self.api_caller.get(single_path, params)
 
         raise ValueError(f"'id_type' is not valid. Valid values are {self.id_attrs}" if id_type
                          else "'id_value' not valid. Needs to be a URL or OpenAlex ID.")
 
+    # Get many entities: By ID
+    def get_many(self, id_values: Iterable[str],
+                 id_type: str = "openalex",
+                 workers: Optional[int] = None,
+                 select: Optional[List[str]] = None) -> Dict[str, Optional[dict]]:
+        """ Get many entities by using one of their IDs.
+
+        The IDs are combined into OR-filters, so that every request fetches
+        up to `OR_VALUES_MAX` entities at once.
+
+        Args:
+            id_values (Iterable[str]): values of IDs identifying the entities.
+            id_type (str): type of the specified `id_values` e.g. 'openalex', 'doi'.
+                        Defaults to 'openalex'.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                        The 'id' and 'ids' fields are always included, as they are needed
+                        to match entities to IDs. If empty, all fields are returned.
+
+        Returns:
+            dict mapping each of the `id_values` to the dict from JSON describing the entity,
+            or to None if no entity was found for this ID.
+
+        Raises:
+            ValueError: if 'id_type' can not be used to look up many entities at once.
+                        if `select` contains fields that are not selectable for this endpoint.
+        """
+        if id_type not in self.id_filter_attrs:
+            raise ValueError("'id_type' is not valid for getting many entities. "
+                             f"Valid values are {tuple(self.id_filter_attrs)}")
+        if select:
+            select = list(dict.fromkeys([*select, "id", "ids"]))
+        select_param = self._build_select_param(select, self.selectable_attrs, self.selectable_keys)
+
+        batches = self.__build_id_batches(id_values)
+        if getattr(self.api_caller, "is_async", False):
+            return self.__get_many_async(batches, id_type, select_param)
+
+        def fetch(batch):
+            params = self.__build_id_batch_params(batch, id_type, select_param)
+            # a batch fits on a single page, cursor paging would request an empty page more
+            pages = self.api_caller.get_all(self.name, params, self.api_caller.PER_PAGE_MAX, [1])
+            entities = [entity for page in pages for entity in page['results']]
+            return self.__match_ids(batch, id_type, entities)
+
+        if workers and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                matches = list(executor.map(fetch, batches))
+        else:
+            matches = [fetch(batch) for batch in batches]
+        return {id_value: entity for match in matches for id_value, entity in match.items()}
+
+    async def __get_many_async(self, batches: List[List[str]], id_type: str,
+                               select_param: Optional[str]):
+        """ Async counterpart of `get_many`, used with an async API caller."""
+        async def fetch(batch):
+            params = self.__build_id_batch_params(batch, id_type, select_param)
+            pages = self.api_caller.get_all(self.name, params, self.api_caller.PER_PAGE_MAX, [1])
+            entities = [entity async for page in pages for entity in page['results']]
+            return self.__match_ids(batch, id_type, entities)
+
+        matches = await asyncio.gather(*(fetch(batch) for batch in batches))
+        return {id_value: entity for match in matches for id_value, entity in match.items()}
+
+    # Count entities
+    def count(self, filters: Optional[dict] = None, search: Optional[str] = None) -> int:
+        """ Count the entities of a list, requesting only a single ID instead of a whole page.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            int number of entities in the list.
+
+        Raises:
+            ValueError: if `filters` contains keys that are not valid filter attributes
+                        for this endpoint.
+        """
+        return self._count(self.__build_list_params(filters, search, None))
+
+    def _count(self, params: dict) -> int:
+        """ Count the entities of a list, using validated parameters e.g. compiled by a `Query`.
+
+        Args:
+            params (dict): query parameters, only 'filter' and 'search' are used.
+
+        Returns:
+            int number of entities in the list.
+        """
+        response = self.api_caller.get(self.name, self.__build_count_params(params))
+        if getattr(self.api_caller, "is_async", False):
+            return self.__count_async(response)
+        return response['meta']['count']
+
+    @staticmethod
+    async def __count_async(response) -> int:
+        """ Async counterpart of `_count`, used with an async API caller."""
+        return (await response)['meta']['count']
+
+    def count_many(self, filters: Iterable[Optional[dict]],
+                   search: Optional[str] = None,
+                   workers: Optional[int] = None) -> List[int]:
+        """ Count the entities of many lists, e.g. for many combinations of filters.
+
+        Every distinct list is counted once by a minimal request, only the counts are kept.
+        Counts are cached by the cache of the API caller (if any), like any other response.
+
+        Args:
+            filters (Iterable[Optional[dict]]): dictionaries with properties to filter results,
+                one per list.
+            search (Optional[str]): search string used for all lists, optional.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+                Defaults to `COUNT_WORKERS`.
+
+        Returns:
+            list of the numbers of entities, in the order of `filters`.
+
+        Raises:
+            ValueError: if one of the `filters` contains keys that are not valid
+                        filter attributes for this endpoint.
+        """
+        keys = [tuple(self.__build_count_params(self.__build_list_params(f, search, None)).items())
+                for f in filters]
+        unique_keys = list(dict.fromkeys(keys))
+        if getattr(self.api_caller, "is_async", False):
+            return self.__count_many_async(keys, unique_keys)
+
+        def fetch(key):
+            return self.api_caller.get(self.name, dict(key))['meta']['count']
+
+        workers = workers or self.COUNT_WORKERS
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                counts = dict(zip(unique_keys, executor.map(fetch, unique_keys)))
+        else:
+            counts = {key: fetch(key) for key in unique_keys}
+        return [counts[key] for key in keys]
+
+    async def __count_many_async(self, keys: List[tuple], unique_keys: List[tuple]) -> List[int]:
+        """ Async counterpart of `count_many`, used with an async API caller."""
+        async def fetch(key):
+            return (await self.api_caller.get(self.name, dict(key)))['meta']['count']
+
+        counts = dict(zip(unique_keys, await asyncio.gather(*(fetch(key) for key in unique_keys))))
+        return [counts[key] for key in keys]
+
+    # Sample entities
+    def sample(self, n: int,
+               seed: Optional[int] = None,
+               filters: Optional[dict] = None,
+               search: Optional[str] = None,
+               select: Optional[List[str]] = None,
+               workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of `n` distinct entities, `per_page=200` entities per request.
+
+        The pages of a sample are fetched by basic paging with the same seed, so that they
+        belong to the same sample. Duplicates the API returns across pages are dropped and
+        replaced by entities of further samples (with the next seeds) until `n` distinct
+        entities are found, or the list has no entities left.
+
+        Args:
+            n (int): number of entities to sample.
+            seed (Optional[int]): seed making the sample reproducible, optional.
+                        If empty, a random seed is used.
+            filters (Optional[dict]): dictionary with properties to filter the entities
+                        sampled from, optional.
+            search (Optional[str]): search string to find the entities sampled from, optional.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                        The 'id' field is always included, as it is needed to drop duplicates.
+                        If empty, all fields are returned.
+            workers (Optional[int]): number of pages fetched concurrently, optional.
+
+        Returns:
+            list of dicts from JSON describing the entities, at most `n`.
+
+        Raises:
+            ValueError: if `n` is not a positive integer.
+                        if `filters` contains keys that are not valid filter attributes
+                        for this endpoint.
+                        if `select` contains fields that are not selectable for this endpoint.
+        """
+        return self._sample(self.__build_list_params(filters, search, None, select),
+                            n, seed, workers)
+
+    def _sample(self, params: dict, n: int,
+                seed: Optional[int] = None,
+                workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of entities, using validated parameters e.g. compiled
+        by a `Query`. See `sample`.
+
+        Args:
+            params (dict): query parameters, only 'filter', 'search' and 'select' are used.
+            n (int): number of entities to sample.
+            seed (Optional[int]): seed making the sample reproducible, optional.
+            workers (Optional[int]): number of pages fetched concurrently, optional.
+
+        Returns:
+            list of dicts from JSON describing the entities, at most `n`.
+        """
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("'n' needs to be a positive integer.")
+        # pages only belong to the same sample if they are requested with the same seed
+        seed = random.randrange(1 << 31) if seed is None else seed
+        if getattr(self.api_caller, "is_async", False):
+            return self.__sample_async(params, n, seed, workers)
+
+        sampled = {}
+        while len(sampled) < n:
+            sample_params, pages = self.__build_sample_params(params, n - len(sampled), seed)
+            responses = self.api_caller.get_all(self.name, sample_params,
+                                                self.api_caller.PER_PAGE_MAX, pages, workers)
+            entities = [entity for page in responses for entity in page['results']]
+            if not self.__add_sampled(sampled, entities):
+                break  # every entity of the list has been sampled
+            seed += 1
+        return list(sampled.values())[:n]
+
+    async def __sample_async(self, params: dict, n: int, seed: int,
+                             workers: Optional[int]) -> List[dict]:
+        """ Async counterpart of `_sample`, used with an async API caller."""
+        sampled = {}
+        while len(sampled) < n:
+            sample_params, pages = self.__build_sample_params(params, n - len(sampled), seed)
+            responses = self.api_caller.get_all(self.name, sample_params,
+                                                self.api_caller.PER_PAGE_MAX, pages, workers)
+            entities = [entity async for page in responses for entity in page['results']]
+            if not self.__add_sampled(sampled, entities):
+                break  # every entity of the list has been sampled
+            seed += 1
+        return list(sampled.values())[:n]
+
     # Get grouped entities: GroupBy
     def get_groups(self, group_by: str,
                    filters: Optional[dict] = None,
                    search: Optional[str] = None,
-                   sort: Optional[dict] = None) -> dict:
+                   sort: Optional[dict] = None,
+                   select: Optional[List[str]] = None) -> dict:
         """ Get entities grouped into facets.
 
         Args:
@@ -102,6 +376,9 @@ class _Endpoint:
              If you only want results matching the exact phrase, enclose it in double quotes.
             sort (Optional[dict]): dictionary with properties to sort the groups of entities
              after grouping them, optional.
+            select (Optional[List[str]]): fields of each group to return
+             i.e. "key", "key_display_name" or "count", optional.
+             The API can't select fields of groups, so they are projected after receiving them.
 
         Returns:
             dict from JSON representing the grouped entities.
@@ -112,6 +389,7 @@ class _Endpoint:
                         or a item.value is not "asc" or "desc".
                         if `filters` contains keys that are not valid filter attributes
                         for this endpoint.
+                        if `select` contains fields that are not fields of a group.
         """
         if not group_by:  # fail fast
             raise ValueError("'group_by' argument can not be empty")
@@ -120,14 +398,174 @@ class _Endpoint:
                   'filter': self.__build_filter_param(filters),
                   'search': search,
                   'sort': self.__build_sort_param_for_groups(sort)}
-        return self.api_caller.get(self.name, params)
+        if select:
+            self._build_select_param(select, self.selectable_attrs_for_groups,
+                                     self.selectable_keys_for_groups)
+        return self._get_groups(params, select)
+
+    def _get_groups(self, params: dict, select: Optional[List[str]] = None) -> dict:
+        """ Get entities grouped into facets, using validated parameters
+        e.g. compiled by a `Query`.
+
+        Args:
+            params (dict): query parameters, containing at least 'group_by'.
+            select (Optional[List[str]]): validated fields of each group to return, optional.
+
+        Returns:
+            dict from JSON representing the grouped entities.
+        """
+        response = self.api_caller.get(self.name, dict(params))
+        if not select:
+            return response
+
+        # the API ignores 'select' when grouping, so project the groups client-side
+        if getattr(self.api_caller, "is_async", False):
+            return self.__project_groups_async(response, select)
+        return self.__project_groups(response, select)
+
+    def get_all_groups(self, group_by: str,
+                       filters: Optional[dict] = None,
+                       search: Optional[str] = None) -> Dict[str, int]:
+        """ Get every group of a facet, paging through the groups with a cursor
+        instead of stopping at the limit of a single response.
+
+        Args:
+            group_by (str): property used to construct groups.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            dict mapping the key of every group to its count.
+
+        Raises:
+            ValueError: if `group_by` is empty or None or not a groupable attribute.
+                        if `filters` contains keys that are not valid filter attributes
+                        for this endpoint.
+        """
+        if not group_by:  # fail fast
+            raise ValueError("'group_by' argument can not be empty")
+        return self._get_all_groups({'group_by': self.__build_group_by_param(group_by),
+                                     'filter': self.__build_filter_param(filters),
+                                     'search': search})
+
+    def _get_all_groups(self, params: dict) -> Dict[str, int]:
+        """ Get every group of a facet, using validated parameters e.g. compiled by a `Query`.
+
+        Args:
+            params (dict): query parameters, containing at least 'group_by'.
+
+        Returns:
+            dict mapping the key of every group to its count.
+        """
+        pages = self.api_caller.get_all(self.name, dict(params), self.api_caller.PER_PAGE_MAX)
+        if getattr(self.api_caller, "is_async", False):
+            return self.__collect_groups_async(pages)
+        counts = {}
+        for page in pages:
+            if not page['group_by']:
+                break
+            counts.update((group['key'], group['count']) for group in page['group_by'])
+        return counts
+
+    @staticmethod
+    async def __collect_groups_async(pages) -> Dict[str, int]:
+        """ Async counterpart of collecting the groups in `_get_all_groups`."""
+        counts = {}
+        async for page in pages:
+            if not page['group_by']:
+                break
+            counts.update((group['key'], group['count']) for group in page['group_by'])
+        return counts
+
+    def get_facets(self, group_by: Iterable[str],
+                   filters: Optional[dict] = None,
+                   search: Optional[str] = None,
+                   workers: Optional[int] = None,
+                   all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of several facets at once, requesting the facets concurrently.
+
+        Args:
+            group_by (Iterable[str]): properties used to construct groups, one per facet.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            workers (Optional[int]): number of facets requested concurrently, optional.
+            all_groups (bool): page through every group of each facet instead of
+             requesting only the first page of groups, defaults to True.
+
+        Returns:
+            dict mapping every property of `group_by` to a dict mapping
+            the key of every group to its count.
+
+        Raises:
+            ValueError: if one of `group_by` is not a groupable attribute.
+                        if `filters` contains keys that are not valid filter attributes
+                        for this endpoint.
+        """
+        filter_param = self.__build_filter_param(filters)
+        params = [{'group_by': self.__build_group_by_param(facet),
+                   'filter': filter_param,
+                   'search': search} for facet in dict.fromkeys(group_by)]
+        return self._get_facets(params, workers, all_groups)
+
+    def _get_facets(self, params: List[dict],
+                    workers: Optional[int] = None,
+                    all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of several facets, using validated parameters
+        e.g. compiled by a `Query`, one dict of parameters per facet."""
+        if getattr(self.api_caller, "is_async", False):
+            return self.__get_facets_async(params, all_groups)
+
+        def fetch(facet_params):
+            if all_groups:
+                return self._get_all_groups(facet_params)
+            response = self._get_groups(facet_params)
+            return {group['key']: group['count'] for group in response['group_by']}
+
+        if workers and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                facets = list(executor.map(fetch, params))
+        else:
+            facets = [fetch(facet_params) for facet_params in params]
+        return {facet_params['group_by']: groups for facet_params, groups in zip(params, facets)}
+
+    async def __get_facets_async(self, params: List[dict],
+                                 all_groups: bool) -> Dict[str, Dict[str, int]]:
+        """ Async counterpart of `_get_facets`, used with an async API caller."""
+        async def fetch(facet_params):
+            if all_groups:
+                return await self._get_all_groups(facet_params)
+            response = await self._get_groups(facet_params)
+            return {group['key']: group['count'] for group in response['group_by']}
+
+        facets = await asyncio.gather(*(fetch(facet_params) for facet_params in params))
+        return {facet_params['group_by']: groups for facet_params, groups in zip(params, facets)}
+
+    @staticmethod
+    def __project_groups(response: dict, select: List[str]) -> dict:
+        """ Keep only the selected fields of every group in a response."""
+        return {**response, 'group_by': [project(group, select)
+                                         for group in response['group_by']]}
+
+    async def __project_groups_async(self, response, select: List[str]) -> dict:
+        """ Async counterpart of `__project_groups`, used with an async API caller."""
+        return self.__project_groups(await response, select)
 
     # Get list of entities
     def get_list(self, filters: Optional[dict] = None,
                  search: Optional[str] = None,
                  sort: Optional[dict] = None,
                  per_page: Optional[int] = None,
-                 pages: Optional[List[int]] = None) -> Iterable[dict]:
+                 pages: Optional[List[int]] = None,
+                 workers: Optional[int] = None,
+                 stream: bool = False,
+                 select: Optional[List[str]] = None,
+                 checkpoint: Optional[str] = None,
+                 resume: bool = False,
+                 shard_by: Optional[str] = None) -> Iterable[dict]:
         """ Get list of entities.
 
         Args:
@@ -141,31 +579,258 @@ class _Endpoint:
                                       Defaults to 25.
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
                 If empty, cursor pagination will be used.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, or number of shards harvested concurrently, optional.
+            stream (bool): yield single entities, decoding each page incrementally,
+                instead of whole pages. Defaults to False.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+            shard_by (Optional[str]): groupable filter attribute e.g. 'publication_year'
+                used to split the list into disjoint shards, that are cursor paged
+                concurrently, optional. The counts of all groups balance the shard sizes.
+                Pages (or entities) of different shards are interleaved.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of entities.
+            Generator, each item a dict from JSON representing a (partial) list of entities,
+            or a single entity if `stream` is set.
 
         Raises:
             ValueError: if `sort` contains keys that are not valid sort attributes
                         or one of the sort values is not "asc" or "desc".
                         if `filters` contains keys that are not valid filter attributes
                         for this endpoint.
+                        if `stream` is combined with `workers`.
+                        if `select` contains fields that are not selectable for this endpoint.
+                        if `checkpoint` is combined with `pages`.
+                        if the progress saved in `checkpoint` belongs to a different query.
+                        if `shard_by` is combined with `pages` or `checkpoint`.
+                        if `shard_by` does not split the list into disjoint shards.
         """
-        is_search = self.__is_search(filters=filters, search=search)
-        params = {'filter': self.__build_filter_param(filters),
-                  'search': search,
-                  'sort': self.__build_sort_param_for_list(sort, is_search)}
+        params = self.__build_list_params(filters, search, sort, select)
+        return self._get_list(params, per_page, pages, workers, stream,
+                              checkpoint, resume, shard_by)
+
+    def _get_list(self, params: dict,
+                  per_page: Optional[int] = None,
+                  pages: Optional[List[int]] = None,
+                  workers: Optional[int] = None,
+                  stream: bool = False,
+                  checkpoint: Optional[str] = None,
+                  resume: bool = False,
+                  shard_by: Optional[str] = None) -> Iterable[dict]:
+        """ Get list of entities, using validated parameters e.g. compiled by a `Query`.
 
-        return self.api_caller.get_all(self.name, params, per_page, pages)
+        Args:
+            params (dict): query parameters i.e. 'filter', 'search', 'sort' and 'select'.
+                The dict is not modified.
+            other arguments: same as `get_list`.
+
+        Returns:
+            same as `get_list`.
+
+        Raises:
+            ValueError: same as `get_list`, except for the validation of `params`.
+        """
+        params = dict(params)
+        if not shard_by:
+            return self.api_caller.get_all(self.name, params, per_page, pages, workers, stream,
+                                           checkpoint, resume)
+
+        if pages or checkpoint:
+            raise ValueError("Sharding requires cursor pagination without checkpoint.")
+        if shard_by not in self.filter_keys:
+            raise ValueError(f"'shard_by' needs to be a filter attribute. "
+                             f"Valid values are {self.filter_attrs}")
+        groups_params = {'group_by': self.__build_group_by_param(shard_by),
+                         'filter': params.get('filter'),
+                         'search': params.get('search'),
+                         'sort': None}
+        workers = workers or 1
+        if getattr(self.api_caller, "is_async", False):
+            return self.__get_sharded_list_async(params, groups_params, per_page, workers,
+                                                 stream, shard_by)
+
+        groups = self._get_all_groups(groups_params)
+        count = self.api_caller.get(self.name, self.__build_count_params(params))
+        shard_params = self.__build_shard_params(params, shard_by, groups,
+                                                 count['meta']['count'], workers)
+        shards = (self.api_caller.get_all(self.name, params, per_page, stream=stream)
+                  for params in shard_params)
+        return merge(shards, workers)
+
+    async def __get_sharded_list_async(self, params: dict,
+                                       groups_params: dict,
+                                       per_page: Optional[int],
+                                       workers: int,
+                                       stream: bool,
+                                       shard_by: str):
+        """ Async counterpart of a sharded `get_list`, used with an async API caller."""
+        groups = await self._get_all_groups(groups_params)
+        count = await self.api_caller.get(self.name, self.__build_count_params(params))
+        shard_params = self.__build_shard_params(params, shard_by, groups,
+                                                 count['meta']['count'], workers)
+        shards = (self.api_caller.get_all(self.name, params, per_page, stream=stream)
+                  for params in shard_params)
+        async for item in amerge(shards, workers):
+            yield item
+
+    def iter_list(self, filters: Optional[dict] = None,
+                  search: Optional[str] = None,
+                  sort: Optional[dict] = None,
+                  per_page: Optional[int] = None,
+                  pages: Optional[List[int]] = None,
+                  prefetch_depth: int = 2,
+                  select: Optional[List[str]] = None) -> Iterable[dict]:
+        """ Iterate over single entities of a list, fetching the next pages in the background
+        while the entities of the current page are processed.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            sort (Optional[dict]): dictionary with properties to sort entities, optional.
+            per_page (Optional[int]): number of entities per page. Needs to be in [1;200].
+                                      Defaults to 25.
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single entity.
+
+        Raises:
+            ValueError: same as `get_list`.
+        """
+        params = self.__build_list_params(filters, search, sort, select)
+        return self.api_caller.iter_all(self.name, params, per_page, pages, prefetch_depth)
 
     # --------------------------------------------------------------------------
     # ----------------------------- HELPER METHODS -----------------------------
+    def __build_id_batches(self, id_values: Iterable[str]) -> List[List[str]]:
+        """Helper method removing duplicate IDs and splitting them into batches
+        small enough to be combined into a single OR-filter."""
+        unique_ids = list(dict.fromkeys(id_values))
+        if not all(unique_ids):
+            raise ValueError("'id_values' can not contain empty values")
+        return [unique_ids[i:i + self.OR_VALUES_MAX]
+                for i in range(0, len(unique_ids), self.OR_VALUES_MAX)]
+
+    def __build_id_batch_params(self, batch: List[str], id_type: str,
+                                select_param: Optional[str]) -> dict:
+        """Helper method constructing the query parameters for a batch of IDs."""
+        filters = {self.id_filter_attrs[id_type]: "|".join(batch)}
+        return {'filter': self.__build_filter_param(filters), 'select': select_param}
+
+    @staticmethod
+    def __match_ids(batch: List[str], id_type: str, entities: List[dict]) -> dict:
+        """Helper method mapping each requested ID to the entity it identifies."""
+        found = {}
+        for entity in entities:
+            ids = entity['id'] if id_type == "openalex" else entity.get('ids', {}).get(id_type)
+            for id_value in ids if isinstance(ids, list) else [ids]:
+                if id_value:
+                    found[_normalize_id(id_value)] = entity
+        return {id_value: found.get(_normalize_id(id_value)) for id_value in batch}
+
+    def __build_sample_params(self, params: dict, size: int, seed: int) -> Tuple[dict, List[int]]:
+        """Helper method constructing the parameters and page numbers for a sample
+        of (at most `SAMPLE_MAX`) entities."""
+        size = min(size, self.SAMPLE_MAX)
+        select = params.get('select')
+        if select and "id" not in select.split(","):
+            select = f"{select},id"
+        sample_params = {'filter': params.get('filter'),
+                         'search': params.get('search'),
+                         'select': select,
+                         'sample': size,
+                         'seed': seed}
+        per_page = self.api_caller.PER_PAGE_MAX
+        return sample_params, list(range(1, -(-size // per_page) + 1))
+
+    @staticmethod
+    def __add_sampled(sampled: dict, entities: List[dict]) -> int:
+        """Helper method adding the entities not sampled yet, returning how many were added."""
+        count = len(sampled)
+        for entity in entities:
+            sampled.setdefault(entity['id'], entity)
+        return len(sampled) - count
+
+    @staticmethod
+    def __build_count_params(params: dict) -> dict:
+        """Helper method constructing the parameters for counting the entities of a list."""
+        return {'filter': params.get('filter'),
+                'search': params.get('search'),
+                'per_page': 1,
+                'select': "id"}
+
+    def __build_shard_params(self, params: dict,
+                             shard_by: str,
+                             groups: Dict[str, int],
+                             count: int,
+                             workers: int) -> List[dict]:
+        """Helper method splitting a list into disjoint shards of similar size,
+        by combining the keys of all its groups into OR-filters on `shard_by`.
+        The largest shards come first, so that they are started early."""
+        grouped_count = sum(groups.values())
+        if grouped_count != count:
+            raise ValueError(f"'{shard_by}' can not split the list into disjoint shards: "
+                             f"the groups contain {grouped_count} of {count} entities.")
+
+        target_size = count / (workers * self.SHARDS_PER_WORKER)
+        shards, keys, size = [], [], 0
+        for key, group_count in groups.items():
+            if keys and (size + group_count > target_size or len(keys) == self.OR_VALUES_MAX):
+                shards.append((size, keys))
+                keys, size = [], 0
+            # entities without a value are grouped under the key 'unknown'
+            keys.append("null" if key in (None, "unknown") else str(key))
+            size += group_count
+        if keys:
+            shards.append((size, keys))
+
+        shards.sort(key=lambda shard: shard[0], reverse=True)
+        return [{**params, 'filter': join_filters(params.get('filter'),
+                                                  f"{shard_by}:{'|'.join(keys)}")}
+                for _, keys in shards]
+
+    def __build_list_params(self, filters: Optional[dict],
+                            search: Optional[str],
+                            sort: Optional[dict],
+                            select: Optional[List[str]] = None) -> dict:
+        """Helper method validating and constructing the parameters for lists."""
+        is_search = self.__is_search(filters=filters, search=search)
+        return {'filter': self.__build_filter_param(filters),
+                'search': search,
+                'sort': self.__build_sort_param_for_list(sort, is_search),
+                'select': self._build_select_param(select, self.selectable_attrs,
+                                                   self.selectable_keys)}
+
+    @staticmethod
+    def _build_select_param(select: Optional[List[str]],
+                            selectable_attrs: Iterable[str],
+                            selectable_keys: Optional[frozenset] = None) -> Optional[str]:
+        """Helper method validating and constructing the 'select' parameter."""
+        if not select:
+            return None  # nothing to do here
+
+        if (selectable_keys or frozenset(selectable_attrs)).issuperset(select):
+            return ",".join(select)
+
+        raise ValueError("Value for 'select' not valid."
+                         f"\nSelectable fields are {','.join(selectable_attrs)}.")
+
     def __build_filter_param(self, filters: Optional[dict]) -> Optional[str]:
         """Helper method validating and constructing the 'filter' parameter."""
         if not filters:
             return None  # nothing to do here
 
-        if all(f in self.filter_attrs for f in filters.keys()):
+        if self.filter_keys.issuperset(filters.keys()):
             return ",".join(f"{k}:{v}" for k, v in filters.items())
 
         raise ValueError("Value for 'filter' key not valid."
@@ -195,46 +860,75 @@ class _Endpoint:
             if sort[relevance_score] == "asc":
                 raise ValueError("Sorting by 'relevance_score' ascending not allowed.")
 
-        sortable_keys = self.sortable_attrs
-        sortable_values = self.sortable_drctns
-        return self.__build_sort_param(sort, sortable_keys, sortable_values)
+        return self.__build_sort_param(sort, self.sortable_keys, self.sortable_attrs)
 
     def __build_sort_param_for_groups(self, sort: Optional[dict]) -> Optional[str]:
         """Helper method validating and constructing the 'sort' parameter for groups."""
         if not sort:
             return None  # nothing to do here
 
-        sortable_keys = self.sortable_attrs_for_groups
-        sortable_values = self.sortable_drctns
-        return self.__build_sort_param(sort, sortable_keys, sortable_values)
+        return self.__build_sort_param(sort, self.sortable_keys_for_groups,
+                                       self.sortable_attrs_for_groups)
 
     def __build_sort_param(self, sort: dict,
-                           sortable_keys: Iterable,
-                           sortable_values: Iterable) -> Optional[str]:
+                           sortable_keys: frozenset,
+                           sortable_attrs: Iterable[str]) -> Optional[str]:
         """Helper method constructing the 'sort' parameter."""
-        if (all(sk in sortable_keys for sk in sort.keys())
-                and all(sv in sortable_values for sv in sort.values())):
+        if (sortable_keys.issuperset(sort.keys())
+                and self.sortable_drctns_keys.issuperset(sort.values())):
             return ",".join(f"{k}:{v}" for k, v in sort.items())
 
         raise ValueError("Item for sorting dict not valid.\n"
-                         f"Valid sorting keys are {','.join(sortable_keys)} "
-                         f"and valid sorting values are {','.join(sortable_values)}.")
+                         f"Valid sorting keys are {','.join(sortable_attrs)} "
+                         f"and valid sorting values are {','.join(self.sortable_drctns)}.")
 
     def __build_group_by_param(self, group_by: str) -> str:
         """Helper method validating and building the 'group_by' parameter."""
-        if group_by in self.groupable_attrs:
+        if group_by in self.groupable_keys:
             return group_by
 
         raise ValueError("Value for 'group_by' not in groupable attributes."
                          f"\nGroupable attributes are {','.join(self.groupable_attrs)}.")
 
 
+def project(entity: dict, select: Iterable[str]) -> dict:
+    """ Keep only the selected top-level fields of an entity (or group).
+
+    Args:
+        entity (dict): dict from JSON describing an entity.
+        select (Iterable[str]): fields to keep.
+
+    Returns:
+        dict containing only the selected fields that are present in `entity`.
+    """
+    return {field: entity[field] for field in select if field in entity}
+
+
+def join_filters(*filter_params: Optional[str]) -> Optional[str]:
+    """ Combine 'filter' parameters with AND, skipping empty ones.
+
+    Args:
+        filter_params (Optional[str]): 'filter' parameters e.g. 'is_oa:true'.
+
+    Returns:
+        str containing the combined 'filter' parameter, or None if all are empty.
+    """
+    return ",".join(param for param in filter_params if param) or None
+
+
+def _normalize_id(id_value) -> str:
+    """Helper function reducing an ID to a canonical form, dropping any URL prefix
+    e.g. 'https://doi.org/10.1/ABC' and '10.1/abc' both become '10.1/abc'."""
+    return re.sub(r"^https?://[^/]+/(wiki/)?", "", str(id_value).strip()).lower()
+
+
 # --------------------------------------------------------------------------
 # --------------------------- SPECIFIC ENDPOINTS ---------------------------
 class Authors(_Endpoint):
     """Authors endpoint."""
     name = "authors"
     id_attrs = ("openalex", "orcid", "mag")
+    id_filter_attrs = {"openalex": "openalex_id", "orcid": "orcid"}
     filter_attrs = (
         "cited_by_count",
         "display_name",
@@ -259,12 +953,28 @@ class Authors(_Endpoint):
         "last_known_institution.type",
         "x_concepts.id"
     )
+    selectable_attrs = (
+        "cited_by_count",
+        "counts_by_year",
+        "created_date",
+        "display_name",
+        "display_name_alternatives",
+        "id",
+        "ids",
+        "last_known_institution",
+        "orcid",
+        "updated_date",
+        "works_api_url",
+        "works_count",
+        "x_concepts"
+    )
 
 
 class Concepts(_Endpoint):
     """Concepts endpoint."""
     name = "concepts"
     id_attrs = ("openalex", "wikidata", "mag")
+    id_filter_attrs = {"openalex": "openalex_id", "wikidata": "wikidata_id"}
     filter_attrs = (
         "ancestors.id",
         "cited_by_count",
@@ -283,12 +993,32 @@ class Concepts(_Endpoint):
         "has_wikidata",
         "level"
     )
+    selectable_attrs = (
+        "ancestors",
+        "cited_by_count",
+        "counts_by_year",
+        "created_date",
+        "description",
+        "display_name",
+        "id",
+        "ids",
+        "image_thumbnail_url",
+        "image_url",
+        "international",
+        "level",
+        "related_concepts",
+        "updated_date",
+        "wikidata",
+        "works_api_url",
+        "works_count"
+    )
 
 
 class Institutions(_Endpoint):
     """Institutions endpoint."""
     name = "institutions"
     id_attrs = ("openalex", "ror", "mag")
+    id_filter_attrs = {"openalex": "openalex_id", "ror": "ror"}
     filter_attrs = (
         "cited_by_count",
         "country_code",
@@ -309,12 +1039,36 @@ class Institutions(_Endpoint):
         "type",
         "x_concepts.id"
     )
+    selectable_attrs = (
+        "associated_institutions",
+        "cited_by_count",
+        "counts_by_year",
+        "country_code",
+        "created_date",
+        "display_name",
+        "display_name_acronyms",
+        "display_name_alternatives",
+        "geo",
+        "homepage_url",
+        "id",
+        "ids",
+        "image_thumbnail_url",
+        "image_url",
+        "international",
+        "ror",
+        "type",
+        "updated_date",
+        "works_api_url",
+        "works_count",
+        "x_concepts"
+    )
 
 
 class Venues(_Endpoint):
     """Venues endpoint."""
     name = "venues"
     id_attrs = ("openalex", "issn", "issn_l", "mag")
+    id_filter_attrs = {"openalex": "openalex_id", "issn": "issn"}
     filter_attrs = (
         "cited_by_count",
         "display_name",
@@ -338,12 +1092,31 @@ class Venues(_Endpoint):
         "publisher",
         "x_concepts.id"
     )
+    selectable_attrs = (
+        "cited_by_count",
+        "counts_by_year",
+        "created_date",
+        "display_name",
+        "homepage_url",
+        "id",
+        "ids",
+        "is_in_doaj",
+        "is_oa",
+        "issn",
+        "issn_l",
+        "publisher",
+        "updated_date",
+        "works_api_url",
+        "works_count",
+        "x_concepts"
+    )
 
 
 class Works(_Endpoint):
     """Works endpoint."""
     name = "works"
     id_attrs = ("openalex", "doi", "pmid", "mag")
+    id_filter_attrs = {"openalex": "openalex_id", "doi": "doi", "pmid": "pmid", "mag": "mag"}
     filter_attrs = (
         "abstract.search",
         "alternate_host_venues.id",
@@ -437,11 +1210,46 @@ class Works(_Endpoint):
         "publication_year",
         "type"
     )
+    selectable_attrs = (
+        "abstract_inverted_index",
+        "alternate_host_venues",
+        "authorships",
+        "biblio",
+        "cited_by_api_url",
+        "cited_by_count",
+        "concepts",
+        "counts_by_year",
+        "created_date",
+        "display_name",
+        "doi",
+        "host_venue",
+        "id",
+        "ids",
+        "is_paratext",
+        "is_retracted",
+        "mesh",
+        "open_access",
+        "publication_date",
+        "publication_year",
+        "referenced_works",
+        "related_works",
+        "title",
+        "type",
+        "updated_date"
+    )
 
     def get_by_api_url(self, works_api_url:str,
                           per_page: Optional[int] = None,
-                          pages: Optional[List[int]] = None):
+                          pages: Optional[List[int]] = None,
+                          workers: Optional[int] = None,
+                          stream: bool = False,
+                          select: Optional[List[str]] = None,
+                          checkpoint: Optional[str] = None,
+                          resume: bool = False):
         """ Convenience method to get list of works by a `works_api_url`."""
         query_string = works_api_url.split(self.name, 1)[1]
         path = f"{self.name}{query_string}"
-        return self.api_caller.get_all(path, {}, per_page, pages)
+        params = {'select': self._build_select_param(select, self.selectable_attrs,
+                                                       self.selectable_keys)}
+        return self.api_caller.get_all(path, params, per_page, pages, workers, stream,
+                                       checkpoint, resume)
@@ -0,0 +1,232 @@
+"""This module exports entities of the OpenAlex API to (compressed) files."""
+import gzip
+import json
+from typing import Optional, List, Iterable
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, see extras_require "zstd"
+    zstandard = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional dependency, see extras_require "parquet"
+    pyarrow = None
+
+from diophila.endpoints import project
+from diophila.prefetch import prefetch
+
+
+class _RotatingWriter:
+    """Base class for writers splitting their output into files of bounded size."""
+
+    def __init__(self, path_pattern: str, max_bytes: Optional[int] = None):
+        if max_bytes and "{index" not in path_pattern:
+            raise ValueError("'path_pattern' needs to contain '{index}' to roll over files.")
+        self.path_pattern = path_pattern
+        self.max_bytes = max_bytes
+        self.files: List[str] = []
+        self.entities = 0
+        self._file = None
+
+    def write(self, entity: dict) -> None:
+        """ Write a single entity, rolling over to a new file once `max_bytes` is reached.
+
+        Args:
+            entity (dict): dict from JSON describing an entity.
+        """
+        if self._file is None:
+            self._file = open(self.path_pattern.format(index=len(self.files)), "wb")
+            self.files.append(self._file.name)
+            self._open()
+        self._write(entity)
+        self.entities += 1
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self.__roll_over()
+
+    def close(self) -> None:
+        """ Flush and close the current file."""
+        if self._file is not None:
+            self.__roll_over()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __roll_over(self) -> None:
+        """Helper method finishing the current file, so the next entity starts a new one."""
+        self._finish()
+        self._file.close()
+        self._file = None
+
+    def _open(self) -> None:
+        """ Prepare writing to the freshly opened `_file`."""
+        raise NotImplementedError
+
+    def _write(self, entity: dict) -> None:
+        """ Write a single entity to the current file."""
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        """ Flush everything buffered for the current file."""
+        raise NotImplementedError
+
+
+class JSONLWriter(_RotatingWriter):
+    """Writes entities as JSON lines into gzip or zstd compressed files."""
+
+    def __init__(self, path_pattern: str,
+                 compression: Optional[str] = "gzip",
+                 max_bytes: Optional[int] = None,
+                 compress_level: Optional[int] = None) -> object:
+        """ Init JSONL writer.
+
+        Args:
+            path_pattern (str): path of the files, e.g. 'works-{index:04d}.jsonl.gz'.
+                        '{index}' is replaced by the number of the file.
+            compression (Optional[str]): 'gzip', 'zstd' or None for no compression.
+                        Defaults to 'gzip'.
+            max_bytes (Optional[int]): (compressed) size after which a new file is started,
+                        optional. If empty, all entities are written into a single file.
+            compress_level (Optional[int]): level of compression, optional.
+                        Defaults to 6 for gzip and 3 for zstd.
+
+        Raises:
+            ValueError: if `compression` is not supported.
+                        if `max_bytes` is set but `path_pattern` does not contain '{index}'.
+            ImportError: if `compression` is 'zstd' and zstandard is not installed.
+        """
+        if compression not in ("gzip", "zstd", None):
+            raise ValueError("Value for 'compression' not valid. "
+                             "Valid values are 'gzip', 'zstd' or None.")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd compression requires zstandard. "
+                              "Install it with 'pip install diophila[zstd]'.")
+        super().__init__(path_pattern, max_bytes)
+        self.compression = compression
+        self.compress_level = compress_level
+        self._stream = None
+
+    def _open(self) -> None:
+        if self.compression == "gzip":
+            level = self.compress_level if self.compress_level is not None else 6
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=level)
+        elif self.compression == "zstd":
+            level = self.compress_level if self.compress_level is not None else 3
+            compressor = zstandard.ZstdCompressor(level=level)
+            self._stream = compressor.stream_writer(self._file, closefd=False)
+        else:
+            self._stream = self._file
+
+    def _write(self, entity: dict) -> None:
+        line = json.dumps(entity, ensure_ascii=False, separators=(",", ":"))
+        self._stream.write(line.encode("utf-8") + b"\n")
+
+    def _finish(self) -> None:
+        if self._stream is not self._file:
+            self._stream.close()
+        self._stream = None
+
+
+class ParquetWriter(_RotatingWriter):
+    """Writes entities as rows of Parquet files, buffering them into row groups.
+
+    Top-level fields become columns. Nested values (objects and lists) are stored
+    as JSON strings, so that entities with differing nested fields share a schema.
+    The schema is inferred from the first row group of every file.
+    """
+
+    def __init__(self, path_pattern: str,
+                 max_bytes: Optional[int] = None,
+                 row_group_size: int = 10000,
+                 compression: str = "zstd") -> object:
+        """ Init Parquet writer.
+
+        Args:
+            path_pattern (str): path of the files, e.g. 'works-{index:04d}.parquet'.
+                        '{index}' is replaced by the number of the file.
+            max_bytes (Optional[int]): size after which a new file is started, optional.
+                        Checked after every row group. If empty, all entities are
+                        written into a single file.
+            row_group_size (int): number of entities buffered and written as one row group.
+            compression (str): compression codec of the columns e.g. 'zstd' or 'snappy'.
+
+        Raises:
+            ValueError: if `max_bytes` is set but `path_pattern` does not contain '{index}'.
+            ImportError: if pyarrow is not installed.
+        """
+        if pyarrow is None:
+            raise ImportError("ParquetWriter requires pyarrow. "
+                              "Install it with 'pip install diophila[parquet]'.")
+        super().__init__(path_pattern, max_bytes)
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self._rows = []
+        self._writer = None
+
+    def _open(self) -> None:
+        self._rows, self._writer = [], None
+
+    def _write(self, entity: dict) -> None:
+        self._rows.append({field: json.dumps(value, ensure_ascii=False)
+                           if isinstance(value, (dict, list)) else value
+                           for field, value in entity.items()})
+        # the file only grows (and is checked against `max_bytes`) when a row group is written
+        if len(self._rows) >= self.row_group_size:
+            self.__write_row_group()
+
+    def _finish(self) -> None:
+        self.__write_row_group()
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+
+    def __write_row_group(self) -> None:
+        """Helper method writing the buffered rows as a row group."""
+        if not self._rows:
+            return
+        if self._writer is None:
+            schema = pyarrow.Table.from_pylist(self._rows).schema
+            # columns without any value in the first row group are assumed to hold strings
+            schema = pyarrow.schema([field.with_type(pyarrow.string())
+                                     if pyarrow.types.is_null(field.type) else field
+                                     for field in schema])
+            self._writer = pyarrow.parquet.ParquetWriter(self._file, schema,
+                                                         compression=self.compression)
+        table = pyarrow.Table.from_pylist(self._rows, schema=self._writer.schema)
+        self._writer.write_table(table, row_group_size=len(self._rows))
+        self._rows = []
+
+
+def export_entities(items: Iterable[dict],
+                    writer: _RotatingWriter,
+                    select: Optional[List[str]] = None,
+                    prefetch_depth: int = 2) -> List[str]:
+    """ Export the entities of a list to files, fetching the next pages in the background
+    while the current one is written.
+
+    Args:
+        items (Iterable[dict]): pages or single entities e.g. from `get_list_of_works`
+            or `get_works_by_api_url` (also with `stream=True`).
+        writer (_RotatingWriter): writer for the entities e.g. a JSONLWriter or ParquetWriter.
+            It is closed after all entities are written.
+        select (Optional[List[str]]): fields of the entities to export, optional.
+            If empty, all fields are exported.
+        prefetch_depth (int): maximum number of pages (or entities) fetched ahead, defaults to 2.
+            Lists harvested with a `checkpoint` are not fetched ahead: their checkpoint is
+            only advanced after the entities of a page were handed to the writer, so that
+            resuming after a crash never skips entities.
+
+    Returns:
+        list of the paths of all written files.
+    """
+    with writer:
+        for item in prefetch(items, prefetch_depth):
+            # pages hold their entities in 'results', streamed entities are passed on as they are
+            entities = item['results'] if 'meta' in item and 'results' in item else [item]
+            for entity in entities:
+                writer.write(project(entity, select) if select else entity)
+    return writer.files
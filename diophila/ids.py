@@ -0,0 +1,237 @@
+"""This module packs OpenAlex IDs into integers and offers compact containers for them."""
+import heapq
+import re
+from itertools import islice
+from array import array
+from bisect import bisect_left
+from typing import Optional, Iterable, Iterator, Union, Tuple
+
+from diophila.endpoints import Authors, Concepts, Institutions, Venues, Works
+
+# OpenAlex IDs start with the first letter of their endpoint's name e.g. 'W' for works,
+# the position of the letter (+1) is stored in the highest bits of the packed ID
+ENTITY_PREFIXES = tuple(endpoint.name[0].upper()
+                        for endpoint in (Works, Authors, Venues, Institutions, Concepts))
+# number of bits holding the numeric part of an ID, leaving room for the prefix
+# while staying within a signed 64-bit integer
+NUMBER_BITS = 60
+NUMBER_MAX = (1 << NUMBER_BITS) - 1
+
+_OPENALEX_ID = re.compile(r"^(?:https?://openalex\.org/)?([A-Za-z])(\d+)$")
+
+IdLike = Union[str, int]
+
+
+def pack_id(openalex_id: IdLike) -> int:
+    """ Pack an OpenAlex ID into a 64-bit integer.
+
+    Args:
+        openalex_id (IdLike): OpenAlex ID as URL e.g. 'https://openalex.org/W2741809807',
+            short form e.g. 'W2741809807' or already packed integer.
+
+    Returns:
+        int holding the type of the entity in the highest bits and the number in the others.
+
+    Raises:
+        ValueError: if `openalex_id` is not a valid OpenAlex ID.
+    """
+    if isinstance(openalex_id, int):
+        return openalex_id
+    match = _OPENALEX_ID.match(openalex_id.strip())
+    prefix = match.group(1).upper() if match else None
+    if prefix not in ENTITY_PREFIXES or int(match.group(2)) > NUMBER_MAX:
+        raise ValueError(f"'{openalex_id}' is not a valid OpenAlex ID.")
+    return (ENTITY_PREFIXES.index(prefix) + 1) << NUMBER_BITS | int(match.group(2))
+
+
+def unpack_id(packed_id: int, short: bool = False) -> str:
+    """ Unpack an integer created by `pack_id` into the OpenAlex ID.
+
+    Args:
+        packed_id (int): packed OpenAlex ID.
+        short (bool): return the short form e.g. 'W2741809807' instead of the URL,
+            defaults to False.
+
+    Returns:
+        str containing the OpenAlex ID.
+
+    Raises:
+        ValueError: if `packed_id` was not created by `pack_id`.
+    """
+    prefix_number = packed_id >> NUMBER_BITS
+    if not 0 < prefix_number <= len(ENTITY_PREFIXES):
+        raise ValueError(f"{packed_id} is not a packed OpenAlex ID.")
+    short_id = f"{ENTITY_PREFIXES[prefix_number - 1]}{packed_id & NUMBER_MAX}"
+    return short_id if short else f"https://openalex.org/{short_id}"
+
+
+def to_packed_ids(items: Iterable[dict]) -> Iterator[int]:
+    """ Get the packed OpenAlex IDs of the entities of a list.
+
+    Args:
+        items (Iterable[dict]): pages or single entities e.g. from `get_list_of_works`
+            or `iter_works`, at least the 'id' field needs to be selected.
+
+    Returns:
+        Generator, each item the packed ID of a single entity.
+    """
+    for item in items:
+        # pages hold their entities in 'results', single entities are handled as they are
+        entities = item['results'] if 'meta' in item and 'results' in item else [item]
+        for entity in entities:
+            yield pack_id(entity['id'])
+
+
+class IdSet:
+    """Set of OpenAlex IDs, stored as a sorted array of packed IDs.
+
+    Takes 8 bytes per ID instead of the ~100 bytes of a URL string in a set.
+    New IDs are collected in a buffer and merged into the array in batches.
+    The buffer grows with the array, so that adding n IDs takes O(n log n).
+    """
+
+    # minimum number of new IDs collected before merging them into the sorted array,
+    # the buffer may grow up to a quarter of the array
+    BUFFER_MAX = 65536
+
+    def __init__(self, openalex_ids: Optional[Iterable[IdLike]] = None):
+        self._sorted = array("q")
+        self._buffer = set()
+        if openalex_ids is not None:
+            self.update(openalex_ids)
+
+    def add(self, openalex_id: IdLike) -> None:
+        """ Add an OpenAlex ID (URL, short form or packed)."""
+        packed_id = pack_id(openalex_id)
+        if packed_id in self._buffer or self.__in_sorted(packed_id):
+            return
+        self._buffer.add(packed_id)
+        if self.__is_buffer_full():
+            self.__merge()
+
+    def update(self, openalex_ids: Iterable[IdLike]) -> None:
+        """ Add many OpenAlex IDs, a batch at a time."""
+        openalex_ids = iter(openalex_ids)
+        while True:
+            batch = {pack_id(openalex_id)
+                     for openalex_id in islice(openalex_ids, self.BUFFER_MAX)}
+            if not batch:
+                return
+            self._buffer.update(packed_id for packed_id in batch
+                                if not self.__in_sorted(packed_id))
+            if self.__is_buffer_full():
+                self.__merge()
+
+    def __contains__(self, openalex_id: IdLike) -> bool:
+        try:
+            packed_id = pack_id(openalex_id)
+        except ValueError:
+            return False
+        return packed_id in self._buffer or self.__in_sorted(packed_id)
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._buffer)
+
+    def __iter__(self) -> Iterator[str]:
+        return (unpack_id(packed_id) for packed_id in self.packed_ids())
+
+    def packed_ids(self) -> array:
+        """ Get all packed IDs as a sorted array."""
+        self.__merge()
+        return self._sorted
+
+    def __in_sorted(self, packed_id: int) -> bool:
+        """Helper method looking up a packed ID in the sorted array."""
+        position = bisect_left(self._sorted, packed_id)
+        return position < len(self._sorted) and self._sorted[position] == packed_id
+
+    def __is_buffer_full(self) -> bool:
+        """Helper method checking whether the buffer is large enough to be merged."""
+        return len(self._buffer) >= max(self.BUFFER_MAX, len(self._sorted) // 4)
+
+    def __merge(self) -> None:
+        """Helper method merging the buffer into the sorted array without
+        materializing all IDs as Python objects."""
+        if self._buffer:
+            self._sorted = array("q", heapq.merge(self._sorted, sorted(self._buffer)))
+            self._buffer = set()
+
+
+class IdMap:
+    """Mapping of OpenAlex IDs to numbers, stored as sorted arrays of packed IDs and values.
+
+    New items are collected in a buffer and merged into the arrays in batches.
+    The buffer grows with the arrays, so that adding n items takes O(n log n).
+    """
+
+    # minimum number of new items collected before merging them into the sorted arrays,
+    # the buffer may grow up to a quarter of the arrays
+    BUFFER_MAX = 65536
+
+    def __init__(self, typecode: str = "q"):
+        """ Init ID map.
+
+        Args:
+            typecode (str): array typecode of the values e.g. 'q' for 64-bit integers
+                or 'd' for floats, defaults to 'q'.
+        """
+        self.typecode = typecode
+        self._keys = array("q")
+        self._values = array(typecode)
+        self._buffer = {}
+
+    def __setitem__(self, openalex_id: IdLike, value) -> None:
+        packed_id = pack_id(openalex_id)
+        position = self.__find(packed_id)
+        if position is not None:
+            self._values[position] = value
+            return
+        self._buffer[packed_id] = value
+        if len(self._buffer) >= max(self.BUFFER_MAX, len(self._keys) // 4):
+            self.__merge()
+
+    def __getitem__(self, openalex_id: IdLike):
+        packed_id = pack_id(openalex_id)
+        if packed_id in self._buffer:
+            return self._buffer[packed_id]
+        position = self.__find(packed_id)
+        if position is None:
+            raise KeyError(openalex_id)
+        return self._values[position]
+
+    def get(self, openalex_id: IdLike, default=None):
+        """ Get the value of an OpenAlex ID, or `default` if it is not in the map."""
+        try:
+            return self[openalex_id]
+        except (KeyError, ValueError):
+            return default
+
+    def __contains__(self, openalex_id: IdLike) -> bool:
+        return self.get(openalex_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._buffer)
+
+    def items(self) -> Iterator[Tuple[str, object]]:
+        """ Get all (OpenAlex ID, value) pairs, ordered by packed ID."""
+        self.__merge()
+        return ((unpack_id(key), value) for key, value in zip(self._keys, self._values))
+
+    def __find(self, packed_id: int) -> Optional[int]:
+        """Helper method finding the position of a packed ID in the sorted keys."""
+        position = bisect_left(self._keys, packed_id)
+        if position < len(self._keys) and self._keys[position] == packed_id:
+            return position
+        return None
+
+    def __merge(self) -> None:
+        """Helper method merging the buffer into the sorted arrays."""
+        if not self._buffer:
+            return
+        merged = heapq.merge(zip(self._keys, self._values), sorted(self._buffer.items()))
+        keys, values = array("q"), array(self.typecode)
+        for key, value in merged:
+            keys.append(key)
+            values.append(value)
+        self._keys, self._values = keys, values
+        self._buffer = {}
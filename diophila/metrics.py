@@ -0,0 +1,227 @@
+"""This module reports and aggregates metrics of the requests sent to the OpenAlex API."""
+import logging
+import threading
+import time
+from collections import Counter, deque
+from typing import Optional, Dict, Tuple, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class RequestEvent:
+    """Describes a single (logical) request sent by an API caller.
+
+    Attributes:
+        path (str): path of the request e.g. 'works/W2741809807'.
+        endpoint (str): name of the endpoint e.g. 'works'.
+        paging (str): 'single', 'list', 'group', 'basic', 'cursor' or 'stream'.
+        status (Optional[int]): HTTP status of the (last) response, None if there was none.
+        latency (Optional[float]): seconds from start to end, including retries and decoding.
+        bytes (int): size of the response body(s).
+        decode_time (float): seconds spent decoding JSON.
+        retries (int): number of times the request was retried after '429 Too Many Requests'.
+        cache (Optional[str]): 'hit', 'miss' or 'revalidated', None if not cached.
+        error (Optional[BaseException]): exception the request failed with, if any.
+    """
+
+    __slots__ = ("path", "endpoint", "paging", "status", "latency", "bytes", "decode_time",
+                 "retries", "cache", "error", "started")
+
+    def __init__(self, path: str, params: Optional[dict] = None, paging: Optional[str] = None):
+        params = params or {}
+        self.path = path
+        self.endpoint = path.split("/", 1)[0].split("?", 1)[0]
+        self.paging = paging or self.__paging_mode(path, params)
+        self.status = None
+        self.latency = None
+        self.bytes = 0
+        self.decode_time = 0.0
+        self.retries = 0
+        self.cache = None
+        self.error = None
+        self.started = time.perf_counter()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """ Record the end of the request."""
+        self.latency = time.perf_counter() - self.started
+        self.error = error
+
+    @staticmethod
+    def __paging_mode(path: str, params: dict) -> str:
+        """Helper method deriving the kind of request from its parameters."""
+        if params.get('group_by'):
+            return "group"
+        if params.get('cursor'):
+            return "cursor"
+        if params.get('page'):
+            return "basic"
+        return "single" if "/" in path else "list"
+
+
+class RequestHook:
+    """Base class for hooks of an API caller, called at the start and end of every request.
+
+    Hooks are called from the thread (or task) sending the request, so they need
+    to be thread-safe when used with concurrent paging.
+    """
+
+    def on_start(self, event: RequestEvent) -> None:
+        """ Called before a request is sent (or served from the cache)."""
+
+    def on_end(self, event: RequestEvent) -> None:
+        """ Called after a request finished, successfully or not."""
+
+
+class MetricsCollector(RequestHook):
+    """Aggregates request events into counters and latency histograms,
+    exported in the Prometheus text format or as summaries."""
+
+    # upper bounds of the latency histogram buckets in seconds
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    # upper bounds of the decode time histogram buckets in seconds
+    DECODE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+    def __init__(self, window: int = 10000):
+        """ Init metrics collector.
+
+        Args:
+            window (int): number of most recent latencies per endpoint and paging mode
+                        kept to compute percentiles.
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._requests = Counter()
+        self._errors = Counter()
+        self._retries = Counter()
+        self._cache = Counter()
+        self._bytes = Counter()
+        self._latency: Dict[Tuple[str, str], list] = {}
+        self._decode: Dict[Tuple[str, str], list] = {}
+        self._recent: Dict[Tuple[str, str], deque] = {}
+        self._reporter = None
+
+    def on_end(self, event: RequestEvent) -> None:
+        key = (event.endpoint, event.paging)
+        status = str(event.status) if event.status is not None else "error"
+        with self._lock:
+            self._requests[key + (status,)] += 1
+            if not status.startswith(("2", "3")):
+                self._errors[key] += 1
+            self._retries[key] += event.retries
+            self._bytes[key] += event.bytes
+            if event.cache:
+                self._cache[key + (event.cache,)] += 1
+            self.__observe(self._latency, key, self.LATENCY_BUCKETS, event.latency)
+            if event.decode_time:
+                self.__observe(self._decode, key, self.DECODE_BUCKETS, event.decode_time)
+            self._recent.setdefault(key, deque(maxlen=self.window)).append(event.latency)
+
+    def summary(self) -> Dict[str, dict]:
+        """ Summarize the requests per endpoint and paging mode.
+
+        Returns:
+            dict mapping 'endpoint paging' to the number of requests, errors, retries,
+            cache hits, bytes and the 50th/99th latency percentiles in seconds.
+        """
+        with self._lock:
+            summary = {}
+            for key, latencies in self._recent.items():
+                ordered = sorted(latencies)
+                summary[" ".join(key)] = {
+                    'requests': self._latency[key][-1],
+                    'errors': self._errors[key],
+                    'retries': self._retries[key],
+                    'cache_hits': self._cache[key + ("hit",)],
+                    'bytes': self._bytes[key],
+                    'p50': ordered[int(0.50 * (len(ordered) - 1))],
+                    'p99': ordered[int(0.99 * (len(ordered) - 1))]}
+            return summary
+
+    def to_prometheus(self, prefix: str = "diophila") -> str:
+        """ Export all metrics in the Prometheus text format.
+
+        Args:
+            prefix (str): prefix of the metric names, defaults to 'diophila'.
+
+        Returns:
+            str in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            self.__counter(lines, f"{prefix}_requests_total", "Requests sent to the OpenAlex API.",
+                           self._requests, ("endpoint", "paging", "status"))
+            self.__counter(lines, f"{prefix}_retries_total",
+                           "Requests retried after '429 Too Many Requests'.",
+                           self._retries, ("endpoint", "paging"))
+            self.__counter(lines, f"{prefix}_cache_total", "Requests answered by the cache.",
+                           self._cache, ("endpoint", "paging", "result"))
+            self.__counter(lines, f"{prefix}_response_bytes_total", "Size of the responses.",
+                           self._bytes, ("endpoint", "paging"))
+            self.__histogram(lines, f"{prefix}_request_duration_seconds",
+                             "Duration of requests including retries and decoding.",
+                             self._latency, self.LATENCY_BUCKETS)
+            self.__histogram(lines, f"{prefix}_decode_duration_seconds",
+                             "Duration of decoding JSON responses.",
+                             self._decode, self.DECODE_BUCKETS)
+        return "\n".join(lines) + "\n"
+
+    def start_reporting(self, interval: float = 60,
+                        report: Optional[Callable[[Dict[str, dict]], None]] = None) -> None:
+        """ Report a summary periodically in a background thread.
+
+        Args:
+            interval (float): seconds between two reports, defaults to 60.
+            report (Optional[Callable]): called with every summary, optional.
+                        Defaults to logging the summary at level INFO to the logger
+                        'diophila.metrics'.
+        """
+        self.stop_reporting()
+        report = report or (lambda summary: logger.info("Request metrics: %s", summary))
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                report(self.summary())
+
+        threading.Thread(target=run, daemon=True).start()
+        self._reporter = stop
+
+    def stop_reporting(self) -> None:
+        """ Stop reporting summaries periodically."""
+        if self._reporter is not None:
+            self._reporter.set()
+            self._reporter = None
+
+    @staticmethod
+    def __observe(histograms: dict, key: tuple, buckets: tuple, value: float) -> None:
+        """Helper method adding a value to a histogram: counts per bucket, sum and count."""
+        histogram = histograms.setdefault(key, [0] * len(buckets) + [0.0, 0])
+        for position, bound in enumerate(buckets):
+            if value <= bound:
+                histogram[position] += 1
+        histogram[-2] += value
+        histogram[-1] += 1
+
+    @staticmethod
+    def __labels(names: tuple, values: tuple) -> str:
+        """Helper method formatting the labels of a sample."""
+        return ",".join(f'{name}="{value}"' for name, value in zip(names, values))
+
+    def __counter(self, lines: list, name: str, description: str,
+                  counter: Counter, label_names: tuple) -> None:
+        """Helper method formatting a counter."""
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+        for labels, value in sorted(counter.items()):
+            lines.append(f"{name}{{{self.__labels(label_names, labels)}}} {value}")
+
+    def __histogram(self, lines: list, name: str, description: str,
+                    histograms: dict, buckets: tuple) -> None:
+        """Helper method formatting a histogram."""
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+        for key, histogram in sorted(histograms.items()):
+            labels = self.__labels(("endpoint", "paging"), key)
+            for bound, count in zip(buckets, histogram):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram[-1]}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram[-2]}")
+            lines.append(f"{name}_count{{{labels}}} {histogram[-1]}")
@@ -0,0 +1,216 @@
+"""This module offers compact, typed models for the entities of the OpenAlex API."""
+import json
+from typing import Optional, Iterable, Iterator, Type
+
+
+def _encode(value) -> Optional[bytes]:
+    """Helper function encoding a nested value as compact JSON."""
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _LazyField:
+    """Field holding a nested value as compact JSON, decoded on first access."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if isinstance(value, bytes):
+            value = json.loads(value)
+            setattr(instance, self.slot, value)
+        return value
+
+
+class _Model:
+    """Base class for models of entities.
+
+    Top-level values (strings, numbers) are kept in slots, nested values
+    (objects and lists) are kept as compact JSON and decoded on first access.
+    Fields that are not part of the model are kept as well, see `to_dict`.
+    """
+
+    __slots__ = ("_extra",)
+
+    # top-level fields kept as they are
+    fields: tuple = ()
+    # nested fields decoded on first access, each one needs a `_LazyField` and a slot '_<name>'
+    lazy_fields: tuple = ()
+
+    def __init__(self, entity: dict):
+        """ Init model from an entity.
+
+        Args:
+            entity (dict): dict from JSON describing an entity.
+        """
+        for field in self.fields:
+            setattr(self, field, entity.get(field))
+        for field in self.lazy_fields:
+            setattr(self, f"_{field}", _encode(entity.get(field)))
+        known = set(self.fields).union(self.lazy_fields)
+        extra = {field: value for field, value in entity.items() if field not in known}
+        self._extra = _encode(extra) if extra else None
+
+    def __getitem__(self, field: str):
+        """ Get a field like from the dict describing the entity."""
+        if field in self.fields or field in self.lazy_fields:
+            return getattr(self, field)
+        if self._extra is not None:
+            extra = json.loads(self._extra)
+            if field in extra:
+                return extra[field]
+        raise KeyError(field)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id!r})"  # pylint: disable=no-member
+
+    def to_dict(self) -> dict:
+        """ Convert the model back into the dict describing the entity."""
+        entity = {field: getattr(self, field) for field in self.fields}
+        entity.update({field: getattr(self, field) for field in self.lazy_fields})
+        if self._extra is not None:
+            entity.update(json.loads(self._extra))
+        return entity
+
+
+class Author(_Model):
+    """Model of an author, see https://docs.openalex.org/about-the-data/author"""
+
+    fields = ("id", "orcid", "display_name", "works_count", "cited_by_count",
+              "works_api_url", "updated_date", "created_date")
+    lazy_fields = ("display_name_alternatives", "ids", "last_known_institution",
+                   "x_concepts", "counts_by_year")
+    __slots__ = fields + tuple(f"_{field}" for field in lazy_fields)
+
+    display_name_alternatives = _LazyField()
+    ids = _LazyField()
+    last_known_institution = _LazyField()
+    x_concepts = _LazyField()
+    counts_by_year = _LazyField()
+
+
+class Concept(_Model):
+    """Model of a concept, see https://docs.openalex.org/about-the-data/concept"""
+
+    fields = ("id", "wikidata", "display_name", "level", "description", "works_count",
+              "cited_by_count", "image_url", "image_thumbnail_url", "works_api_url",
+              "updated_date", "created_date")
+    lazy_fields = ("ids", "international", "ancestors", "related_concepts", "counts_by_year")
+    __slots__ = fields + tuple(f"_{field}" for field in lazy_fields)
+
+    ids = _LazyField()
+    international = _LazyField()
+    ancestors = _LazyField()
+    related_concepts = _LazyField()
+    counts_by_year = _LazyField()
+
+
+class Institution(_Model):
+    """Model of an institution, see https://docs.openalex.org/about-the-data/institution"""
+
+    fields = ("id", "ror", "display_name", "country_code", "type", "homepage_url",
+              "image_url", "image_thumbnail_url", "works_count", "cited_by_count",
+              "works_api_url", "updated_date", "created_date")
+    lazy_fields = ("display_name_acronyms", "display_name_alternatives", "ids", "geo",
+                   "international", "associated_institutions", "x_concepts", "counts_by_year")
+    __slots__ = fields + tuple(f"_{field}" for field in lazy_fields)
+
+    display_name_acronyms = _LazyField()
+    display_name_alternatives = _LazyField()
+    ids = _LazyField()
+    geo = _LazyField()
+    international = _LazyField()
+    associated_institutions = _LazyField()
+    x_concepts = _LazyField()
+    counts_by_year = _LazyField()
+
+
+class Venue(_Model):
+    """Model of a venue, see https://docs.openalex.org/about-the-data/venue"""
+
+    fields = ("id", "issn_l", "display_name", "publisher", "works_count", "cited_by_count",
+              "is_oa", "is_in_doaj", "homepage_url", "works_api_url",
+              "updated_date", "created_date")
+    lazy_fields = ("issn", "ids", "x_concepts", "counts_by_year")
+    __slots__ = fields + tuple(f"_{field}" for field in lazy_fields)
+
+    issn = _LazyField()
+    ids = _LazyField()
+    x_concepts = _LazyField()
+    counts_by_year = _LazyField()
+
+
+class Work(_Model):
+    """Model of a work, see https://docs.openalex.org/about-the-data/work"""
+
+    fields = ("id", "doi", "title", "display_name", "publication_year", "publication_date",
+              "type", "cited_by_count", "is_retracted", "is_paratext", "cited_by_api_url",
+              "updated_date", "created_date")
+    lazy_fields = ("ids", "host_venue", "open_access", "authorships", "biblio", "concepts",
+                   "mesh", "alternate_host_venues", "referenced_works", "related_works",
+                   "abstract_inverted_index", "counts_by_year")
+    __slots__ = fields + tuple(f"_{field}" for field in lazy_fields)
+
+    ids = _LazyField()
+    host_venue = _LazyField()
+    open_access = _LazyField()
+    authorships = _LazyField()
+    biblio = _LazyField()
+    concepts = _LazyField()
+    mesh = _LazyField()
+    alternate_host_venues = _LazyField()
+    referenced_works = _LazyField()
+    related_works = _LazyField()
+    abstract_inverted_index = _LazyField()
+    counts_by_year = _LazyField()
+
+
+# models by the first letter of an OpenAlex ID e.g. 'W' in 'https://openalex.org/W2741809807'
+MODELS = {'A': Author, 'C': Concept, 'I': Institution, 'V': Venue, 'W': Work}
+
+
+def to_model(entity: dict, model: Optional[Type[_Model]] = None) -> _Model:
+    """ Convert an entity into its model.
+
+    Args:
+        entity (dict): dict from JSON describing an entity.
+        model (Optional[Type[_Model]]): model to convert to e.g. `Work`, optional.
+            If empty, the model is derived from the OpenAlex ID of the entity.
+
+    Returns:
+        model of the entity.
+
+    Raises:
+        ValueError: if the model can not be derived from the ID of the entity.
+    """
+    if model is None:
+        openalex_id = str(entity.get('id') or "").rsplit("/", 1)[-1]
+        model = MODELS.get(openalex_id[:1].upper())
+        if model is None:
+            raise ValueError(f"Can not derive model of entity with ID {entity.get('id')!r}. "
+                             "Select 'id' or specify the model.")
+    return model(entity)
+
+
+def to_models(items: Iterable[dict], model: Optional[Type[_Model]] = None) -> Iterator[_Model]:
+    """ Convert the entities of a list into their models.
+
+    Args:
+        items (Iterable[dict]): pages or single entities e.g. from `get_list_of_works`
+            or `iter_works`.
+        model (Optional[Type[_Model]]): model to convert to e.g. `Work`, optional.
+            If empty, the model is derived from the OpenAlex ID of every entity.
+
+    Returns:
+        Generator, each item the model of a single entity.
+    """
+    for item in items:
+        # pages hold their entities in 'results', single entities are converted as they are
+        entities = item['results'] if 'meta' in item and 'results' in item else [item]
+        for entity in entities:
+            yield to_model(entity, model)
@@ -1,24 +1,102 @@
 """This module wraps the OpenAlex API."""
-from typing import Optional, Iterable, List
+from functools import cached_property
+from typing import Optional, Iterable, List, Dict
 
 from diophila.api_caller import APICaller
+from diophila.cache import _BaseCache
+from diophila.citations import CitationCrawler, CitationGraph
+from diophila.cursor_index import _BaseCursorIndex
+from diophila.metrics import RequestHook
+from diophila.query import Query
+from diophila.rate_limiter import RateLimiter
+from diophila.transports import _BaseTransport
 from diophila.endpoints import Authors, Concepts, Institutions, Venues, Works
 
 
 class OpenAlex:
     """This class wraps the OpenAlex API."""
 
-    def __init__(self, email: Optional[str] = None) -> object:
+    def __init__(self, email: Optional[str] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 cache: Optional[_BaseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 hooks: Optional[List[RequestHook]] = None,
+                 transport: Optional[_BaseTransport] = None,
+                 cursor_index: Optional[_BaseCursorIndex] = None) -> object:
         """ Init wrapper, preferably with an email to get into the polite pool.
 
         Args:
             email (Optional[str]): email address of the user that will be added
                         in the request header to get into the polite pool, optional.
+            pool_connections (int): number of connection pools (one per host) to cache.
+            pool_maxsize (int): maximum number of connections kept alive per host.
+            keep_alive (bool): reuse connections between requests, defaults to True.
+            cache (Optional[_BaseCache]): cache for responses e.g. a ResponseCache
+                        or SQLiteCache, optional.
+                        Random entities are never cached.
+            rate_limiter (Optional[RateLimiter]): limiter pacing the requests to stay within
+                        the rate limits of the API, optional. Can be shared between clients.
+            hooks (Optional[List[RequestHook]]): hooks called at the start and end of every
+                        request e.g. a MetricsCollector, optional.
+            transport (Optional[_BaseTransport]): transport sending the requests e.g.
+                        an Urllib3Transport, HTTPXTransport or ReplayTransport, optional.
+                        Defaults to a pooled `requests` session, see `pool_connections`
+                        and `pool_maxsize`.
+            cursor_index (Optional[_BaseCursorIndex]): index recording the cursors of
+                        the pages of lists e.g. a CursorIndex or SQLiteCursorIndex, optional.
+                        Allows requesting pages beyond the first 10,000 results.
 
         Returns:
             object wrapping the OpenAlex API.
         """
-        self._api_caller = APICaller("https://api.openalex.org", email)
+        self._api_caller = APICaller("https://api.openalex.org", email,
+                                     pool_connections=pool_connections,
+                                     pool_maxsize=pool_maxsize,
+                                     keep_alive=keep_alive,
+                                     cache=cache,
+                                     rate_limiter=rate_limiter,
+                                     hooks=hooks,
+                                     transport=transport,
+                                     cursor_index=cursor_index)
+
+    def close(self) -> None:
+        """ Close all pooled connections to the API."""
+        self._api_caller.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Queries, validated and compiled once e.g. `openalex.works.filter(is_oa=True)`
+    @cached_property
+    def authors(self) -> Query:
+        """ Query of all authors, narrowed down by its `filter`, `search`, `sort`
+        and `select` methods. See `Query`."""
+        return Query(Authors(self._api_caller))
+
+    @cached_property
+    def concepts(self) -> Query:
+        """ Query of all concepts, see `authors`."""
+        return Query(Concepts(self._api_caller))
+
+    @cached_property
+    def institutions(self) -> Query:
+        """ Query of all institutions, see `authors`."""
+        return Query(Institutions(self._api_caller))
+
+    @cached_property
+    def venues(self) -> Query:
+        """ Query of all venues, see `authors`."""
+        return Query(Venues(self._api_caller))
+
+    @cached_property
+    def works(self) -> Query:
+        """ Query of all works, see `authors`."""
+        return Query(Works(self._api_caller))
 
     # Get single entity: Random
     def get_random_author(self) -> dict:
@@ -62,76 +140,194 @@ class OpenAlex:
         return Works(self._api_caller).get_random()
 
     # Get single entity: By ID
-    def get_single_author(self, id_value: str, id_type: Optional[str] = None) -> dict:
+    def get_single_author(self, id_value: str,
+                          id_type: Optional[str] = None,
+                          select: Optional[List[str]] = None) -> dict:
         """ Get single author by using an ID.
 
         Args:
             id_value (str): value of an ID identifying a specific author.
             id_type (Optional[str]): type of the specified id_value e.g. 'openalex', 'mag'.
                         Will be used as a namespace for the id_value. optional.
+            select (Optional[List[str]]): fields to return, optional.
+                        If empty, all fields are returned.
 
         Returns:
             JSON object from HTTP response containing a single author.
          """
-        return Authors(self._api_caller).get_single(id_value, id_type)
+        return Authors(self._api_caller).get_single(id_value, id_type, select)
 
-    def get_single_concept(self, id_value: str, id_type: Optional[str] = None) -> dict:
+    def get_single_concept(self, id_value: str,
+                           id_type: Optional[str] = None,
+                           select: Optional[List[str]] = None) -> dict:
         """ Get single concept by using an ID.
 
         Args:
             id_value (str): value of an ID identifying a specific concept.
             id_type (Optional[str]): type of the specified id_value e.g. 'openalex', 'mag'.
                         Will be used as a namespace for the id_value. optional.
+            select (Optional[List[str]]): fields to return, optional.
+                        If empty, all fields are returned.
 
         Returns:
             JSON object from HTTP response containing a single concept.
          """
-        return Concepts(self._api_caller).get_single(id_value, id_type)
+        return Concepts(self._api_caller).get_single(id_value, id_type, select)
 
-    def get_single_institution(self, id_value: str, id_type: Optional[str] = None) -> dict:
+    def get_single_institution(self, id_value: str,
+                               id_type: Optional[str] = None,
+                               select: Optional[List[str]] = None) -> dict:
         """ Get single institution by using an ID.
 
         Args:
             id_value (str): value of an ID identifying a specific institution.
             id_type (Optional[str]): type of the specified id_value e.g. 'openalex', 'mag'.
                         Will be used as a namespace for the id_value. optional.
+            select (Optional[List[str]]): fields to return, optional.
+                        If empty, all fields are returned.
 
         Returns:
             JSON object from HTTP response containing a single institution.
         """
-        return Institutions(self._api_caller).get_single(id_value, id_type)
+        return Institutions(self._api_caller).get_single(id_value, id_type, select)
 
-    def get_single_venue(self, id_value: str, id_type: Optional[str] = None) -> dict:
+    def get_single_venue(self, id_value: str,
+                         id_type: Optional[str] = None,
+                         select: Optional[List[str]] = None) -> dict:
         """ Get single venue by using an ID.
 
         Args:
             id_value (str): value of an ID identifying a specific venue.
             id_type (Optional[str]): type of the specified id_value e.g. 'openalex', 'mag'.
                         Will be used as a namespace for the id_value. optional.
+            select (Optional[List[str]]): fields to return, optional.
+                        If empty, all fields are returned.
 
         Returns:
             JSON object from HTTP response containing a single venue.
         """
-        return Venues(self._api_caller).get_single(id_value, id_type)
+        return Venues(self._api_caller).get_single(id_value, id_type, select)
 
-    def get_single_work(self, id_value: str, id_type: Optional[str] = None) -> dict:
+    def get_single_work(self, id_value: str,
+                        id_type: Optional[str] = None,
+                        select: Optional[List[str]] = None) -> dict:
         """ Get single work by using an ID.
 
         Args:
             id_value (str): value of an ID identifying a specific work.
             id_type (Optional[str]): type of the specified id_value e.g. 'openalex', 'mag'.
                         Will be used as a namespace for the id_value. optional.
+            select (Optional[List[str]]): fields to return, optional.
+                        If empty, all fields are returned.
 
         Returns:
             JSON object from HTTP response containing a single work.
         """
-        return Works(self._api_caller).get_single(id_value, id_type)
+        return Works(self._api_caller).get_single(id_value, id_type, select)
+
+    # Get many entities: By ID
+    def get_many_authors(self, id_values: Iterable[str],
+                         id_type: str = "openalex",
+                         workers: Optional[int] = None,
+                         select: Optional[List[str]] = None) -> Dict[str, Optional[dict]]:
+        """ Get many authors by using one of their IDs, fetching up to 50 authors per request.
+
+        Args:
+            id_values (Iterable[str]): values of IDs identifying authors.
+            id_type (str): type of the specified id_values, one of 'openalex', 'orcid'.
+                        Defaults to 'openalex'.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+            select (Optional[List[str]]): fields to return in addition to 'id' and 'ids', optional.
+                        If empty, all fields are returned.
+
+        Returns:
+            dict mapping each ID to the author it identifies or to None if it was not found.
+        """
+        return Authors(self._api_caller).get_many(id_values, id_type, workers, select)
+
+    def get_many_concepts(self, id_values: Iterable[str],
+                          id_type: str = "openalex",
+                          workers: Optional[int] = None,
+                          select: Optional[List[str]] = None) -> Dict[str, Optional[dict]]:
+        """ Get many concepts by using one of their IDs, fetching up to 50 concepts per request.
+
+        Args:
+            id_values (Iterable[str]): values of IDs identifying concepts.
+            id_type (str): type of the specified id_values, one of 'openalex', 'wikidata'.
+                        Defaults to 'openalex'.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+            select (Optional[List[str]]): fields to return in addition to 'id' and 'ids', optional.
+                        If empty, all fields are returned.
+
+        Returns:
+            dict mapping each ID to the concept it identifies or to None if it was not found.
+        """
+        return Concepts(self._api_caller).get_many(id_values, id_type, workers, select)
+
+    def get_many_institutions(self, id_values: Iterable[str],
+                              id_type: str = "openalex",
+                              workers: Optional[int] = None,
+                              select: Optional[List[str]] = None) -> Dict[str, Optional[dict]]:
+        """ Get many institutions by using one of their IDs,
+        fetching up to 50 institutions per request.
+
+        Args:
+            id_values (Iterable[str]): values of IDs identifying institutions.
+            id_type (str): type of the specified id_values, one of 'openalex', 'ror'.
+                        Defaults to 'openalex'.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+            select (Optional[List[str]]): fields to return in addition to 'id' and 'ids', optional.
+                        If empty, all fields are returned.
+
+        Returns:
+            dict mapping each ID to the institution it identifies or to None if it was not found.
+        """
+        return Institutions(self._api_caller).get_many(id_values, id_type, workers, select)
+
+    def get_many_venues(self, id_values: Iterable[str],
+                        id_type: str = "openalex",
+                        workers: Optional[int] = None,
+                        select: Optional[List[str]] = None) -> Dict[str, Optional[dict]]:
+        """ Get many venues by using one of their IDs, fetching up to 50 venues per request.
+
+        Args:
+            id_values (Iterable[str]): values of IDs identifying venues.
+            id_type (str): type of the specified id_values, one of 'openalex', 'issn'.
+                        Defaults to 'openalex'.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+            select (Optional[List[str]]): fields to return in addition to 'id' and 'ids', optional.
+                        If empty, all fields are returned.
+
+        Returns:
+            dict mapping each ID to the venue it identifies or to None if it was not found.
+        """
+        return Venues(self._api_caller).get_many(id_values, id_type, workers, select)
+
+    def get_many_works(self, id_values: Iterable[str],
+                       id_type: str = "openalex",
+                       workers: Optional[int] = None,
+                       select: Optional[List[str]] = None) -> Dict[str, Optional[dict]]:
+        """ Get many works by using one of their IDs, fetching up to 50 works per request.
+
+        Args:
+            id_values (Iterable[str]): values of IDs identifying works.
+            id_type (str): type of the specified id_values, one of 'openalex', 'doi', 'pmid', 'mag'.
+                        Defaults to 'openalex'.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+            select (Optional[List[str]]): fields to return in addition to 'id' and 'ids', optional.
+                        If empty, all fields are returned.
+
+        Returns:
+            dict mapping each ID to the work it identifies or to None if it was not found.
+        """
+        return Works(self._api_caller).get_many(id_values, id_type, workers, select)
 
     # Get groups of entities: group_by
     def get_groups_of_authors(self, group_by: str,
                               filters: Optional[dict] = None,
                               search: Optional[str] = None,
-                              sort: Optional[dict] = None) -> dict:
+                              sort: Optional[dict] = None,
+                              select: Optional[List[str]] = None) -> dict:
         """ Get author groups.
 
         Args:
@@ -144,6 +340,8 @@ class OpenAlex:
              If you only want results matching the exact phrase, enclose it in double quotes.
             sort (Optional[dict]): dictionary with properties to sort the groups of authors
              after grouping them, optional.
+            select (Optional[List[str]]): fields of each group to return
+             i.e. "key", "key_display_name" or "count", optional.
 
         Returns:
             JSON object from HTTP response containing groups of authors.
@@ -151,12 +349,14 @@ class OpenAlex:
         return Authors(self._api_caller).get_groups(group_by=group_by,
                                                     filters=filters,
                                                     search=search,
-                                                    sort=sort)
+                                                    sort=sort,
+                                                    select=select)
 
     def get_groups_of_concepts(self, group_by: str,
                                filters: Optional[dict] = None,
                                search: Optional[str] = None,
-                               sort: Optional[dict] = None) -> dict:
+                               sort: Optional[dict] = None,
+                               select: Optional[List[str]] = None) -> dict:
         """ Get concept groups.
 
         Args:
@@ -169,6 +369,8 @@ class OpenAlex:
              If you only want results matching the exact phrase, enclose it in double quotes.
             sort (Optional[dict]): dictionary with properties to sort the groups of concepts
              after grouping them, optional.
+            select (Optional[List[str]]): fields of each group to return
+             i.e. "key", "key_display_name" or "count", optional.
 
         Returns:
             JSON object from HTTP response containing groups of concepts.
@@ -176,12 +378,14 @@ class OpenAlex:
         return Concepts(self._api_caller).get_groups(group_by=group_by,
                                                      filters=filters,
                                                      search=search,
-                                                     sort=sort)
+                                                     sort=sort,
+                                                     select=select)
 
     def get_groups_of_institutions(self, group_by: str,
                                    filters: Optional[dict] = None,
                                    search: Optional[str] = None,
-                                   sort: Optional[dict] = None) -> dict:
+                                   sort: Optional[dict] = None,
+                                   select: Optional[List[str]] = None) -> dict:
         """ Get institution groups.
 
         Args:
@@ -194,6 +398,8 @@ class OpenAlex:
              If you only want results matching the exact phrase, enclose it in double quotes.
             sort (Optional[dict]): dictionary with properties to sort the groups of institutions
              after grouping them, optional.
+            select (Optional[List[str]]): fields of each group to return
+             i.e. "key", "key_display_name" or "count", optional.
 
         Returns:
             JSON object from HTTP response containing groups of institutions.
@@ -201,12 +407,14 @@ class OpenAlex:
         return Institutions(self._api_caller).get_groups(group_by=group_by,
                                                          filters=filters,
                                                          search=search,
-                                                         sort=sort)
+                                                         sort=sort,
+                                                         select=select)
 
     def get_groups_of_venues(self, group_by: str,
                              filters: Optional[dict] = None,
                              search: Optional[str] = None,
-                             sort: Optional[dict] = None) -> dict:
+                             sort: Optional[dict] = None,
+                             select: Optional[List[str]] = None) -> dict:
         """ Get venue groups.
 
         Args:
@@ -219,6 +427,8 @@ class OpenAlex:
              If you only want results matching the exact phrase, enclose it in double quotes.
             sort (Optional[dict]): dictionary with properties to sort the groups of venues
              after grouping them, optional.
+            select (Optional[List[str]]): fields of each group to return
+             i.e. "key", "key_display_name" or "count", optional.
 
         Returns:
             JSON object from HTTP response containing groups of venues.
@@ -226,12 +436,14 @@ class OpenAlex:
         return Venues(self._api_caller).get_groups(group_by=group_by,
                                                    filters=filters,
                                                    search=search,
-                                                   sort=sort)
+                                                   sort=sort,
+                                                   select=select)
 
     def get_groups_of_works(self, group_by: str,
                             filters: Optional[dict] = None,
                             search: Optional[str] = None,
-                            sort: Optional[dict] = None) -> dict:
+                            sort: Optional[dict] = None,
+                            select: Optional[List[str]] = None) -> dict:
         """ Get work groups.
 
         Args:
@@ -244,6 +456,8 @@ class OpenAlex:
              If you only want results matching the exact phrase, enclose it in double quotes.
             sort (Optional[dict]): dictionary with properties to sort the groups of works
              after grouping them, optional.
+            select (Optional[List[str]]): fields of each group to return
+             i.e. "key", "key_display_name" or "count", optional.
 
         Returns:
             JSON object from HTTP response containing groups of works.
@@ -251,14 +465,479 @@ class OpenAlex:
         return Works(self._api_caller).get_groups(group_by=group_by,
                                                   filters=filters,
                                                   search=search,
-                                                  sort=sort)
+                                                  sort=sort,
+                                                  select=select)
+
+    # Get all groups of entities: paginated and multi-facet group_by
+    def get_all_groups_of_authors(self, group_by: str,
+                                  filters: Optional[dict] = None,
+                                  search: Optional[str] = None) -> Dict[str, int]:
+        """ Get every group of authors, paging through the groups.
+
+        Args:
+            group_by (str): property used to construct groups.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            dict mapping the key of every group to its count.
+        """
+        return Authors(self._api_caller).get_all_groups(group_by, filters, search)
+
+    def get_facets_of_authors(self, group_by: Iterable[str],
+                              filters: Optional[dict] = None,
+                              search: Optional[str] = None,
+                              workers: Optional[int] = None,
+                              all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of authors for several facets at once.
+
+        Args:
+            group_by (Iterable[str]): properties used to construct groups, one per facet.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            workers (Optional[int]): number of facets requested concurrently, optional.
+            all_groups (bool): page through every group of each facet, defaults to True.
+
+        Returns:
+            dict mapping every facet to a dict mapping the key of every group to its count.
+        """
+        return Authors(self._api_caller).get_facets(group_by, filters, search,
+                                                    workers, all_groups)
+
+    def get_all_groups_of_concepts(self, group_by: str,
+                                   filters: Optional[dict] = None,
+                                   search: Optional[str] = None) -> Dict[str, int]:
+        """ Get every group of concepts, paging through the groups.
+
+        Args:
+            group_by (str): property used to construct groups.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            dict mapping the key of every group to its count.
+        """
+        return Concepts(self._api_caller).get_all_groups(group_by, filters, search)
+
+    def get_facets_of_concepts(self, group_by: Iterable[str],
+                               filters: Optional[dict] = None,
+                               search: Optional[str] = None,
+                               workers: Optional[int] = None,
+                               all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of concepts for several facets at once.
+
+        Args:
+            group_by (Iterable[str]): properties used to construct groups, one per facet.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            workers (Optional[int]): number of facets requested concurrently, optional.
+            all_groups (bool): page through every group of each facet, defaults to True.
+
+        Returns:
+            dict mapping every facet to a dict mapping the key of every group to its count.
+        """
+        return Concepts(self._api_caller).get_facets(group_by, filters, search,
+                                                     workers, all_groups)
+
+    def get_all_groups_of_institutions(self, group_by: str,
+                                       filters: Optional[dict] = None,
+                                       search: Optional[str] = None) -> Dict[str, int]:
+        """ Get every group of institutions, paging through the groups.
+
+        Args:
+            group_by (str): property used to construct groups.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            dict mapping the key of every group to its count.
+        """
+        return Institutions(self._api_caller).get_all_groups(group_by, filters, search)
+
+    def get_facets_of_institutions(self, group_by: Iterable[str],
+                                   filters: Optional[dict] = None,
+                                   search: Optional[str] = None,
+                                   workers: Optional[int] = None,
+                                   all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of institutions for several facets at once.
+
+        Args:
+            group_by (Iterable[str]): properties used to construct groups, one per facet.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            workers (Optional[int]): number of facets requested concurrently, optional.
+            all_groups (bool): page through every group of each facet, defaults to True.
+
+        Returns:
+            dict mapping every facet to a dict mapping the key of every group to its count.
+        """
+        return Institutions(self._api_caller).get_facets(group_by, filters, search,
+                                                         workers, all_groups)
+
+    def get_all_groups_of_venues(self, group_by: str,
+                                 filters: Optional[dict] = None,
+                                 search: Optional[str] = None) -> Dict[str, int]:
+        """ Get every group of venues, paging through the groups.
+
+        Args:
+            group_by (str): property used to construct groups.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            dict mapping the key of every group to its count.
+        """
+        return Venues(self._api_caller).get_all_groups(group_by, filters, search)
+
+    def get_facets_of_venues(self, group_by: Iterable[str],
+                             filters: Optional[dict] = None,
+                             search: Optional[str] = None,
+                             workers: Optional[int] = None,
+                             all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of venues for several facets at once.
+
+        Args:
+            group_by (Iterable[str]): properties used to construct groups, one per facet.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            workers (Optional[int]): number of facets requested concurrently, optional.
+            all_groups (bool): page through every group of each facet, defaults to True.
+
+        Returns:
+            dict mapping every facet to a dict mapping the key of every group to its count.
+        """
+        return Venues(self._api_caller).get_facets(group_by, filters, search,
+                                                   workers, all_groups)
+
+    def get_all_groups_of_works(self, group_by: str,
+                                filters: Optional[dict] = None,
+                                search: Optional[str] = None) -> Dict[str, int]:
+        """ Get every group of works, paging through the groups.
+
+        Args:
+            group_by (str): property used to construct groups.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            dict mapping the key of every group to its count.
+        """
+        return Works(self._api_caller).get_all_groups(group_by, filters, search)
+
+    def get_facets_of_works(self, group_by: Iterable[str],
+                            filters: Optional[dict] = None,
+                            search: Optional[str] = None,
+                            workers: Optional[int] = None,
+                            all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of works for several facets at once.
+
+        Args:
+            group_by (Iterable[str]): properties used to construct groups, one per facet.
+            filters (Optional[dict]): dictionary with properties to filter results
+             before grouping them, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            workers (Optional[int]): number of facets requested concurrently, optional.
+            all_groups (bool): page through every group of each facet, defaults to True.
+
+        Returns:
+            dict mapping every facet to a dict mapping the key of every group to its count.
+        """
+        return Works(self._api_caller).get_facets(group_by, filters, search,
+                                                  workers, all_groups)
+
+    # Count entities
+    def count_authors(self, filters: Optional[dict] = None,
+                      search: Optional[str] = None) -> int:
+        """ Count authors, requesting only a single ID instead of a whole page.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            int number of authors.
+        """
+        return Authors(self._api_caller).count(filters, search)
+
+    def count_many_authors(self, filters: Iterable[Optional[dict]],
+                           search: Optional[str] = None,
+                           workers: Optional[int] = None) -> List[int]:
+        """ Count authors for many combinations of filters, each distinct one counted once.
+
+        Args:
+            filters (Iterable[Optional[dict]]): dictionaries with properties to filter results.
+            search (Optional[str]): search string used for all counts, optional.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+                Defaults to 4.
+
+        Returns:
+            list of the numbers of authors, in the order of `filters`.
+        """
+        return Authors(self._api_caller).count_many(filters, search, workers)
+
+    def count_concepts(self, filters: Optional[dict] = None,
+                       search: Optional[str] = None) -> int:
+        """ Count concepts, requesting only a single ID instead of a whole page.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            int number of concepts.
+        """
+        return Concepts(self._api_caller).count(filters, search)
+
+    def count_many_concepts(self, filters: Iterable[Optional[dict]],
+                            search: Optional[str] = None,
+                            workers: Optional[int] = None) -> List[int]:
+        """ Count concepts for many combinations of filters, each distinct one counted once.
+
+        Args:
+            filters (Iterable[Optional[dict]]): dictionaries with properties to filter results.
+            search (Optional[str]): search string used for all counts, optional.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+                Defaults to 4.
+
+        Returns:
+            list of the numbers of concepts, in the order of `filters`.
+        """
+        return Concepts(self._api_caller).count_many(filters, search, workers)
+
+    def count_institutions(self, filters: Optional[dict] = None,
+                           search: Optional[str] = None) -> int:
+        """ Count institutions, requesting only a single ID instead of a whole page.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            int number of institutions.
+        """
+        return Institutions(self._api_caller).count(filters, search)
+
+    def count_many_institutions(self, filters: Iterable[Optional[dict]],
+                                search: Optional[str] = None,
+                                workers: Optional[int] = None) -> List[int]:
+        """ Count institutions for many combinations of filters, each distinct one counted once.
+
+        Args:
+            filters (Iterable[Optional[dict]]): dictionaries with properties to filter results.
+            search (Optional[str]): search string used for all counts, optional.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+                Defaults to 4.
+
+        Returns:
+            list of the numbers of institutions, in the order of `filters`.
+        """
+        return Institutions(self._api_caller).count_many(filters, search, workers)
+
+    def count_venues(self, filters: Optional[dict] = None,
+                     search: Optional[str] = None) -> int:
+        """ Count venues, requesting only a single ID instead of a whole page.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            int number of venues.
+        """
+        return Venues(self._api_caller).count(filters, search)
+
+    def count_many_venues(self, filters: Iterable[Optional[dict]],
+                          search: Optional[str] = None,
+                          workers: Optional[int] = None) -> List[int]:
+        """ Count venues for many combinations of filters, each distinct one counted once.
+
+        Args:
+            filters (Iterable[Optional[dict]]): dictionaries with properties to filter results.
+            search (Optional[str]): search string used for all counts, optional.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+                Defaults to 4.
+
+        Returns:
+            list of the numbers of venues, in the order of `filters`.
+        """
+        return Venues(self._api_caller).count_many(filters, search, workers)
+
+    def count_works(self, filters: Optional[dict] = None,
+                    search: Optional[str] = None) -> int:
+        """ Count works, requesting only a single ID instead of a whole page.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+
+        Returns:
+            int number of works.
+        """
+        return Works(self._api_caller).count(filters, search)
+
+    def count_many_works(self, filters: Iterable[Optional[dict]],
+                         search: Optional[str] = None,
+                         workers: Optional[int] = None) -> List[int]:
+        """ Count works for many combinations of filters, each distinct one counted once.
+
+        Args:
+            filters (Iterable[Optional[dict]]): dictionaries with properties to filter results.
+            search (Optional[str]): search string used for all counts, optional.
+            workers (Optional[int]): number of requests sent concurrently, optional.
+                Defaults to 4.
+
+        Returns:
+            list of the numbers of works, in the order of `filters`.
+        """
+        return Works(self._api_caller).count_many(filters, search, workers)
+
+    # Sample entities
+    def sample_authors(self, n: int,
+                       seed: Optional[int] = None,
+                       filters: Optional[dict] = None,
+                       search: Optional[str] = None,
+                       select: Optional[List[str]] = None,
+                       workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of `n` distinct authors, 200 per request.
+
+        Args:
+            n (int): number of authors to sample.
+            seed (Optional[int]): seed making the sample reproducible, optional.
+            filters (Optional[dict]): dictionary with properties to filter the authors
+                        sampled from, optional.
+            search (Optional[str]): search string to find the authors sampled from, optional.
+            select (Optional[List[str]]): fields of the authors to return, optional.
+            workers (Optional[int]): number of pages fetched concurrently, optional.
+
+        Returns:
+            list of dicts from JSON describing the authors, at most `n`.
+        """
+        return Authors(self._api_caller).sample(n, seed, filters, search, select, workers)
+
+    def sample_concepts(self, n: int,
+                        seed: Optional[int] = None,
+                        filters: Optional[dict] = None,
+                        search: Optional[str] = None,
+                        select: Optional[List[str]] = None,
+                        workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of `n` distinct concepts, 200 per request.
+
+        Args:
+            n (int): number of concepts to sample.
+            seed (Optional[int]): seed making the sample reproducible, optional.
+            filters (Optional[dict]): dictionary with properties to filter the concepts
+                        sampled from, optional.
+            search (Optional[str]): search string to find the concepts sampled from, optional.
+            select (Optional[List[str]]): fields of the concepts to return, optional.
+            workers (Optional[int]): number of pages fetched concurrently, optional.
+
+        Returns:
+            list of dicts from JSON describing the concepts, at most `n`.
+        """
+        return Concepts(self._api_caller).sample(n, seed, filters, search, select, workers)
+
+    def sample_institutions(self, n: int,
+                            seed: Optional[int] = None,
+                            filters: Optional[dict] = None,
+                            search: Optional[str] = None,
+                            select: Optional[List[str]] = None,
+                            workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of `n` distinct institutions, 200 per request.
+
+        Args:
+            n (int): number of institutions to sample.
+            seed (Optional[int]): seed making the sample reproducible, optional.
+            filters (Optional[dict]): dictionary with properties to filter the institutions
+                        sampled from, optional.
+            search (Optional[str]): search string to find the institutions sampled from, optional.
+            select (Optional[List[str]]): fields of the institutions to return, optional.
+            workers (Optional[int]): number of pages fetched concurrently, optional.
+
+        Returns:
+            list of dicts from JSON describing the institutions, at most `n`.
+        """
+        return Institutions(self._api_caller).sample(n, seed, filters, search, select, workers)
+
+    def sample_venues(self, n: int,
+                      seed: Optional[int] = None,
+                      filters: Optional[dict] = None,
+                      search: Optional[str] = None,
+                      select: Optional[List[str]] = None,
+                      workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of `n` distinct venues, 200 per request.
+
+        Args:
+            n (int): number of venues to sample.
+            seed (Optional[int]): seed making the sample reproducible, optional.
+            filters (Optional[dict]): dictionary with properties to filter the venues
+                        sampled from, optional.
+            search (Optional[str]): search string to find the venues sampled from, optional.
+            select (Optional[List[str]]): fields of the venues to return, optional.
+            workers (Optional[int]): number of pages fetched concurrently, optional.
+
+        Returns:
+            list of dicts from JSON describing the venues, at most `n`.
+        """
+        return Venues(self._api_caller).sample(n, seed, filters, search, select, workers)
+
+    def sample_works(self, n: int,
+                     seed: Optional[int] = None,
+                     filters: Optional[dict] = None,
+                     search: Optional[str] = None,
+                     select: Optional[List[str]] = None,
+                     workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of `n` distinct works, 200 per request.
+
+        Args:
+            n (int): number of works to sample.
+            seed (Optional[int]): seed making the sample reproducible, optional.
+            filters (Optional[dict]): dictionary with properties to filter the works
+                        sampled from, optional.
+            search (Optional[str]): search string to find the works sampled from, optional.
+            select (Optional[List[str]]): fields of the works to return, optional.
+            workers (Optional[int]): number of pages fetched concurrently, optional.
+
+        Returns:
+            list of dicts from JSON describing the works, at most `n`.
+        """
+        return Works(self._api_caller).sample(n, seed, filters, search, select, workers)
 
     # Get list of entities
     def get_list_of_authors(self, filters: Optional[dict] = None,
                             search: Optional[str] = None,
                             sort: Optional[dict] = None,
                             per_page: Optional[int] = None,
-                            pages: Optional[List[int]] = None) -> Iterable[dict]:
+                            pages: Optional[List[int]] = None,
+                            workers: Optional[int] = None,
+                            stream: bool = False,
+                            select: Optional[List[str]] = None,
+                            checkpoint: Optional[str] = None,
+                            resume: bool = False,
+                            shard_by: Optional[str] = None) -> Iterable[dict]:
         """ Get list of authors.
 
         Args:
@@ -272,21 +951,48 @@ class OpenAlex:
                                       Needs to be between [1;200]
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
                 If empty, cursor pagination will be used.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+                When sharding, number of shards harvested concurrently.
+            stream (bool): yield single entities, decoding each page incrementally,
+                instead of whole pages. Defaults to False.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+            shard_by (Optional[str]): filter attribute e.g. 'publication_year' used to split
+                the list into disjoint shards, that are cursor paged concurrently, optional.
+                Pages (or entities) of different shards are interleaved.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of works.
+            Generator, each item a dict from JSON representing a (partial) list of works,
+            or a single entity if `stream` is set.
         """
         return Authors(self._api_caller).get_list(filters=filters,
                                                   search=search,
                                                   sort=sort,
                                                   per_page=per_page,
-                                                  pages=pages)
+                                                  pages=pages,
+                                                  workers=workers,
+                                                  stream=stream,
+                                                  select=select,
+                                                  checkpoint=checkpoint,
+                                                  resume=resume,
+                                                  shard_by=shard_by)
 
     def get_list_of_concepts(self, filters: Optional[dict] = None,
                              search: Optional[str] = None,
                              sort: Optional[dict] = None,
                              per_page: Optional[int] = None,
-                             pages: Optional[List[int]] = None) -> Iterable[dict]:
+                             pages: Optional[List[int]] = None,
+                             workers: Optional[int] = None,
+                             stream: bool = False,
+                             select: Optional[List[str]] = None,
+                             checkpoint: Optional[str] = None,
+                             resume: bool = False,
+                             shard_by: Optional[str] = None) -> Iterable[dict]:
         """ Get list of concepts.
 
         Args:
@@ -300,21 +1006,48 @@ class OpenAlex:
                                       Needs to be between [1;200]
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
                 If empty, cursor pagination will be used.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+                When sharding, number of shards harvested concurrently.
+            stream (bool): yield single entities, decoding each page incrementally,
+                instead of whole pages. Defaults to False.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+            shard_by (Optional[str]): filter attribute e.g. 'publication_year' used to split
+                the list into disjoint shards, that are cursor paged concurrently, optional.
+                Pages (or entities) of different shards are interleaved.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of works.
+            Generator, each item a dict from JSON representing a (partial) list of works,
+            or a single entity if `stream` is set.
         """
         return Concepts(self._api_caller).get_list(filters=filters,
                                                    search=search,
                                                    sort=sort,
                                                    per_page=per_page,
-                                                   pages=pages)
+                                                   pages=pages,
+                                                   workers=workers,
+                                                   stream=stream,
+                                                   select=select,
+                                                   checkpoint=checkpoint,
+                                                   resume=resume,
+                                                   shard_by=shard_by)
 
     def get_list_of_institutions(self, filters: Optional[dict] = None,
                                  search: Optional[str] = None,
                                  sort: Optional[dict] = None,
                                  per_page: Optional[int] = None,
-                                 pages: Optional[List[int]] = None) -> Iterable[dict]:
+                                 pages: Optional[List[int]] = None,
+                                 workers: Optional[int] = None,
+                                 stream: bool = False,
+                                 select: Optional[List[str]] = None,
+                                 checkpoint: Optional[str] = None,
+                                 resume: bool = False,
+                                 shard_by: Optional[str] = None) -> Iterable[dict]:
         """ Get list of institutions.
 
         Args:
@@ -328,21 +1061,48 @@ class OpenAlex:
                                       Needs to be between [1;200]
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
                 If empty, cursor pagination will be used.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+                When sharding, number of shards harvested concurrently.
+            stream (bool): yield single entities, decoding each page incrementally,
+                instead of whole pages. Defaults to False.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+            shard_by (Optional[str]): filter attribute e.g. 'publication_year' used to split
+                the list into disjoint shards, that are cursor paged concurrently, optional.
+                Pages (or entities) of different shards are interleaved.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of works.
+            Generator, each item a dict from JSON representing a (partial) list of works,
+            or a single entity if `stream` is set.
         """
         return Institutions(self._api_caller).get_list(filters=filters,
                                                        search=search,
                                                        sort=sort,
                                                        per_page=per_page,
-                                                       pages=pages)
+                                                       pages=pages,
+                                                       workers=workers,
+                                                       stream=stream,
+                                                       select=select,
+                                                       checkpoint=checkpoint,
+                                                       resume=resume,
+                                                       shard_by=shard_by)
 
     def get_list_of_venues(self, filters: Optional[dict] = None,
                            search: Optional[str] = None,
                            sort: Optional[dict] = None,
                            per_page: Optional[int] = None,
-                           pages: Optional[List[int]] = None) -> Iterable[dict]:
+                           pages: Optional[List[int]] = None,
+                           workers: Optional[int] = None,
+                           stream: bool = False,
+                           select: Optional[List[str]] = None,
+                           checkpoint: Optional[str] = None,
+                           resume: bool = False,
+                           shard_by: Optional[str] = None) -> Iterable[dict]:
         """ Get list of venues.
 
         Args:
@@ -356,21 +1116,48 @@ class OpenAlex:
                                       Needs to be between [1;200]
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
                 If empty, cursor pagination will be used.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+                When sharding, number of shards harvested concurrently.
+            stream (bool): yield single entities, decoding each page incrementally,
+                instead of whole pages. Defaults to False.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+            shard_by (Optional[str]): filter attribute e.g. 'publication_year' used to split
+                the list into disjoint shards, that are cursor paged concurrently, optional.
+                Pages (or entities) of different shards are interleaved.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of works.
+            Generator, each item a dict from JSON representing a (partial) list of works,
+            or a single entity if `stream` is set.
         """
         return Venues(self._api_caller).get_list(filters=filters,
                                                  search=search,
                                                  sort=sort,
                                                  per_page=per_page,
-                                                 pages=pages)
+                                                 pages=pages,
+                                                 workers=workers,
+                                                 stream=stream,
+                                                 select=select,
+                                                 checkpoint=checkpoint,
+                                                 resume=resume,
+                                                 shard_by=shard_by)
 
     def get_list_of_works(self, filters: Optional[dict] = None,
                           search: Optional[str] = None,
                           sort: Optional[dict] = None,
                           per_page: Optional[int] = None,
-                          pages: Optional[List[int]] = None) -> Iterable[dict]:
+                          pages: Optional[List[int]] = None,
+                          workers: Optional[int] = None,
+                          stream: bool = False,
+                          select: Optional[List[str]] = None,
+                          checkpoint: Optional[str] = None,
+                          resume: bool = False,
+                          shard_by: Optional[str] = None) -> Iterable[dict]:
         """ Get list of works.
 
         Args:
@@ -384,20 +1171,217 @@ class OpenAlex:
                                       Needs to be between [1;200]
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
                 If empty, cursor pagination will be used.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+                When sharding, number of shards harvested concurrently.
+            stream (bool): yield single entities, decoding each page incrementally,
+                instead of whole pages. Defaults to False.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+            shard_by (Optional[str]): filter attribute e.g. 'publication_year' used to split
+                the list into disjoint shards, that are cursor paged concurrently, optional.
+                Pages (or entities) of different shards are interleaved.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of works.
+            Generator, each item a dict from JSON representing a (partial) list of works,
+            or a single entity if `stream` is set.
         """
         return Works(self._api_caller).get_list(filters=filters,
                                                 search=search,
                                                 sort=sort,
                                                 per_page=per_page,
-                                                pages=pages)
+                                                pages=pages,
+                                                workers=workers,
+                                                stream=stream,
+                                                select=select,
+                                                checkpoint=checkpoint,
+                                                resume=resume,
+                                                shard_by=shard_by)
+
+    # Iterate over entities of a list
+    def iter_authors(self, filters: Optional[dict] = None,
+                     search: Optional[str] = None,
+                     sort: Optional[dict] = None,
+                     per_page: Optional[int] = None,
+                     pages: Optional[List[int]] = None,
+                     prefetch_depth: int = 2,
+                     select: Optional[List[str]] = None) -> Iterable[dict]:
+        """ Iterate over single authors, fetching the next pages in the background
+        while the authors of the current page are processed.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            sort (Optional[dict]): dictionary with properties to sort entities, optional.
+            per_page (Optional[int]): number of entities per page, defaults to 25.
+                                      Needs to be between [1;200]
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single author.
+        """
+        return Authors(self._api_caller).iter_list(filters=filters,
+                                                   search=search,
+                                                   sort=sort,
+                                                   per_page=per_page,
+                                                   pages=pages,
+                                                   prefetch_depth=prefetch_depth,
+                                                   select=select)
+
+    def iter_concepts(self, filters: Optional[dict] = None,
+                      search: Optional[str] = None,
+                      sort: Optional[dict] = None,
+                      per_page: Optional[int] = None,
+                      pages: Optional[List[int]] = None,
+                      prefetch_depth: int = 2,
+                      select: Optional[List[str]] = None) -> Iterable[dict]:
+        """ Iterate over single concepts, fetching the next pages in the background
+        while the concepts of the current page are processed.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            sort (Optional[dict]): dictionary with properties to sort entities, optional.
+            per_page (Optional[int]): number of entities per page, defaults to 25.
+                                      Needs to be between [1;200]
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single concept.
+        """
+        return Concepts(self._api_caller).iter_list(filters=filters,
+                                                    search=search,
+                                                    sort=sort,
+                                                    per_page=per_page,
+                                                    pages=pages,
+                                                    prefetch_depth=prefetch_depth,
+                                                    select=select)
+
+    def iter_institutions(self, filters: Optional[dict] = None,
+                          search: Optional[str] = None,
+                          sort: Optional[dict] = None,
+                          per_page: Optional[int] = None,
+                          pages: Optional[List[int]] = None,
+                          prefetch_depth: int = 2,
+                          select: Optional[List[str]] = None) -> Iterable[dict]:
+        """ Iterate over single institutions, fetching the next pages in the background
+        while the institutions of the current page are processed.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            sort (Optional[dict]): dictionary with properties to sort entities, optional.
+            per_page (Optional[int]): number of entities per page, defaults to 25.
+                                      Needs to be between [1;200]
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single institution.
+        """
+        return Institutions(self._api_caller).iter_list(filters=filters,
+                                                        search=search,
+                                                        sort=sort,
+                                                        per_page=per_page,
+                                                        pages=pages,
+                                                        prefetch_depth=prefetch_depth,
+                                                        select=select)
+
+    def iter_venues(self, filters: Optional[dict] = None,
+                    search: Optional[str] = None,
+                    sort: Optional[dict] = None,
+                    per_page: Optional[int] = None,
+                    pages: Optional[List[int]] = None,
+                    prefetch_depth: int = 2,
+                    select: Optional[List[str]] = None) -> Iterable[dict]:
+        """ Iterate over single venues, fetching the next pages in the background
+        while the venues of the current page are processed.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            sort (Optional[dict]): dictionary with properties to sort entities, optional.
+            per_page (Optional[int]): number of entities per page, defaults to 25.
+                                      Needs to be between [1;200]
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single venue.
+        """
+        return Venues(self._api_caller).iter_list(filters=filters,
+                                                  search=search,
+                                                  sort=sort,
+                                                  per_page=per_page,
+                                                  pages=pages,
+                                                  prefetch_depth=prefetch_depth,
+                                                  select=select)
+
+    def iter_works(self, filters: Optional[dict] = None,
+                   search: Optional[str] = None,
+                   sort: Optional[dict] = None,
+                   per_page: Optional[int] = None,
+                   pages: Optional[List[int]] = None,
+                   prefetch_depth: int = 2,
+                   select: Optional[List[str]] = None) -> Iterable[dict]:
+        """ Iterate over single works, fetching the next pages in the background
+        while the works of the current page are processed.
+
+        Args:
+            filters (Optional[dict]): dictionary with properties to filter results, optional.
+            search (Optional[str]): search string to find results that match
+             a given text search, optional.
+            sort (Optional[dict]): dictionary with properties to sort entities, optional.
+            per_page (Optional[int]): number of entities per page, defaults to 25.
+                                      Needs to be between [1;200]
+            pages (Optional[List[int]]): list of page numbers to query from API, optional.
+                If empty, cursor pagination will be used.
+            prefetch_depth (int): maximum number of pages fetched ahead, defaults to 2.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single work.
+        """
+        return Works(self._api_caller).iter_list(filters=filters,
+                                                 search=search,
+                                                 sort=sort,
+                                                 per_page=per_page,
+                                                 pages=pages,
+                                                 prefetch_depth=prefetch_depth,
+                                                 select=select)
 
     # Convenience method to retrieve works referenced by another entity
     def get_works_by_api_url(self, works_api_url:str,
                           per_page: Optional[int] = None,
-                          pages: Optional[List[int]] = None):
+                          pages: Optional[List[int]] = None,
+                          workers: Optional[int] = None,
+                          stream: bool = False,
+                          select: Optional[List[str]] = None,
+                          checkpoint: Optional[str] = None,
+                          resume: bool = False):
         """ Get list of works via another entity's `works_api_url` property.
 
         Args:
@@ -406,8 +1390,44 @@ class OpenAlex:
                 Needs to be between [1;200].
             pages (Optional[List[int]]): list of page numbers to query from API, optional.
                 If empty, cursor pagination will be used.
+            workers (Optional[int]): number of pages fetched concurrently when using
+                basic paging, optional. Pages are still yielded in the requested order.
+            stream (bool): yield single entities, decoding each page incrementally,
+                instead of whole pages. Defaults to False.
+            select (Optional[List[str]]): fields of the entities to return, optional.
+                If empty, all fields are returned.
+            checkpoint (Optional[str]): path to a file the progress of cursor pagination
+                is saved in after every page, optional.
+            resume (bool): continue from the progress saved in `checkpoint` instead of
+                starting from the first page, defaults to False.
+
+        Returns:
+            Generator, each item a dict from JSON representing a (partial) list of works,
+            or a single entity if `stream` is set.
+        """
+        return Works(self._api_caller).get_by_api_url(works_api_url, per_page, pages,
+                                                      workers, stream, select,
+                                                      checkpoint, resume)
+
+    # Crawl the citation graph around works
+    def crawl_citations(self, seed_ids: Iterable[str],
+                        depth: int = 1,
+                        direction: str = "both",
+                        workers: int = 4,
+                        max_nodes: Optional[int] = None) -> CitationGraph:
+        """ Crawl the citation graph around works, following their references
+        and/or the works citing them.
+
+        Args:
+            seed_ids (Iterable[str]): OpenAlex IDs of the works to start from.
+            depth (int): number of levels to expand, defaults to 1.
+            direction (str): 'references', 'cited_by' or 'both', defaults to 'both'.
+            workers (int): number of requests sent concurrently, defaults to 4.
+            max_nodes (Optional[int]): maximum number of works in the graph, optional.
 
         Returns:
-            Generator, each item a dict from JSON representing a (partial) list of works.
+            CitationGraph in CSR format with integer node numbers,
+            edges point from the citing to the cited work.
         """
-        return Works(self._api_caller).get_by_api_url(works_api_url, per_page, pages)
+        return CitationCrawler(self._api_caller, workers).crawl(seed_ids, depth, direction,
+                                                                max_nodes)
@@ -0,0 +1,182 @@
+"""This module overlaps fetching results from the OpenAlex API with processing them."""
+import asyncio
+import queue
+import threading
+from typing import Iterable, Iterator, AsyncIterable, AsyncIterator
+
+from diophila.checkpoint import CheckpointedItems
+
+# marks the end of the prefetched items
+_DONE = object()
+
+
+class _Failure:
+    """Wraps an exception raised while prefetching, to re-raise it in the consumer."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def _put(items: queue.Queue, stop: threading.Event, item) -> bool:
+    """Put an item into the queue, giving up once the consumer stopped."""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def prefetch(iterable: Iterable, depth: int = 2) -> Iterator:
+    """ Iterate `iterable` in a background thread, staying up to `depth` items ahead
+    of the consumer. Exceptions are re-raised in the consumer.
+
+    Args:
+        iterable (Iterable): iterable to consume in the background e.g. a generator of pages.
+        depth (int): maximum number of items fetched ahead, bounding memory usage.
+
+    Returns:
+        Generator yielding the items of `iterable` in order.
+        Items of a harvest with a checkpoint are not fetched ahead, so that the
+        checkpoint never moves past items the consumer has not handled yet.
+    """
+    if isinstance(iterable, CheckpointedItems):
+        yield from iterable
+        return
+    items = queue.Queue(maxsize=max(depth, 1))
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in iterable:
+                if not _put(items, stop, item):
+                    return
+        except BaseException as exception:  # pylint: disable=broad-except
+            _put(items, stop, _Failure(exception))
+            return
+        _put(items, stop, _DONE)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        stop.set()
+
+
+def merge(iterables: Iterable[Iterable], workers: int = 4, depth: int = 2) -> Iterator:
+    """ Iterate several iterables in up to `workers` background threads at once,
+    yielding their items as soon as they arrive. Items of the same iterable keep
+    their order, items of different iterables are interleaved.
+    Exceptions are re-raised in the consumer.
+
+    Args:
+        iterables (Iterable[Iterable]): iterables to consume in the background
+            e.g. generators of pages. Each one is consumed by a single thread.
+        workers (int): maximum number of iterables consumed at the same time.
+        depth (int): maximum number of items fetched ahead per worker, bounding memory usage.
+
+    Returns:
+        Generator yielding the items of all `iterables`.
+    """
+    workers = max(workers, 1)
+    items = queue.Queue(maxsize=max(depth, 1) * workers)
+    stop = threading.Event()
+    pending = iter(iterables)
+    lock = threading.Lock()
+
+    def produce():
+        try:
+            while True:
+                with lock:
+                    iterable = next(pending, _DONE)
+                if iterable is _DONE:
+                    break
+                for item in iterable:
+                    if not _put(items, stop, item):
+                        return
+        except BaseException as exception:  # pylint: disable=broad-except
+            _put(items, stop, _Failure(exception))
+            return
+        _put(items, stop, _DONE)
+
+    for _ in range(workers):
+        threading.Thread(target=produce, daemon=True).start()
+    try:
+        running = workers
+        while running:
+            item = items.get()
+            if item is _DONE:
+                running -= 1
+                continue
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        stop.set()
+
+
+async def aprefetch(iterable: AsyncIterable, depth: int = 2) -> AsyncIterator:
+    """ Async counterpart of `prefetch`, iterating `iterable` in a background task."""
+    items = asyncio.Queue(maxsize=max(depth, 1))
+
+    async def produce():
+        try:
+            async for item in iterable:
+                await items.put(item)
+        except Exception as exception:  # pylint: disable=broad-except
+            await items.put(_Failure(exception))
+            return
+        await items.put(_DONE)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        task.cancel()
+
+
+async def amerge(iterables: Iterable[AsyncIterable], workers: int = 4,
+                 depth: int = 2) -> AsyncIterator:
+    """ Async counterpart of `merge`, iterating `iterables` in up to `workers` background tasks."""
+    workers = max(workers, 1)
+    items = asyncio.Queue(maxsize=max(depth, 1) * workers)
+    pending = iter(iterables)
+
+    async def produce():
+        try:
+            for iterable in pending:
+                async for item in iterable:
+                    await items.put(item)
+        except Exception as exception:  # pylint: disable=broad-except
+            await items.put(_Failure(exception))
+            return
+        await items.put(_DONE)
+
+    tasks = [asyncio.ensure_future(produce()) for _ in range(workers)]
+    try:
+        running = workers
+        while running:
+            item = await items.get()
+            if item is _DONE:
+                running -= 1
+                continue
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,378 @@
+"""This module offers reusable queries, validated and compiled once into their parameters."""
+# queries run through the methods of endpoints taking validated parameters
+# pylint: disable=protected-access
+from typing import Optional, List, Iterable, Tuple, Dict
+from urllib.parse import urlencode
+
+from diophila.endpoints import _Endpoint
+
+
+class FilterValue(str):
+    """Value of a filter passed on as it is, created by `not_`, `gt`, `lt` and `between`."""
+
+
+def not_(value) -> FilterValue:
+    """ Negate the value of a filter e.g. `{'type': not_("paratext")}`."""
+    return FilterValue(f"!{_format_value(value)}")
+
+
+def gt(value) -> FilterValue:
+    """ Match values greater than `value` e.g. `{'cited_by_count': gt(100)}`."""
+    return FilterValue(f">{_format_value(value)}")
+
+
+def lt(value) -> FilterValue:
+    """ Match values less than `value` e.g. `{'cited_by_count': lt(100)}`."""
+    return FilterValue(f"<{_format_value(value)}")
+
+
+def between(low, high) -> FilterValue:
+    """ Match values from `low` to `high` (inclusive)
+    e.g. `{'publication_year': between(2010, 2015)}`."""
+    return FilterValue(f"{_format_value(low)}-{_format_value(high)}")
+
+
+def _format_value(value) -> str:
+    """Helper function formatting a single value of a filter."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+class Query:
+    """Query of a list of entities, built step by step:
+
+        query = openalex.works.filter(publication_year=2020).sort(cited_by_count="desc")
+        for page in query.get_list(per_page=200):
+            ...
+
+    Every step validates its arguments and returns a new query, so that a query
+    can be reused (and shared between threads) without validating or building
+    its parameters again. Queries are hashable and equal if they compile to
+    the same path and parameters, regardless of the order filters were added in.
+    """
+
+    __slots__ = ("endpoint", "_filters", "_search", "_sort", "_select", "_params", "_key",
+                 "_error")
+
+    def __init__(self, endpoint: _Endpoint,
+                 filters: Tuple[Tuple[str, str], ...] = (),
+                 search: Optional[str] = None,
+                 sort: Tuple[Tuple[str, str], ...] = (),
+                 select: Tuple[str, ...] = ()):
+        """ Init query. Use the properties of `OpenAlex` e.g. `openalex.works` instead.
+
+        Args:
+            endpoint (_Endpoint): endpoint the query is sent to.
+            filters (Tuple[Tuple[str, str], ...]): validated (attribute, value) pairs.
+            search (Optional[str]): search string, optional.
+            sort (Tuple[Tuple[str, str], ...]): validated (attribute, direction) pairs.
+            select (Tuple[str, ...]): validated fields of the entities to return.
+        """
+        self.endpoint = endpoint
+        # filters are combined with AND, sort them to keep the query canonical
+        self._filters = tuple(sorted(set(filters)))
+        self._search = search
+        self._sort = sort
+        self._select = select
+        # sorting by relevance depends on the search, which may be added after sorting,
+        # so it is validated now but only raised when running the query
+        self._error = self.__validate_relevance_score()
+        self._params = {'filter': ",".join(f"{key}:{value}" for key, value in self._filters)
+                                  or None,
+                        'search': search,
+                        'sort': ",".join(f"{key}:{value}" for key, value in sort) or None,
+                        'select': ",".join(select) or None}
+        self._key = (endpoint.name, tuple(self._params.items()))
+
+    # --------------------------------------------------------------------------
+    # ------------------------------ BUILD METHODS -----------------------------
+    def filter(self, filters: Optional[dict] = None, **kwargs) -> "Query":
+        """ Add filters, combined with AND with the existing ones.
+
+        Args:
+            filters (Optional[dict]): dict mapping filter attributes to values, optional.
+                Needed for attributes containing a dot e.g. 'display_name.search'.
+                Values can be strings, numbers, booleans, None (matching 'null'),
+                a list, tuple or set of values (combined with OR)
+                or created by `not_`, `gt`, `lt` and `between`.
+            kwargs: filter attributes mapped to values, same as `filters`.
+
+        Returns:
+            Query with the filters added.
+
+        Raises:
+            ValueError: if a key is not a filter attribute of the endpoint.
+                        if more than `OR_VALUES_MAX` values are combined with OR.
+        """
+        filters = {**(filters or {}), **kwargs}
+        if not self.endpoint.filter_keys.issuperset(filters):
+            raise ValueError("Value for 'filter' key not valid."
+                             f"Valid filter keys are {','.join(self.endpoint.filter_attrs)}.")
+        added = tuple((key, self.__compile_filter_value(value)) for key, value in filters.items())
+        return self.__replace(filters=self._filters + added)
+
+    def search(self, search: str) -> "Query":
+        """ Search the entities for a text, replacing any previous search string.
+
+        Args:
+            search (str): search string to find results that match a given text search.
+             If you search for a multiple-word phrase, OpenAlex will treat each word separately.
+             If you only want results matching the exact phrase, enclose it in double quotes.
+
+        Returns:
+            Query with the search string set.
+        """
+        return self.__replace(search=search)
+
+    def sort(self, sort: Optional[dict] = None, **kwargs) -> "Query":
+        """ Sort the entities, appending to the existing sort attributes.
+        Sorting by an attribute again replaces its direction, keeping its position.
+
+        Args:
+            sort (Optional[dict]): dict mapping sort attributes to 'asc' or 'desc', optional.
+            kwargs: sort attributes mapped to directions, same as `sort`.
+
+        Returns:
+            Query with the sort attributes added.
+
+        Raises:
+            ValueError: if a key is not a sort attribute or a value not 'asc' or 'desc'.
+        """
+        sort = {**(sort or {}), **kwargs}
+        if (not self.endpoint.sortable_keys.issuperset(sort)
+                or not self.endpoint.sortable_drctns_keys.issuperset(sort.values())):
+            raise ValueError("Item for sorting dict not valid.\n"
+                             f"Valid sorting keys are {','.join(self.endpoint.sortable_attrs)} "
+                             f"and valid sorting values are "
+                             f"{','.join(self.endpoint.sortable_drctns)}.")
+        return self.__replace(sort=tuple({**dict(self._sort), **sort}.items()))
+
+    def select(self, *fields: str) -> "Query":
+        """ Select the fields of the entities to return, replacing any previous selection.
+
+        Args:
+            fields (str): fields of the entities to return. If empty, all fields are returned.
+
+        Returns:
+            Query with the fields selected.
+
+        Raises:
+            ValueError: if a field is not selectable for the endpoint.
+        """
+        self.endpoint._build_select_param(fields, self.endpoint.selectable_attrs,
+                                          self.endpoint.selectable_keys)
+        return self.__replace(select=tuple(fields))
+
+    # --------------------------------------------------------------------------
+    # ----------------------------- QUERY  METHODS -----------------------------
+    def get_list(self, per_page: Optional[int] = None,
+                 pages: Optional[List[int]] = None,
+                 workers: Optional[int] = None,
+                 stream: bool = False,
+                 checkpoint: Optional[str] = None,
+                 resume: bool = False,
+                 shard_by: Optional[str] = None) -> Iterable[dict]:
+        """ Get the list of entities matching the query.
+
+        Args:
+            same as `get_list` of the endpoint, without the arguments built into the query.
+
+        Returns:
+            Generator, each item a dict from JSON representing a (partial) list of entities,
+            or a single entity if `stream` is set.
+
+        Raises:
+            ValueError: if sorting by 'relevance_score' without search or ascending.
+                        same as `get_list` of the endpoint otherwise.
+        """
+        if self._error:
+            raise ValueError(self._error)
+        return self.endpoint._get_list(self._params, per_page, pages, workers, stream,
+                                       checkpoint, resume, shard_by)
+
+    def iter_list(self, per_page: Optional[int] = None,
+                  pages: Optional[List[int]] = None,
+                  prefetch_depth: int = 2) -> Iterable[dict]:
+        """ Iterate over single entities matching the query, fetching the next pages
+        in the background.
+
+        Args:
+            same as `iter_list` of the endpoint, without the arguments built into the query.
+
+        Returns:
+            Generator, each item a dict from JSON representing a single entity.
+
+        Raises:
+            ValueError: if sorting by 'relevance_score' without search or ascending.
+        """
+        if self._error:
+            raise ValueError(self._error)
+        return self.endpoint.api_caller.iter_all(self.endpoint.name, self.params,
+                                                 per_page, pages, prefetch_depth)
+
+    def count(self) -> int:
+        """ Count the entities matching the query, requesting only a single ID.
+
+        Returns:
+            int number of entities matching the query.
+        """
+        return self.endpoint._count(self._params)
+
+    def sample(self, n: int,
+               seed: Optional[int] = None,
+               workers: Optional[int] = None) -> List[dict]:
+        """ Get a random sample of `n` distinct entities matching the query.
+        The sort attributes of the query are not used.
+
+        Args:
+            same as `sample` of the endpoint, without the arguments built into the query.
+
+        Returns:
+            list of dicts from JSON describing the entities, at most `n`.
+        """
+        return self.endpoint._sample(self._params, n, seed, workers)
+
+    def get_groups(self, group_by: str,
+                   sort: Optional[dict] = None,
+                   select: Optional[List[str]] = None) -> dict:
+        """ Get the entities matching the query grouped into facets.
+        The sort attributes and selected fields of the query are not used.
+
+        Args:
+            group_by (str): property used to construct groups.
+            sort (Optional[dict]): dictionary with properties to sort the groups, optional.
+            select (Optional[List[str]]): fields of each group to return
+             i.e. "key", "key_display_name" or "count", optional.
+
+        Returns:
+            dict from JSON representing the grouped entities.
+
+        Raises:
+            ValueError: same as `get_groups` of the endpoint.
+        """
+        params = self.__build_groups_params(group_by)
+        # validate sort and select of the groups without sending a request
+        if sort and (not self.endpoint.sortable_keys_for_groups.issuperset(sort)
+                     or not self.endpoint.sortable_drctns_keys.issuperset(sort.values())):
+            raise ValueError("Item for sorting dict not valid.\n"
+                             "Valid sorting keys are "
+                             f"{','.join(self.endpoint.sortable_attrs_for_groups)} "
+                             f"and valid sorting values are "
+                             f"{','.join(self.endpoint.sortable_drctns)}.")
+        if select:
+            self.endpoint._build_select_param(select, self.endpoint.selectable_attrs_for_groups,
+                                              self.endpoint.selectable_keys_for_groups)
+        params['sort'] = ",".join(f"{key}:{value}" for key, value in (sort or {}).items()) or None
+        return self.endpoint._get_groups(params, select)
+
+    def get_all_groups(self, group_by: str) -> Dict[str, int]:
+        """ Get every group of a facet of the entities matching the query,
+        paging through the groups with a cursor.
+
+        Args:
+            group_by (str): property used to construct groups.
+
+        Returns:
+            dict mapping the key of every group to its count.
+
+        Raises:
+            ValueError: if `group_by` is not a groupable attribute.
+        """
+        return self.endpoint._get_all_groups(self.__build_groups_params(group_by))
+
+    def get_facets(self, group_by: Iterable[str],
+                   workers: Optional[int] = None,
+                   all_groups: bool = True) -> Dict[str, Dict[str, int]]:
+        """ Get the groups of several facets of the entities matching the query at once.
+
+        Args:
+            same as `get_facets` of the endpoint, without the arguments built into the query.
+
+        Returns:
+            dict mapping every property of `group_by` to a dict mapping
+            the key of every group to its count.
+
+        Raises:
+            ValueError: if one of `group_by` is not a groupable attribute.
+        """
+        params = [self.__build_groups_params(facet) for facet in dict.fromkeys(group_by)]
+        return self.endpoint._get_facets(params, workers, all_groups)
+
+    # --------------------------------------------------------------------------
+    # ------------------------------- PROPERTIES -------------------------------
+    @property
+    def params(self) -> dict:
+        """ Compiled query parameters, a new dict every time."""
+        return dict(self._params)
+
+    @property
+    def path(self) -> str:
+        """ Path of the query, relative to the base URL of the API."""
+        return self.endpoint.name
+
+    @property
+    def query_string(self) -> str:
+        """ Canonical query string of the query, leaving out empty parameters."""
+        return urlencode([(key, value) for key, value in self._params.items()
+                          if value is not None])
+
+    def __str__(self):
+        query_string = self.query_string
+        return f"{self.path}?{query_string}" if query_string else self.path
+
+    def __repr__(self):
+        return f"Query({str(self)!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, Query) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    # --------------------------------------------------------------------------
+    # ----------------------------- HELPER METHODS -----------------------------
+    def __replace(self, **changes) -> "Query":
+        """Helper method creating a copy of the query with some parts replaced."""
+        parts = {'filters': self._filters, 'search': self._search,
+                 'sort': self._sort, 'select': self._select}
+        parts.update(changes)
+        return Query(self.endpoint, **parts)
+
+    def __build_groups_params(self, group_by: str) -> dict:
+        """Helper method validating `group_by` and constructing the parameters for groups."""
+        if group_by not in self.endpoint.groupable_keys:
+            raise ValueError("Value for 'group_by' not in groupable attributes."
+                             "\nGroupable attributes are "
+                             f"{','.join(self.endpoint.groupable_attrs)}.")
+        return {'group_by': group_by, 'filter': self._params['filter'], 'search': self._search}
+
+    def __compile_filter_value(self, value) -> str:
+        """Helper method formatting the value of a filter, combining collections with OR."""
+        if isinstance(value, (list, tuple, set, frozenset)):
+            if not value:
+                raise ValueError("Filter values combined with OR can not be empty.")
+            if len(value) > self.endpoint.OR_VALUES_MAX:
+                raise ValueError(f"At most {self.endpoint.OR_VALUES_MAX} filter values "
+                                 "can be combined with OR.")
+            values = [_format_value(item) for item in value]
+            # sets have no order, sort them to keep the query canonical
+            return "|".join(sorted(values) if isinstance(value, (set, frozenset)) else values)
+        return _format_value(value)
+
+    def __validate_relevance_score(self) -> Optional[str]:
+        """Helper method validating sorting by 'relevance_score', which requires search.
+        Returns the error message, None if valid."""
+        directions = dict(self._sort)
+        if "relevance_score" not in directions:
+            return None
+        is_search = self._search is not None or any(key.endswith(".search")
+                                                    for key, _ in self._filters)
+        if not is_search:
+            return "Sorting by 'relevance_score' only available when using search."
+        if directions["relevance_score"] == "asc":
+            return "Sorting by 'relevance_score' ascending not allowed."
+        return None
+
@@ -0,0 +1,158 @@
+"""This module paces requests to stay within the rate limits of the OpenAlex API."""
+import asyncio
+import datetime
+import email.utils
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+
+class DailyLimitExceeded(Exception):
+    """Raised when the daily number of requests has been used up."""
+
+
+class RateLimiter:
+    """Token bucket limiting the number of requests per second and per day.
+
+    A single limiter can be shared by several clients, threads and asyncio tasks.
+    When the API answers with '429 Too Many Requests', all callers pause for the
+    'Retry-After' period and the rate is lowered, then slowly raised again
+    with every successful request.
+    See https://docs.openalex.org/api#rate-limits
+    """
+
+    # factor the rate is multiplied with on '429 Too Many Requests'
+    BACKOFF_FACTOR = 0.5
+    # share of the configured rate the rate is raised by with every successful request
+    RECOVERY_STEP = 0.05
+
+    def __init__(self, per_second: float = 10,
+                 per_day: Optional[int] = 100000,
+                 burst: int = 1,
+                 max_retries: int = 3,
+                 state_file: Optional[str] = None,
+                 persist_every: int = 100) -> object:
+        """ Init rate limiter.
+
+        Args:
+            per_second (float): maximum number of requests per second.
+            per_day (Optional[int]): maximum number of requests per (UTC) day, optional.
+            burst (int): number of requests that may be sent at once after being idle.
+                        Defaults to 1, spacing requests evenly.
+            max_retries (int): number of times a request answered with
+                        '429 Too Many Requests' is retried.
+            state_file (Optional[str]): path to a file the daily count is persisted in,
+                        so it survives restarts, optional.
+            persist_every (int): number of requests after which the daily count is persisted.
+                        It is also persisted when the limiter or a client using it is closed.
+        """
+        self.per_second = per_second
+        self.per_day = per_day
+        self.burst = burst
+        self.max_retries = max_retries
+        self.state_file = state_file
+        self.persist_every = persist_every
+        self.rate = per_second
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self._day, self.used_today = self.__load_state()
+
+    def reserve(self) -> float:
+        """ Reserve a request, returning the number of seconds to wait before sending it.
+
+        Raises:
+            DailyLimitExceeded: if the daily number of requests has been used up.
+        """
+        with self._lock:
+            today = self.__today()
+            if today != self._day:
+                self._day, self.used_today = today, 0
+            if self.per_day is not None and self.used_today >= self.per_day:
+                raise DailyLimitExceeded(f"Used up all {self.per_day} requests for {today}.")
+            self.used_today += 1
+            if self.used_today % self.persist_every == 0:
+                self.__save_state()
+
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """ Block until the next request may be sent."""
+        time.sleep(self.reserve())
+
+    async def acquire_async(self) -> None:
+        """ Wait (without blocking the event loop) until the next request may be sent."""
+        await asyncio.sleep(self.reserve())
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """ Slow down after the API answered with '429 Too Many Requests'.
+
+        Args:
+            retry_after (Optional[float]): number of seconds to pause all requests, optional.
+                        Defaults to the time between two requests at the lowered rate.
+        """
+        with self._lock:
+            self.rate = max(self.rate * self.BACKOFF_FACTOR, self.per_second * 0.1)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self._tokens = min(self._tokens, -pause * self.rate)
+
+    def record_success(self) -> None:
+        """ Raise the rate again, after it was lowered, with every successful request."""
+        if self.rate < self.per_second:
+            with self._lock:
+                self.rate = min(self.rate + self.per_second * self.RECOVERY_STEP,
+                                self.per_second)
+
+    def close(self) -> None:
+        """ Persist the daily count. Called when a client using the limiter is closed,
+        the limiter can still be used afterwards."""
+        with self._lock:
+            self.__save_state()
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """ Parse the value of a 'Retry-After' header (seconds or HTTP date) into seconds."""
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # dates with the zone '-0000' are parsed as naive, they are in UTC
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max((retry_at - now).total_seconds(), 0.0)
+
+    @staticmethod
+    def __today() -> str:
+        return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+    def __load_state(self):
+        """Helper method loading the daily count from the state file."""
+        today = self.__today()
+        if self.state_file and os.path.exists(self.state_file):
+            with open(self.state_file, encoding="utf-8") as state_file:
+                state = json.load(state_file)
+            if state.get('day') == today:
+                return today, state.get('count', 0)
+        return today, 0
+
+    def __save_state(self) -> None:
+        """Helper method atomically writing the daily count to the state file."""
+        if not self.state_file:
+            return
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as state_file:
+            json.dump({'day': self._day, 'count': self.used_today}, state_file)
+        os.replace(tmp_file, self.state_file)
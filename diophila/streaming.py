@@ -0,0 +1,159 @@
+"""This module decodes responses of the OpenAlex API incrementally."""
+import codecs
+import json
+import re
+from typing import List
+
+# characters that change the nesting depth or start a string
+_STRUCTURE = re.compile(r'["{}\[\]]')
+# characters that end or escape something inside a string
+_STRING = re.compile(r'["\\]')
+_WHITESPACE = " \t\n\r"
+_NUMBER_OR_LITERAL = re.compile(r"[^,}\]\s]+(?=[,}\]\s])")
+
+
+class ResultsParser:
+    """Incremental parser for a JSON response object of the OpenAlex API.
+
+    Feed it the response body chunk by chunk: every entity of the 'results' array
+    is decoded (and returned) as soon as it is complete, so only one entity
+    has to be held in memory at a time. All other top-level values
+    e.g. 'meta' are decoded as a whole and stored in `fields`.
+    """
+
+    def __init__(self, results_key: str = "results"):
+        self.results_key = results_key
+        self.fields = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+        self._key = None
+        # progress of scanning for the end of the current value, kept between chunks
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """ Add the next chunk of the response body.
+
+        Args:
+            chunk (bytes): next part of the response body.
+
+        Returns:
+            list of the entities from 'results' that were completed by this chunk.
+
+        Raises:
+            ValueError: if the response body is not a JSON object.
+        """
+        self._buffer += self._decoder.decode(chunk)
+        results = []
+        pos = 0
+        while True:
+            pos = self.__skip(pos, _WHITESPACE + ("," if self._state != "start" else ""))
+            if pos >= len(self._buffer):
+                break
+            char = self._buffer[pos]
+
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError("Response body is not a JSON object.")
+                self._state, pos = "key", pos + 1
+
+            elif self._state == "key":
+                if char == "}":
+                    self._state, pos = "done", pos + 1
+                    continue
+                end = self.__find_value_end(pos)
+                colon = self.__skip(end, _WHITESPACE) if end > 0 else -1
+                if colon < 0 or colon >= len(self._buffer):
+                    break  # key or colon incomplete
+                if self._buffer[colon] != ":":
+                    raise ValueError("Response body is not a valid JSON object.")
+                self._key = json.loads(self._buffer[pos:end])
+                self._state, pos = "value", colon + 1
+
+            elif self._state == "value":
+                if self._key == self.results_key and char == "[":
+                    self._state, pos = "results", pos + 1
+                    continue
+                end = self.__find_value_end(pos)
+                if end < 0:
+                    break
+                self.fields[self._key] = json.loads(self._buffer[pos:end])
+                self._state, pos = "key", end
+
+            elif self._state == "results":
+                if char == "]":
+                    self._state, pos = "key", pos + 1
+                    continue
+                end = self.__find_value_end(pos)
+                if end < 0:
+                    break
+                results.append(json.loads(self._buffer[pos:end]))
+                pos = end
+
+            else:  # done, ignore trailing whitespace
+                pos = len(self._buffer)
+
+        self._buffer = self._buffer[pos:]
+        self._scan_pos = max(self._scan_pos - pos, 0)
+        return results
+
+    def close(self) -> None:
+        """ Make sure the whole response body was fed to the parser.
+
+        Raises:
+            ValueError: if the response body ended before the JSON object was complete.
+        """
+        self.feed(self._decoder.decode(b"", final=True).encode())
+        if self._state != "done":
+            raise ValueError("Response body ended before the JSON object was complete.")
+
+    def __skip(self, pos: int, chars: str) -> int:
+        """Helper method returning the position of the first character not in `chars`."""
+        while pos < len(self._buffer) and self._buffer[pos] in chars:
+            pos += 1
+        return pos
+
+    def __find_value_end(self, start: int) -> int:
+        """Helper method finding the end of the JSON value starting at `start`,
+        or -1 if it is not complete yet. Resumes where the last call stopped."""
+        buffer = self._buffer
+        first = buffer[start]
+        if first not in '{["':
+            match = _NUMBER_OR_LITERAL.match(buffer, start)
+            return match.end() if match else -1
+
+        pos = max(self._scan_pos, start)
+        if pos == start:
+            self._depth, self._in_string = 0, False
+        while True:
+            if self._in_string:
+                match = _STRING.search(buffer, pos)
+                if match is None or match.end() >= len(buffer) and match.group() == "\\":
+                    self._scan_pos = match.start() if match else len(buffer)
+                    return -1
+                if match.group() == "\\":
+                    pos = match.end() + 1  # skip escaped character
+                    continue
+                self._in_string, pos = False, match.end()
+                if self._depth == 0:  # value was a string
+                    break
+                continue
+
+            match = _STRUCTURE.search(buffer, pos)
+            if match is None:
+                self._scan_pos = len(buffer)
+                return -1
+            char, pos = match.group(), match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    break
+
+        self._scan_pos = 0
+        return pos
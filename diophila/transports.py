@@ -0,0 +1,300 @@
+"""This module offers the HTTP transports API callers send their requests with."""
+import glob
+import gzip
+import json
+import os
+import zlib
+from typing import Optional, Union, Iterable, Iterator, Callable, Dict, Tuple
+from urllib.parse import urlencode, urlsplit, parse_qsl
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+def _build_url(url: str, params: Optional[dict] = None) -> str:
+    """Helper function appending the query string to a URL, leaving out empty parameters
+    like `requests` does."""
+    query = urlencode([(key, value) for key, value in (params or {}).items()
+                       if value is not None])
+    if not query:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+class Response:
+    """Response of a transport, offering the parts of `requests.Response` used by API callers."""
+
+    def __init__(self, status_code: int,
+                 headers: Optional[dict] = None,
+                 url: str = "",
+                 content: Optional[bytes] = None,
+                 stream: Optional[Callable[[int], Iterator[bytes]]] = None,
+                 close: Optional[Callable[[], None]] = None):
+        """ Init response.
+
+        Args:
+            status_code (int): HTTP status of the response.
+            headers (Optional[dict]): headers of the response, optional.
+            url (str): URL the request was sent to.
+            content (Optional[bytes]): whole body of the response, optional.
+            stream (Optional[Callable]): called with a chunk size to read the body
+                        in chunks instead, optional.
+            close (Optional[Callable]): called to release the connection, optional.
+        """
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.url = url
+        self._content = content
+        self._stream = stream
+        self._close = close
+
+    @property
+    def content(self) -> bytes:
+        """ Whole body of the response, read on first access."""
+        if self._content is None:
+            self._content = b"".join(self._stream(64 * 1024)) if self._stream else b""
+            self.close()
+        return self._content
+
+    def json(self):
+        """ Decode the body of the response as JSON."""
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """ Read the body of the response in chunks."""
+        if self._content is not None or self._stream is None:
+            content = self.content
+            return (content[start:start + chunk_size]
+                    for start in range(0, len(content), chunk_size))
+        return self._stream(chunk_size)
+
+    def raise_for_status(self) -> None:
+        """ Raise `requests.HTTPError` if the status is an error."""
+        if self.status_code >= 400:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(f"{self.status_code} {kind} Error for url: {self.url}",
+                                     response=self)
+
+    def close(self) -> None:
+        """ Release the connection of the response."""
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _BaseTransport:
+    """Base class for transports, sending GET requests for an API caller."""
+
+    def get(self, url: str, params: Optional[dict] = None,
+            headers: Optional[dict] = None, stream: bool = False):
+        """ Send a GET request.
+
+        Args:
+            url (str): URL without query string.
+            params (Optional[dict]): items constructed into the query string, optional.
+                        Items with the value None are left out.
+            headers (Optional[dict]): headers of the request, optional.
+            stream (bool): read the body only when it is iterated over,
+                        defaults to False.
+
+        Returns:
+            response offering `status_code`, `headers`, `content`, `json`,
+            `iter_content`, `raise_for_status` and `close` like `requests.Response`.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """ Close all pooled connections."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RequestsTransport(_BaseTransport):
+    """Transport using a pooled `requests.Session`, the default."""
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10):
+        """ Init transport.
+
+        Args:
+            pool_connections (int): number of connection pools (one per host) to cache.
+            pool_maxsize (int): maximum number of connections kept alive per host.
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, params: Optional[dict] = None,
+            headers: Optional[dict] = None, stream: bool = False):
+        return self.session.get(url=url, params=params, headers=headers, stream=stream)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(_BaseTransport):
+    """Transport using a `urllib3.PoolManager` directly, skipping the overhead of `requests`."""
+
+    def __init__(self, num_pools: int = 10, maxsize: int = 10):
+        """ Init transport.
+
+        Args:
+            num_pools (int): number of connection pools (one per host) to cache.
+            maxsize (int): maximum number of connections kept alive per host.
+        """
+        import urllib3  # pylint: disable=import-outside-toplevel
+        self.pool = urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize,
+                                        headers=urllib3.make_headers(accept_encoding=True))
+
+    def get(self, url: str, params: Optional[dict] = None,
+            headers: Optional[dict] = None, stream: bool = False):
+        url = _build_url(url, params)
+        response = self.pool.request("GET", url, headers={**self.pool.headers, **(headers or {})},
+                                     preload_content=False)
+        if stream:
+            return Response(response.status, dict(response.headers), url,
+                            stream=response.stream, close=response.release_conn)
+        content = response.read()
+        response.release_conn()
+        return Response(response.status, dict(response.headers), url, content=content)
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+class HTTPXTransport(_BaseTransport):
+    """Transport using an `httpx.Client`, multiplexing concurrent requests
+    over a single HTTP/2 connection.
+
+    Requires httpx with HTTP/2 support, install it with `pip install diophila[httpx]`.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 10):
+        """ Init transport.
+
+        Args:
+            http2 (bool): negotiate HTTP/2, defaults to True.
+            max_connections (int): maximum number of connections kept alive.
+
+        Raises:
+            ImportError: if httpx (or h2 for HTTP/2) is not installed.
+        """
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError("HTTPXTransport requires httpx, "
+                              "install it with `pip install diophila[httpx]`.") from error
+        limits = httpx.Limits(max_connections=max_connections,
+                              max_keepalive_connections=max_connections)
+        self.client = httpx.Client(http2=http2, limits=limits)
+
+    def get(self, url: str, params: Optional[dict] = None,
+            headers: Optional[dict] = None, stream: bool = False):
+        url = _build_url(url, params)
+        response = self.client.send(self.client.build_request("GET", url, headers=headers),
+                                    stream=stream)
+        if stream:
+            return Response(response.status_code, dict(response.headers), url,
+                            stream=response.iter_bytes, close=response.close)
+        return Response(response.status_code, dict(response.headers), url,
+                        content=response.content)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class ReplayTransport(_BaseTransport):
+    """Transport answering requests with recorded responses from memory, without any network.
+
+    Responses are looked up by path and query parameters (in any order), the host is ignored.
+    Requests without a recorded response are answered with '404 Not Found'.
+    Reading cassettes requires PyYAML.
+    """
+
+    def __init__(self, cassettes: Union[str, Iterable[str], None] = None):
+        """ Init transport.
+
+        Args:
+            cassettes (Union[str, Iterable[str], None]): paths to cassettes recorded by vcrpy
+                        or directories containing them, optional.
+        """
+        self.responses: Dict[Tuple[str, tuple], Tuple[int, dict, bytes]] = {}
+        if isinstance(cassettes, str):
+            cassettes = [cassettes]
+        for path in cassettes or []:
+            if os.path.isdir(path):
+                pattern = os.path.join(path, "**", "*.yaml")
+                for filename in sorted(glob.glob(pattern, recursive=True)):
+                    self.load(filename)
+            else:
+                self.load(path)
+
+    def load(self, filename: str) -> None:
+        """ Add all responses recorded in a cassette."""
+        try:
+            import yaml  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError("Reading cassettes requires PyYAML, "
+                              "install it with `pip install pyyaml`.") from error
+        with open(filename, encoding="utf-8") as cassette:
+            interactions = yaml.safe_load(cassette)['interactions']
+        for interaction in interactions:
+            request, response = interaction['request'], interaction['response']
+            if request['method'].upper() != "GET":
+                continue
+            headers = {key: ", ".join(values) if isinstance(values, list) else values
+                       for key, values in response['headers'].items()}
+            body = response['body']['string']
+            body = body.encode("utf-8") if isinstance(body, str) else body
+            # serve bodies decoded, like a client does
+            encoding = CaseInsensitiveDict(headers).get('Content-Encoding', "")
+            if encoding in ("gzip", "deflate"):
+                body = gzip.decompress(body) if encoding == "gzip" else zlib.decompress(body)
+                headers = {key: value for key, value in headers.items()
+                           if key.lower() not in ("content-encoding", "content-length")}
+            self.add(request['uri'], body, response['status']['code'], headers)
+
+    def add(self, url: str, body: Union[bytes, str, dict, list],
+            status_code: int = 200, headers: Optional[dict] = None) -> None:
+        """ Add a response.
+
+        Args:
+            url (str): URL (or path) with query string the response answers.
+            body (Union[bytes, str, dict, list]): body of the response, encoded as JSON
+                        if it is not bytes or str.
+            status_code (int): HTTP status of the response, defaults to 200.
+            headers (Optional[dict]): headers of the response, optional.
+        """
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.responses[self.__key(url)] = (status_code, dict(headers or {}), body)
+
+    def get(self, url: str, params: Optional[dict] = None,
+            headers: Optional[dict] = None, stream: bool = False):
+        url = _build_url(url, params)
+        recorded = self.responses.get(self.__key(url))
+        if recorded is None:
+            return Response(404, {'Content-Type': "application/json"}, url,
+                            content=b'{"error": "No recorded response."}')
+        status_code, recorded_headers, body = recorded
+        return Response(status_code, recorded_headers, url, content=body)
+
+    @staticmethod
+    def __key(url: str) -> Tuple[str, tuple]:
+        """Helper method normalizing a URL into its path and sorted query parameters."""
+        split_url = urlsplit(url)
+        return split_url.path.rstrip("/"), tuple(sorted(parse_qsl(split_url.query)))
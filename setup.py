@@ -17,6 +17,12 @@ setup(
         "Bug Tracker": "https://github.com/smierz/diophila/issues",
     },
     install_requires=["requests>=2.7.0"],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "zstd": ["zstandard>=0.15"],
+        "parquet": ["pyarrow>=7.0"],
+        "httpx": ["httpx[http2]>=0.23"],
+    },
     keywords=["openalex"],
     classifiers=[
         "Programming Language :: Python :: 3",
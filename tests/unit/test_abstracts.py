@@ -0,0 +1,40 @@
+"""All unit tests covering class 'abstracts'."""
+
+from diophila.abstracts import reconstruct_abstract, reconstruct_abstracts, with_abstracts
+
+INVERTED_INDEX = {'the': [0, 4], 'state': [1], 'of': [2], 'OA': [3, 6], 'in': [5]}
+
+
+def test_reconstruct_abstract_orders_words_by_position():
+    assert reconstruct_abstract(INVERTED_INDEX) == "the state of OA the in OA"
+
+
+def test_reconstruct_abstract_skips_gaps():
+    assert reconstruct_abstract({'a': [0], 'b': [3]}) == "a b"
+
+
+def test_reconstruct_abstract_without_abstract():
+    assert reconstruct_abstract(None) is None
+    assert reconstruct_abstract({}) is None
+
+
+def test_reconstruct_abstracts_of_page():
+    works = [{'abstract_inverted_index': INVERTED_INDEX}, {'abstract_inverted_index': None}, {}]
+    assert reconstruct_abstracts(works) == ["the state of OA the in OA", None, None]
+
+
+def test_with_abstracts_adds_abstracts_to_pages_and_works():
+    pages = [{'meta': {}, 'results': [{'id': "W1", 'abstract_inverted_index': {'hi': [0]}}]}]
+    page = next(with_abstracts(pages, drop_inverted_index=True))
+    assert page['results'] == [{'id': "W1", 'abstract': "hi"}]
+
+    works = [{'id': "W2", 'abstract_inverted_index': {'hello': [0]}}]
+    assert next(with_abstracts(works, field="text"))['text'] == "hello"
+
+
+def test_with_abstracts_does_not_modify_input():
+    work = {'id': "W1", 'abstract_inverted_index': {'hi': [0]}}
+    pages = [{'meta': {}, 'results': [work]}]
+    list(with_abstracts(pages, drop_inverted_index=True))
+    assert pages == [{'meta': {}, 'results': [work]}]
+    assert work == {'id': "W1", 'abstract_inverted_index': {'hi': [0]}}
@@ -0,0 +1,328 @@
+"""All unit tests covering class 'api_caller'."""
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from diophila import OpenAlex
+from diophila.api_caller import APICaller
+from diophila.cache import ResponseCache, SQLiteCache
+from diophila.rate_limiter import RateLimiter
+
+BASE_URL = "https://api.openalex.org"
+
+
+# test connection pooling
+def test_session_mounts_pooled_adapter():
+    api_caller = APICaller(BASE_URL, pool_connections=3, pool_maxsize=7)
+    adapter = api_caller.session.get_adapter(BASE_URL)
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+
+
+def test_session_is_reused_between_calls(monkeypatch):
+    sessions = []
+
+    def fake_request(session, method, url, **kwargs):
+        sessions.append(session)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    api_caller = APICaller(BASE_URL)
+    api_caller.get("works/W1")
+    api_caller.get("authors/A1")
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1] is api_caller.session
+
+
+def test_keep_alive_disabled_sets_connection_header():
+    api_caller = APICaller(BASE_URL, keep_alive=False)
+    assert api_caller.headers['Connection'] == 'close'
+
+
+def test_context_manager_closes_session():
+    with APICaller(BASE_URL) as api_caller:
+        adapter = api_caller.session.get_adapter(BASE_URL)
+        adapter.poolmanager.connection_from_url(BASE_URL)
+        assert len(adapter.poolmanager.pools) == 1
+    assert len(adapter.poolmanager.pools) == 0
+
+
+# test concurrent basic paging
+class SlowAPICaller(APICaller):
+    """Answers pages out of order and records the maximum number of requests in flight."""
+
+    def __init__(self):
+        super().__init__(BASE_URL)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, path, params=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05 if params['page'] % 2 else 0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return {'meta': {'page': params['page']}}
+
+
+def test_concurrent_basic_paging_keeps_requested_order():
+    api_caller = SlowAPICaller()
+    pages = [5, 1, 2, 4, 3, 6]
+    result = api_caller.get_all("works", {}, per_page=200, pages=pages, workers=3)
+    assert [page['meta']['page'] for page in result] == pages
+
+
+def test_concurrent_basic_paging_bounds_in_flight_requests():
+    api_caller = SlowAPICaller()
+    list(api_caller.get_all("works", {}, per_page=200, pages=list(range(1, 21)), workers=4))
+    assert 1 < api_caller.max_in_flight <= 4
+
+
+def test_concurrent_basic_paging_skips_invalid_pages():
+    api_caller = SlowAPICaller()
+    result = api_caller.get_all("works", {}, per_page=200, pages=[0, 1, 50, 51], workers=2)
+    assert [page['meta']['page'] for page in result] == [1, 50]
+
+
+# test response caching
+class FakeResponse:
+    content = b'{"id": "W1"}'
+    headers = {'ETag': '"v1"'}
+
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def close(self):
+        pass
+
+    def json(self):
+        return {'id': "W1"}
+
+
+def test_get_serves_repeated_requests_from_cache():
+    api_caller = APICaller(BASE_URL, cache=ResponseCache())
+    calls = []
+    api_caller.session.get = lambda **kwargs: calls.append(kwargs) or FakeResponse()
+    api_caller.get("works/W1")
+    api_caller.get("works/W1")
+    assert len(calls) == 1
+    assert api_caller.cache.size == len(FakeResponse.content)
+
+
+def test_get_never_caches_random_entities():
+    api_caller = APICaller(BASE_URL, cache=ResponseCache())
+    calls = []
+    api_caller.session.get = lambda **kwargs: calls.append(kwargs) or FakeResponse()
+    api_caller.get("works/random")
+    api_caller.get("works/random")
+    assert len(calls) == 2
+
+
+def test_get_revalidates_expired_response_with_conditional_request(tmp_path):
+    api_caller = APICaller(BASE_URL, cache=SQLiteCache(str(tmp_path / "cache.db"), ttl=-1))
+    calls = []
+
+    def fake_get(**kwargs):
+        calls.append(kwargs['headers'])
+        return FakeResponse(304 if 'If-None-Match' in kwargs['headers'] else 200)
+
+    api_caller.session.get = fake_get
+    assert api_caller.get("works/W1") == {'id': "W1"}
+    assert api_caller.get("works/W1") == {'id': "W1"}
+    assert calls[1]['If-None-Match'] == '"v1"'
+    assert api_caller.cache.revalidations == 1
+
+
+# test streaming
+class FakeStreamingResponse:
+    status_code = 200
+
+    def __init__(self, body):
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), 7):
+            yield self.body[i:i + 7]
+
+
+def test_get_all_stream_yields_entities_across_cursor_pages():
+    api_caller = APICaller(BASE_URL)
+    bodies = {"*": b'{"meta": {"next_cursor": "c1"}, "results": [{"id": 1}, {"id": 2}]}',
+              "c1": b'{"meta": {"next_cursor": "c2"}, "results": [{"id": 3}]}',
+              "c2": b'{"meta": {"next_cursor": null}, "results": []}'}
+    api_caller.session.get = lambda **kwargs: FakeStreamingResponse(
+        bodies[kwargs['params']['cursor']])
+    entities = list(api_caller.get_all("works", {}, stream=True))
+    assert entities == [{'id': 1}, {'id': 2}, {'id': 3}]
+
+
+def test_get_all_stream_with_workers_error():
+    api_caller = APICaller(BASE_URL)
+    with pytest.raises(ValueError):
+        api_caller.get_all("works", {}, pages=[1, 2], workers=2, stream=True)
+
+
+# test method "iter_all"
+def test_iter_all_yields_entities_of_all_pages():
+    api_caller = APICaller(BASE_URL)
+    pages = {"*": {'meta': {'next_cursor': "c1"}, 'results': [{'id': 1}, {'id': 2}]},
+             "c1": {'meta': {'next_cursor': None}, 'results': [{'id': 3}]}}
+    api_caller.get = lambda path, params: pages[params['cursor']]
+    assert list(api_caller.iter_all("works", {}, prefetch_depth=1)) == [{'id': 1}, {'id': 2},
+                                                                         {'id': 3}]
+
+
+# test rate limiting
+def test_get_retries_after_too_many_requests_and_slows_down():
+    rate_limiter = RateLimiter(per_second=1000, per_day=None, max_retries=2)
+    api_caller = APICaller(BASE_URL, rate_limiter=rate_limiter)
+    responses = [FakeResponse(429), FakeResponse(200)]
+    api_caller.session.get = lambda **kwargs: responses.pop(0)
+    assert api_caller.get("works/W1") == {'id': "W1"}
+    assert responses == []
+    assert rate_limiter.rate < 1000
+
+
+def test_get_gives_up_after_max_retries():
+    rate_limiter = RateLimiter(per_second=1000, per_day=None, max_retries=1)
+    api_caller = APICaller(BASE_URL, rate_limiter=rate_limiter)
+    api_caller.session.get = lambda **kwargs: FakeResponse(429)
+    with pytest.raises(requests.HTTPError):
+        api_caller.get("works/W1")
+    assert rate_limiter.used_today == 2
+
+
+def test_close_persists_daily_count_of_rate_limiter(tmp_path):
+    state_file = str(tmp_path / "rate.json")
+    rate_limiter = RateLimiter(per_second=1000, state_file=state_file)
+    with OpenAlex(rate_limiter=rate_limiter) as openalex:
+        openalex._api_caller.session.get = lambda **kwargs: FakeResponse()
+        for number in range(5):
+            openalex.get_single_work(f"W{number}")
+    # fewer requests than `persist_every` are persisted as well
+    assert RateLimiter(state_file=state_file).used_today == 5
+
+
+def test_get_all_cursor_paging_stops_without_next_cursor():
+    api_caller = APICaller(BASE_URL)
+    api_caller.get = lambda path, params: {'meta': {'count': 1}, 'results': [],
+                                           'group_by': [{'key': "true", 'count': 1}]}
+    pages = list(api_caller.get_all("works", {'group_by': "is_oa"}, per_page=200))
+    assert len(pages) == 1
+
+
+# test checkpoints
+CURSOR_PAGES = {"*": {'meta': {'next_cursor': "c1"}, 'results': [{'id': 1}, {'id': 2}]},
+                "c1": {'meta': {'next_cursor': "c2"}, 'results': [{'id': 3}]},
+                "c2": {'meta': {'next_cursor': None}, 'results': [{'id': 4}]}}
+
+
+def test_get_all_resumes_from_checkpoint_after_crash(tmp_path):
+    checkpoint = str(tmp_path / "harvest.json")
+    api_caller = APICaller(BASE_URL)
+    api_caller.get = lambda path, params: CURSOR_PAGES[params['cursor']]
+
+    pages = api_caller.get_all("works", {'filter': "type:book"}, checkpoint=checkpoint)
+    assert next(pages)['results'] == [{'id': 1}, {'id': 2}]
+    assert next(pages)['results'] == [{'id': 3}]
+    del pages  # crash while processing the second page
+
+    pages = api_caller.get_all("works", {'filter': "type:book"},
+                               checkpoint=checkpoint, resume=True)
+    assert [page['results'] for page in pages] == [[{'id': 3}], [{'id': 4}]]
+
+    pages = api_caller.get_all("works", {'filter': "type:book"},
+                               checkpoint=checkpoint, resume=True)
+    assert list(pages) == []
+
+
+def test_get_all_stream_resumes_from_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / "harvest.json")
+    api_caller = APICaller(BASE_URL)
+    api_caller.session.get = lambda **kwargs: FakeStreamingResponse(
+        json.dumps(CURSOR_PAGES[kwargs['params']['cursor']]).encode())
+
+    entities = api_caller.get_all("works", {}, stream=True, checkpoint=checkpoint)
+    assert [next(entities) for _ in range(3)] == [{'id': 1}, {'id': 2}, {'id': 3}]
+    del entities
+
+    entities = api_caller.get_all("works", {}, stream=True, checkpoint=checkpoint, resume=True)
+    assert list(entities) == [{'id': 3}, {'id': 4}]
+
+
+def test_get_all_resume_with_different_query_error(tmp_path):
+    checkpoint = str(tmp_path / "harvest.json")
+    api_caller = APICaller(BASE_URL)
+    api_caller.get = lambda path, params: CURSOR_PAGES[params['cursor']]
+    list(api_caller.get_all("works", {'filter': "type:book"}, checkpoint=checkpoint))
+    with pytest.raises(ValueError):
+        api_caller.get_all("works", {'filter': "type:article"},
+                           checkpoint=checkpoint, resume=True)
+
+
+def test_get_all_checkpoint_with_pages_error(tmp_path):
+    api_caller = APICaller(BASE_URL)
+    with pytest.raises(ValueError):
+        api_caller.get_all("works", {}, pages=[1], checkpoint=str(tmp_path / "harvest.json"))
+
+
+# test hooks
+class RecordingHook:
+    def __init__(self):
+        self.started, self.ended = [], []
+
+    def on_start(self, event):
+        self.started.append(event)
+
+    def on_end(self, event):
+        self.ended.append(event)
+
+
+def test_hooks_receive_events_with_cache_and_retries():
+    hook = RecordingHook()
+    rate_limiter = RateLimiter(per_second=1000, per_day=None, max_retries=2)
+    api_caller = APICaller(BASE_URL, cache=ResponseCache(), rate_limiter=rate_limiter,
+                           hooks=[hook])
+    responses = [FakeResponse(429), FakeResponse(200)]
+    api_caller.session.get = lambda **kwargs: responses.pop(0)
+    api_caller.get("works/W1")
+    api_caller.get("works/W1")
+    first, second = hook.ended
+    assert len(hook.started) == 2
+    assert (first.endpoint, first.paging, first.status) == ("works", "single", 200)
+    assert (first.retries, first.cache, first.bytes) == (1, "miss", len(FakeResponse.content))
+    assert second.cache == "hit" and second.latency is not None
+
+
+def test_hooks_receive_stream_events_and_errors():
+    hook = RecordingHook()
+    api_caller = APICaller(BASE_URL, hooks=[hook])
+    body = b'{"meta": {"next_cursor": null}, "results": [{"id": 1}]}'
+    api_caller.session.get = lambda **kwargs: FakeStreamingResponse(body)
+    list(api_caller.get_all("works", {}, stream=True))
+    assert (hook.ended[0].paging, hook.ended[0].bytes) == ("stream", len(body))
+
+    api_caller.session.get = lambda **kwargs: FakeResponse(500)
+    with pytest.raises(requests.HTTPError):
+        api_caller.get("works/W1")
+    assert isinstance(hook.ended[-1].error, requests.HTTPError)
+    assert hook.ended[-1].status == 500
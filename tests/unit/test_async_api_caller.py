@@ -0,0 +1,199 @@
+"""All unit tests covering class 'async_api_caller'."""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from diophila import AsyncOpenAlex
+from diophila.async_api_caller import AsyncAPICaller
+from diophila.rate_limiter import RateLimiter
+
+
+class FakeResponse:
+    status = 200
+    headers = {}
+
+    def __init__(self, payload, status=200):
+        self.payload = payload
+        self.status = status
+
+    def release(self):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        await asyncio.sleep(0.01)
+        return json.dumps(self.payload).encode()
+
+
+class FakeSession:
+    """Serves cursor pages and records the maximum number of requests in flight."""
+    closed = False
+
+    def __init__(self, pages=3):
+        self.pages = pages
+        self.calls = []
+
+    async def get(self, url, params, headers=None):
+        self.calls.append((url, dict(params)))
+        cursor = params.get('cursor')
+        page = 0 if cursor in (None, "*") else int(cursor)
+        next_cursor = str(page + 1) if page + 1 < self.pages else None
+        return FakeResponse({'meta': {'next_cursor': next_cursor, 'page': params.get('page')},
+                             'results': [{'id': f"https://openalex.org/W{page}"}]})
+
+    async def close(self):
+        self.closed = True
+
+
+def make_api_caller(max_concurrency=10, pages=3):
+    api_caller = AsyncAPICaller("https://api.openalex.org", max_concurrency=max_concurrency)
+    api_caller._session = FakeSession(pages)
+    return api_caller
+
+
+def test_get_drops_empty_params():
+    api_caller = make_api_caller()
+    asyncio.run(api_caller.get("works", {'filter': None, 'search': "x"}))
+    assert api_caller._session.calls == [("https://api.openalex.org/works", {'search': "x"})]
+
+
+def test_get_all_cursor_paging_until_cursor_ends():
+    async def collect():
+        return [page async for page in make_api_caller(pages=3).get_all("works", {})]
+
+    pages = asyncio.run(collect())
+    assert [p['results'][0]['id'][-1] for p in pages] == ["0", "1", "2"]
+
+
+def test_get_all_basic_paging_skips_invalid_pages():
+    async def collect():
+        api_caller = make_api_caller()
+        return [page async for page in api_caller.get_all("works", {}, 200, [0, 1, 2, 51])]
+
+    pages = asyncio.run(collect())
+    assert [p['meta']['page'] for p in pages] == [1, 2]
+
+
+def test_get_respects_max_concurrency():
+    api_caller = make_api_caller(max_concurrency=2)
+    in_flight = {'now': 0, 'max': 0}
+    original_get = api_caller._session.get
+
+    class CountingResponse(FakeResponse):
+        def release(self):
+            in_flight['now'] -= 1
+
+    async def counting_get(url, params, headers):
+        in_flight['now'] += 1
+        in_flight['max'] = max(in_flight['max'], in_flight['now'])
+        return CountingResponse((await original_get(url, params)).payload)
+
+    api_caller._session.get = counting_get
+
+    async def run():
+        await asyncio.gather(*(api_caller.get("works") for _ in range(10)))
+
+    asyncio.run(run())
+    assert in_flight['max'] == 2
+
+
+def test_async_openalex_mirrors_sync_methods():
+    openalex = AsyncOpenAlex()
+    openalex._api_caller._session = FakeSession()
+
+    async def run():
+        work = await openalex.get_single_work("W0")
+        pages = [page async for page in openalex.get_list_of_works()]
+        await openalex.close()
+        return work, pages
+
+    work, pages = asyncio.run(run())
+    assert work['meta'] is not None
+    assert len(pages) == 3
+
+
+def test_async_openalex_requires_async_with():
+    with pytest.raises(TypeError):
+        with AsyncOpenAlex():
+            pass
+
+
+def test_get_all_concurrent_basic_paging_keeps_requested_order():
+    async def collect():
+        api_caller = make_api_caller()
+        pages = [3, 1, 2, 5, 4]
+        return [page async for page in api_caller.get_all("works", {}, 200, pages, workers=2)]
+
+    pages = asyncio.run(collect())
+    assert [p['meta']['page'] for p in pages] == [3, 1, 2, 5, 4]
+
+
+def test_get_retries_after_too_many_requests():
+    api_caller = make_api_caller()
+    api_caller.rate_limiter = RateLimiter(per_second=1000, per_day=None, max_retries=2)
+    statuses = [429, 429, 200]
+    original_get = api_caller._session.get
+
+    async def limited_get(url, params, headers):
+        response = await original_get(url, params)
+        response.status = statuses.pop(0)
+        return response
+
+    api_caller._session.get = limited_get
+    result = asyncio.run(api_caller.get("works/W1"))
+    assert result['results'][0]['id'] == "https://openalex.org/W0"
+    assert statuses == []
+
+
+def test_async_openalex_counts_many():
+    openalex = AsyncOpenAlex()
+    openalex._api_caller._session = session = FakeSession()
+
+    async def counting_get(url, params, headers=None):
+        session.calls.append((url, dict(params)))
+        return FakeResponse({'meta': {'count': len(params.get('filter', ""))}, 'results': []})
+
+    session.get = counting_get
+
+    async def run():
+        return await openalex.count_many_works([{"is_oa": "true"}, {}, {"is_oa": "true"}])
+
+    assert asyncio.run(run()) == [10, 0, 10]
+    assert len(session.calls) == 2
+
+
+def test_async_openalex_samples():
+    openalex = AsyncOpenAlex()
+    openalex._api_caller._session = session = FakeSession()
+
+    async def sampling_get(url, params, headers=None):
+        session.calls.append((url, dict(params)))
+        results = [{'id': f"W{n}"} for n in range(int(params['sample']))]
+        return FakeResponse({'meta': {'count': len(results)}, 'results': results})
+
+    session.get = sampling_get
+
+    async def run():
+        return await openalex.sample_works(3, seed=5)
+
+    assert [work['id'] for work in asyncio.run(run())] == ["W0", "W1", "W2"]
+    assert session.calls[0][1]['seed'] == 5
+
+
+def test_async_close_persists_daily_count_of_rate_limiter(tmp_path):
+    state_file = str(tmp_path / "rate.json")
+    rate_limiter = RateLimiter(per_second=1000, state_file=state_file)
+    rate_limiter.reserve()
+
+    async def run():
+        async with AsyncAPICaller("https://api.openalex.org", rate_limiter=rate_limiter):
+            pass
+
+    asyncio.run(run())
+    assert RateLimiter(state_file=state_file).used_today == 1
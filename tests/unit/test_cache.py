@@ -0,0 +1,108 @@
+"""All unit tests covering class 'cache'."""
+
+import time
+
+from diophila.cache import ResponseCache, SQLiteCache, make_cache_key
+
+
+# test method "make_cache_key"
+def test_make_cache_key_ignores_param_and_filter_order():
+    key_1 = make_cache_key("works", {'filter': "is_oa:true,type:article", 'search': None,
+                                     'per_page': 25})
+    key_2 = make_cache_key("works", {'per_page': 25, 'filter': "type:article,is_oa:true"})
+    assert key_1 == key_2
+
+
+def test_make_cache_key_keeps_sort_order():
+    key_1 = make_cache_key("works", {'sort': "display_name:asc,cited_by_count:desc"})
+    key_2 = make_cache_key("works", {'sort': "cited_by_count:desc,display_name:asc"})
+    assert key_1 != key_2
+
+
+def test_make_cache_key_without_params_is_path():
+    assert make_cache_key("works/W1") == "works/W1"
+
+
+# test class "ResponseCache"
+def test_cache_counts_hits_and_misses():
+    cache = ResponseCache()
+    assert cache.get("works/W1") is None
+    cache.set("works/W1", None, {'id': "W1"})
+    assert cache.get("works/W1") == {'id': "W1"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = ResponseCache(max_entries=2)
+    cache.set("works/W1", None, 1)
+    cache.set("works/W2", None, 2)
+    cache.get("works/W1")
+    cache.set("works/W3", None, 3)
+    assert cache.get("works/W2") is None
+    assert cache.get("works/W1") == 1
+    assert len(cache) == 2
+
+
+def test_cache_evicts_when_exceeding_max_bytes():
+    cache = ResponseCache(max_bytes=100)
+    cache.set("works/W1", None, 1, size=60)
+    cache.set("works/W2", None, 2, size=60)
+    assert cache.get("works/W1") is None
+    assert cache.size == 60
+
+
+def test_cache_does_not_store_entry_larger_than_max_bytes():
+    cache = ResponseCache(max_bytes=100)
+    cache.set("works/W1", None, 1, size=101)
+    assert len(cache) == 0
+
+
+def test_cache_expires_entries_per_endpoint():
+    cache = ResponseCache(ttl=60, ttls={'works': 0.01})
+    cache.set("works/W1", None, 1)
+    cache.set("works?filter=is_oa:true", None, 3)
+    cache.set("authors/A1", None, 2)
+    time.sleep(0.02)
+    assert cache.get("works/W1") is None
+    assert cache.get("works?filter=is_oa:true") is None
+    assert cache.get("authors/A1") == 2
+
+
+def test_cache_never_caches_random_entities():
+    assert not ResponseCache.is_cacheable("works/random")
+    assert ResponseCache.is_cacheable("works/W1")
+
+
+# test class "SQLiteCache"
+def test_sqlite_cache_persists_between_instances(tmp_path):
+    filename = str(tmp_path / "cache.db")
+    cache = SQLiteCache(filename)
+    cache.set("works", {'filter': "is_oa:true,type:article"}, {'results': [1, 2]})
+    cache.close()
+
+    cache = SQLiteCache(filename)
+    assert cache.get("works", {'filter': "type:article,is_oa:true"}) == {'results': [1, 2]}
+    assert len(cache) == 1
+
+
+def test_sqlite_cache_keeps_expired_entries_for_revalidation(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=-1)
+    cache.set("works/W1", None, {'id': "W1"},
+              validators={'etag': '"v1"', 'last_modified': "Mon, 01 Aug 2022 00:00:00 GMT"})
+    assert cache.get("works/W1") is None
+    assert cache.validators("works/W1") == {'If-None-Match': '"v1"',
+                                            'If-Modified-Since': "Mon, 01 Aug 2022 00:00:00 GMT"}
+
+
+def test_sqlite_cache_revalidate_renews_entry(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=-1)
+    cache.set("authors/A1", None, {'id': "A1"}, validators={'etag': '"v1"'})
+    cache.ttl = 60
+    assert cache.revalidate("authors/A1") == {'id': "A1"}
+    assert cache.get("authors/A1") == {'id': "A1"}
+
+
+def test_sqlite_cache_without_entry_has_no_validators(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    assert cache.validators("works/W1") == {}
+    assert cache.revalidate("works/W1") is None
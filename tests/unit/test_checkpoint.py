@@ -0,0 +1,40 @@
+"""All unit tests covering class 'checkpoint'."""
+
+import json
+
+import pytest
+from diophila.checkpoint import Checkpoint
+
+
+def test_advance_saves_progress(tmp_path):
+    filename = str(tmp_path / "harvest.json")
+    checkpoint = Checkpoint(filename, "works", {'per_page': 200, 'cursor': "*"})
+    checkpoint.advance("c1", 200)
+    checkpoint.advance("c2", 200)
+    with open(filename, encoding="utf-8") as checkpoint_file:
+        state = json.load(checkpoint_file)
+    assert state == {'fingerprint': "works?per_page=200", 'cursor': "c2",
+                     'pages': 2, 'entities': 400}
+
+
+def test_resume_loads_progress(tmp_path):
+    filename = str(tmp_path / "harvest.json")
+    Checkpoint(filename, "works", {'filter': "a:1,b:2"}).advance("c1", 25)
+    checkpoint = Checkpoint(filename, "works", {'filter': "b:2,a:1", 'cursor': "x"}, resume=True)
+    assert (checkpoint.cursor, checkpoint.pages, checkpoint.entities) == ("c1", 1, 25)
+    assert not checkpoint.done
+
+
+def test_without_resume_starts_from_first_page(tmp_path):
+    filename = str(tmp_path / "harvest.json")
+    Checkpoint(filename, "works", {}).advance(None, 25)
+    checkpoint = Checkpoint(filename, "works", {})
+    assert checkpoint.cursor == "*"
+    assert Checkpoint(filename, "works", {}, resume=True).done
+
+
+def test_resume_different_query_error(tmp_path):
+    filename = str(tmp_path / "harvest.json")
+    Checkpoint(filename, "works", {'per_page': 25}).advance("c1", 25)
+    with pytest.raises(ValueError):
+        Checkpoint(filename, "works", {'per_page': 200}, resume=True)
@@ -0,0 +1,94 @@
+"""All unit tests covering class 'citations'."""
+
+import pytest
+from diophila.citations import CitationCrawler, CitationGraph
+
+REFERENCES = {"W1": ["W2", "W3"], "W2": [], "W3": [], "W4": ["W1"], "W5": ["W4", "W2"]}
+
+
+class FakeAPICaller:
+    """Answers 'openalex_id' and 'cites' OR-filters from a small citation graph."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self):
+        self.filters = []
+
+    @staticmethod
+    def work(openalex_id):
+        return {'id': f"https://openalex.org/{openalex_id}",
+                'ids': {'openalex': f"https://openalex.org/{openalex_id}"},
+                'referenced_works': [f"https://openalex.org/{r}" for r in REFERENCES[openalex_id]]}
+
+    def get_all(self, path, params, *args):
+        self.filters.append(params['filter'])
+        attr, values = params['filter'].split(":", 1)
+        values = values.upper().split("|")
+        if attr == "openalex_id":
+            results = [self.work(w) for w in REFERENCES if w in values]
+        else:
+            results = [self.work(w) for w, refs in REFERENCES.items() if set(refs) & set(values)]
+        return iter([{'meta': {'next_cursor': None}, 'results': results}])
+
+
+def edges(graph):
+    sources, targets = graph.edge_arrays()
+    return {(graph.nodes[s], graph.nodes[t]) for s, t in zip(sources, targets)}
+
+
+def test_crawl_one_level_in_both_directions():
+    graph = CitationCrawler(FakeAPICaller()).crawl(["https://openalex.org/W1"])
+    assert sorted(graph.nodes) == ["W1", "W2", "W3", "W4"]
+    assert edges(graph) == {("W1", "W2"), ("W1", "W3"), ("W4", "W1")}
+
+
+def test_crawl_two_levels_expands_every_work_once():
+    api_caller = FakeAPICaller()
+    graph = CitationCrawler(api_caller).crawl(["W1"], depth=2)
+    assert sorted(graph.nodes) == ["W1", "W2", "W3", "W4", "W5"]
+    assert ("W5", "W4") in edges(graph) and ("W5", "W2") in edges(graph)
+    assert graph.num_edges == 5
+    # one batched lookup and one citation query per level
+    assert len(api_caller.filters) == 4
+
+
+def test_crawl_references_only_with_max_nodes():
+    graph = CitationCrawler(FakeAPICaller()).crawl(["W1"], direction="references", max_nodes=2)
+    assert graph.num_nodes == 2
+    assert edges(graph) == {("W1", "W2")}
+
+
+class ManyCitationsAPICaller:
+    """Serves 50 pages of two new works citing any work, counting the pages requested."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self):
+        self.requests = 0
+
+    def get_all(self, path, params, *args):
+        for page in range(50):
+            self.requests += 1
+            yield {'meta': {}, 'results': [{'id': f"https://openalex.org/W{100 + 2 * page + n}",
+                                            'referenced_works': ["https://openalex.org/W1"]}
+                                           for n in range(2)]}
+
+
+def test_crawl_stops_paging_citations_once_max_nodes_reached():
+    api_caller = ManyCitationsAPICaller()
+    graph = CitationCrawler(api_caller).crawl(["W1"], direction="cited_by", max_nodes=3)
+    assert graph.num_nodes == 3
+    assert edges(graph) == {("W100", "W1"), ("W101", "W1")}
+    # only the pages fetched ahead in the background are requested on top
+    assert api_caller.requests < 10
+
+
+def test_crawl_not_valid_direction_error():
+    with pytest.raises(ValueError):
+        CitationCrawler(FakeAPICaller()).crawl(["W1"], direction="sideways")
+
+
+def test_graph_csr_layout_and_transpose():
+    graph = CitationGraph.from_edges(["W1", "W2", "W3"], [(0, 2), (0, 1), (2, 1)])
+    assert list(graph.indptr) == [0, 2, 2, 3]
+    assert list(graph.references(0)) == [1, 2]
+    assert list(graph.transpose().references(1)) == [0, 2]
+    assert graph.index("https://openalex.org/W3") == 2
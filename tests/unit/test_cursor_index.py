@@ -0,0 +1,107 @@
+"""All unit tests covering module 'cursor_index'."""
+
+import pytest
+
+from diophila.api_caller import APICaller
+from diophila.cursor_index import CursorIndex, SQLiteCursorIndex, query_fingerprint
+
+BASE_URL = "https://api.openalex.org"
+PARAMS = {'filter': "type:book", 'per_page': 1}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cursor_index(request, tmp_path):
+    if request.param == "memory":
+        return CursorIndex()
+    return SQLiteCursorIndex(str(tmp_path / "cursors.sqlite"))
+
+
+def test_fingerprint_ignores_cursor_and_page():
+    assert query_fingerprint("works", {**PARAMS, 'cursor': "c1", 'page': 3}) \
+           == query_fingerprint("works", PARAMS)
+    assert query_fingerprint("works", {**PARAMS, 'per_page': 2}) \
+           != query_fingerprint("works", PARAMS)
+
+
+def test_nearest_of_unknown_list_is_first_page(cursor_index):
+    assert cursor_index.nearest("works", PARAMS, 900) == (1, "*")
+
+
+def test_nearest_finds_closest_known_page(cursor_index):
+    cursor_index.record("works", PARAMS, 2, "c2")
+    cursor_index.record("works", PARAMS, 3, "c3")
+    assert cursor_index.nearest("works", PARAMS, 900) == (3, "c3")
+    assert cursor_index.nearest("works", {**PARAMS, 'cursor': "c3"}, 2) == (2, "c2")
+
+
+def test_memory_index_evicts_least_recently_used_lists():
+    cursor_index = CursorIndex(max_lists=1)
+    cursor_index.record("works", PARAMS, 2, "c2")
+    cursor_index.record("authors", PARAMS, 2, "a2")
+    assert len(cursor_index) == 1
+    assert cursor_index.nearest("works", PARAMS, 2) == (1, "*")
+
+
+def test_sqlite_index_persists_cursors(tmp_path):
+    filename = str(tmp_path / "cursors.sqlite")
+    SQLiteCursorIndex(filename).record("works", PARAMS, 2, "c2")
+    assert SQLiteCursorIndex(filename).nearest("works", PARAMS, 5) == (2, "c2")
+
+
+# test serving deep pages
+class CursorAPICaller(APICaller):
+    """Serves a list of 10 single-entity pages, page n has the cursor 'c<n>'."""
+    PAGING_RESULTS_MAX = 4
+
+    def __init__(self, cursor_index):
+        super().__init__(BASE_URL, cursor_index=cursor_index)
+        self.requests = []
+        self.responses = []
+
+    def get(self, path, params=None):
+        self.requests.append(params.get('page') or params.get('cursor'))
+        if params.get('page'):
+            number = params['page']
+        else:
+            number = 1 if params['cursor'] == "*" else int(params['cursor'][1:])
+        next_cursor = f"c{number + 1}" if number < 10 else None
+        self.responses.append({'meta': {'next_cursor': next_cursor, 'page': params.get('page')},
+                               'results': [{'id': f"W{number}"}]})
+        return self.responses[-1]
+
+
+def test_get_all_serves_deep_pages_from_nearest_cursor(cursor_index):
+    api_caller = CursorAPICaller(cursor_index)
+    pages = list(api_caller.get_all("works", {'filter': "type:book"}, per_page=1, pages=[2, 7]))
+    assert [page['results'][0]['id'] for page in pages] == ["W2", "W7"]
+    assert pages[1]['meta']['page'] == 7
+    # responses (possibly shared with a cache) are not modified
+    assert all(response['meta']['page'] is None for response in api_caller.responses[1:])
+    # page 2 by basic paging, page 7 by walking the cursors from the first page
+    assert api_caller.requests == [2, "*", "c2", "c3", "c4", "c5", "c6", "c7"]
+
+    api_caller.requests = []
+    pages = list(api_caller.get_all("works", {'filter': "type:book"}, per_page=1, pages=[8]))
+    assert pages[0]['results'] == [{'id': "W8"}]
+    assert api_caller.requests == ["c8"]
+
+
+def test_get_all_records_cursors_while_cursor_paging(cursor_index):
+    api_caller = CursorAPICaller(cursor_index)
+    assert len(list(api_caller.get_all("works", {'filter': "type:book"}, per_page=1))) == 10
+    api_caller.requests = []
+    pages = list(api_caller.get_all("works", {'filter': "type:book"}, per_page=1, pages=[9]))
+    assert pages[0]['results'] == [{'id': "W9"}]
+    assert api_caller.requests == ["c9"]
+
+
+def test_get_all_skips_pages_beyond_last_page(cursor_index):
+    api_caller = CursorAPICaller(cursor_index)
+    pages = list(api_caller.get_all("works", {}, per_page=1, pages=[12, 5]))
+    assert [page['results'][0]['id'] for page in pages] == ["W5"]
+
+
+def test_get_all_without_cursor_index_drops_deep_pages():
+    api_caller = CursorAPICaller(None)
+    pages = list(api_caller.get_all("works", {}, per_page=1, pages=[2, 7]))
+    assert [page['results'][0]['id'] for page in pages] == ["W2"]
@@ -1,7 +1,10 @@
 """All unit tests covering class 'endpoints'."""
 
+import random
+import threading
+
 import pytest
-from diophila.endpoints import Venues
+from diophila.endpoints import Venues, Works
 
 endpoint = Venues(None)
 
@@ -175,3 +178,346 @@ def test_build_sort_param_for_list_no_valid_sort_search_error():
     is_search = True
     with pytest.raises(ValueError):
         endpoint._Endpoint__build_sort_param_for_list(sort=sort, is_search=is_search)
+
+
+# test method "get_many"
+class FakeAPICaller:
+    """Answers OR-filters on 'openalex_id' or 'doi' from a fixed set of works."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self, works):
+        self.works = works
+        self.requests = []
+
+    def get_all(self, path, params, per_page=None, pages=None, workers=None):
+        attr, values = params['filter'].split(":", 1)
+        values = values.lower().split("|")
+        key = {'openalex_id': 'openalex', 'doi': 'doi'}[attr]
+        results = [w for w in self.works
+                   if w['ids'][key].lower().rsplit("/", 1)[-1] in [v.rsplit("/", 1)[-1] for v in values]]
+        # like the API, the last page of results still has a next cursor
+        self.requests.append(params)
+        yield {'meta': {'next_cursor': "IlsxNjA5MzcyODAwMDAwXSI="}, 'results': results}
+        if not pages:
+            self.requests.append(params)
+            yield {'meta': {'next_cursor': None}, 'results': []}
+
+
+def make_work(number):
+    return {'id': f"https://openalex.org/W{number}",
+            'ids': {'openalex': f"https://openalex.org/W{number}",
+                    'doi': f"https://doi.org/10.1/ABC{number}"}}
+
+
+def test_get_many_batches_ids_into_or_filters():
+    api_caller = FakeAPICaller([make_work(n) for n in range(120)])
+    result = Works(api_caller).get_many([f"W{n}" for n in range(120)])
+    assert len(api_caller.requests) == 3
+    assert all(entity is not None for entity in result.values())
+    assert result["W7"]['id'] == "https://openalex.org/W7"
+
+
+def test_get_many_reports_missing_ids_as_none():
+    api_caller = FakeAPICaller([make_work(1)])
+    result = Works(api_caller).get_many(["W1", "https://openalex.org/W2"])
+    assert result["W1"]['id'] == "https://openalex.org/W1"
+    assert result["https://openalex.org/W2"] is None
+
+
+def test_get_many_matches_doi_regardless_of_prefix_and_case():
+    api_caller = FakeAPICaller([make_work(1), make_work(2)])
+    result = Works(api_caller).get_many(["10.1/abc1", "https://doi.org/10.1/ABC2"], "doi")
+    assert api_caller.requests[0]['filter'].startswith("doi:")
+    assert result["10.1/abc1"]['id'] == "https://openalex.org/W1"
+    assert result["https://doi.org/10.1/ABC2"]['id'] == "https://openalex.org/W2"
+
+
+def test_get_many_removes_duplicate_ids():
+    api_caller = FakeAPICaller([make_work(1)])
+    Works(api_caller).get_many(["W1", "W1"])
+    assert api_caller.requests[0]['filter'] == "openalex_id:W1"
+
+
+def test_get_many_not_valid_id_type_error():
+    with pytest.raises(ValueError):
+        endpoint.get_many(["0000-0000"], "orcid")
+
+
+# test method "build_select_param"
+def test_build_select_param_empty_select_should_give_none():
+    assert endpoint._build_select_param([], endpoint.selectable_attrs) is None
+
+
+def test_build_select_param_valid_fields_should_give_select_string():
+    select_param = endpoint._build_select_param(["id", "display_name"], endpoint.selectable_attrs)
+    assert select_param == "id,display_name"
+
+
+def test_build_select_param_no_valid_field_error():
+    with pytest.raises(ValueError):
+        endpoint._build_select_param(["id", "hallo"], endpoint.selectable_attrs)
+
+
+# test "select" in queries
+class RecordingAPICaller:
+    """Records the parameters of every request and answers with a fixed response."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self, response=None):
+        self.response = response
+        self.requests = []
+
+    def get(self, path, params=None):
+        self.requests.append((path, params))
+        return self.response
+
+    def get_all(self, path, params, per_page=None, pages=None, workers=None, stream=False,
+                checkpoint=None, resume=False):
+        self.requests.append((path, params))
+        return iter([{'meta': {'next_cursor': None}, 'results': []}])
+
+
+def test_get_single_sends_select_param():
+    api_caller = RecordingAPICaller()
+    Works(api_caller).get_single("W1", select=["id", "title"])
+    assert api_caller.requests == [("works/W1", {'select': "id,title"})]
+
+
+def test_get_list_sends_select_param():
+    api_caller = RecordingAPICaller()
+    Works(api_caller).get_list(select=["id", "doi"])
+    assert api_caller.requests[0][1]['select'] == "id,doi"
+
+
+def test_get_many_always_selects_ids():
+    api_caller = RecordingAPICaller()
+    Works(api_caller).get_many(["W1"], select=["title"])
+    assert api_caller.requests[0][1]['select'] == "title,id,ids"
+
+
+def test_get_groups_projects_groups_client_side():
+    response = {'meta': {'count': 2},
+                'group_by': [{'key': "true", 'key_display_name': "true", 'count': 3},
+                             {'key': "false", 'key_display_name': "false", 'count': 1}]}
+    api_caller = RecordingAPICaller(response)
+    groups = Venues(api_caller).get_groups("is_oa", select=["key", "count"])
+    assert 'select' not in api_caller.requests[0][1]
+    assert groups['group_by'] == [{'key': "true", 'count': 3}, {'key': "false", 'count': 1}]
+    assert groups['meta'] == {'count': 2}
+
+
+def test_get_groups_no_valid_select_error():
+    with pytest.raises(ValueError):
+        Venues(RecordingAPICaller({'group_by': []})).get_groups("is_oa", select=["id"])
+
+
+# test sharding of method "get_list"
+class ShardingAPICaller:
+    """Answers group_by (in pages of two groups), count and list requests
+    from a fixed set of works."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self, years):
+        self.works = [{'id': f"W{n}", 'publication_year': year} for n, year in enumerate(years)]
+        years = [w['publication_year'] for w in self.works]
+        self.groups = [{'key': str(year), 'count': years.count(year)}
+                       for year in sorted(set(years))]
+        self.shards = []
+
+    def get(self, path, params=None):
+        if params.get('group_by'):
+            return {'meta': {'count': len(self.groups)}, 'group_by': self.groups[:2]}
+        return {'meta': {'count': len(self.works)}, 'results': self.works[:1]}
+
+    def get_all(self, path, params, per_page=None, pages=None, workers=None, stream=False):
+        if params.get('group_by'):
+            return iter([{'meta': {}, 'group_by': self.groups[start:start + 2]}
+                         for start in range(0, len(self.groups) + 2, 2)])
+        years = params['filter'].split("publication_year:")[1].split(",")[0].split("|")
+        self.shards.append(years)
+        results = [w for w in self.works if str(w['publication_year']) in years]
+        return iter([{'meta': {'next_cursor': None}, 'results': results}])
+
+
+def test_get_list_sharded_yields_every_entity_once():
+    years = [2018] * 40 + [2019] * 5 + [2020] * 5 + [2021] * 30 + [2022] * 20
+    api_caller = ShardingAPICaller(years)
+    pages = Works(api_caller).get_list(filters={"is_oa": "true"}, workers=2,
+                                       shard_by="publication_year")
+    ids = [work['id'] for page in pages for work in page['results']]
+    assert sorted(ids) == sorted(work['id'] for work in api_caller.works)
+    # small groups are combined, largest shard first
+    assert api_caller.shards[0] == ["2018"]
+    assert ["2019", "2020"] in api_caller.shards
+
+
+def test_get_list_sharded_by_overlapping_groups_error():
+    api_caller = ShardingAPICaller([2020, 2021])
+    api_caller.groups = [{'key': "2020", 'count': 2}, {'key': "2021", 'count': 1}]
+    with pytest.raises(ValueError):
+        Works(api_caller).get_list(shard_by="publication_year")
+
+
+def test_get_list_sharded_with_pages_error():
+    with pytest.raises(ValueError):
+        Works(ShardingAPICaller([2020])).get_list(pages=[1], shard_by="publication_year")
+
+
+# test method "count" and "count_many"
+class CountingAPICaller:
+    """Answers count requests with the length of the filter parameter."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, path, params=None):
+        with self.lock:
+            self.requests.append(params)
+        return {'meta': {'count': len(params['filter'] or "")},
+                'results': [{'id': "https://openalex.org/W1"}]}
+
+
+def test_count_sends_minimal_request():
+    api_caller = CountingAPICaller()
+    assert Works(api_caller).count(filters={"is_oa": "true"}) == len("is_oa:true")
+    assert api_caller.requests == [{'filter': "is_oa:true", 'search': None,
+                                    'per_page': 1, 'select': "id"}]
+
+
+def test_count_many_counts_distinct_filters_once():
+    api_caller = CountingAPICaller()
+    filters = [{"is_oa": "true"}, None, {"publication_year": 2020}, {"is_oa": "true"}]
+    counts = Works(api_caller).count_many(filters, workers=3)
+    assert counts == [10, 0, 21, 10]
+    assert len(api_caller.requests) == 3
+
+
+def test_count_many_sends_requests_concurrently_by_default():
+    api_caller = CountingAPICaller()
+    barrier = threading.Barrier(2, timeout=5)
+    original_get = api_caller.get
+
+    def get(path, params=None):
+        barrier.wait()  # only passes if two requests are in flight at once
+        return original_get(path, params)
+
+    api_caller.get = get
+    assert Works(api_caller).count_many([{"is_oa": "true"}, None]) == [10, 0]
+
+
+def test_count_many_not_valid_filter_error():
+    with pytest.raises(ValueError):
+        Works(CountingAPICaller()).count_many([{"not_a_filter": 1}])
+
+
+# test methods "get_all_groups" and "get_facets"
+class FacetAPICaller:
+    """Serves the groups of every facet in pages of two groups."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self, facets):
+        self.facets = facets
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, path, params=None):
+        groups = self.facets[params['group_by']]
+        return {'meta': {'count': len(groups)}, 'group_by': groups[:2]}
+
+    def get_all(self, path, params, per_page=None, pages=None, workers=None, stream=False,
+                checkpoint=None, resume=False):
+        with self.lock:
+            self.requests.append(dict(params))
+        groups = self.facets[params['group_by']]
+        for start in range(0, len(groups) + 2, 2):
+            yield {'meta': {'count': len(groups)}, 'group_by': groups[start:start + 2]}
+
+
+FACETS = {'is_oa': [{'key': "true", 'count': 3}, {'key': "false", 'count': 5}],
+          'publication_year': [{'key': str(year), 'count': year - 2000}
+                               for year in range(2001, 2006)]}
+
+
+def test_get_all_groups_pages_through_every_group():
+    api_caller = FacetAPICaller(FACETS)
+    groups = Works(api_caller).get_all_groups("publication_year", filters={"is_oa": "true"})
+    assert groups == {'2001': 1, '2002': 2, '2003': 3, '2004': 4, '2005': 5}
+    assert api_caller.requests == [{'group_by': "publication_year", 'filter': "is_oa:true",
+                                    'search': None}]
+
+
+def test_get_all_groups_not_valid_group_by_error():
+    with pytest.raises(ValueError):
+        Works(FacetAPICaller(FACETS)).get_all_groups("title")
+
+
+def test_get_facets_requests_every_facet():
+    api_caller = FacetAPICaller(FACETS)
+    facets = Works(api_caller).get_facets(["is_oa", "publication_year", "is_oa"], workers=2)
+    assert facets['is_oa'] == {'true': 3, 'false': 5}
+    assert len(facets['publication_year']) == 5
+    assert len(api_caller.requests) == 2
+
+
+def test_get_facets_first_page_only():
+    facets = Works(FacetAPICaller(FACETS)).get_facets(["publication_year"], all_groups=False)
+    assert facets == {'publication_year': {'2001': 1, '2002': 2}}
+
+
+# test method "sample"
+class SamplingAPICaller:
+    """Samples a list of `size` works, repeating the first work of every page
+    like the API sometimes returns duplicates across the pages of a sample."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self, size, duplicates=True):
+        self.size = size
+        self.duplicates = duplicates
+        self.requests = []
+
+    def get_all(self, path, params, per_page=None, pages=None, workers=None, stream=False,
+                checkpoint=None, resume=False):
+        self.requests.append((dict(params), pages))
+        ids = random.Random(params['seed']).sample(range(self.size),
+                                                   min(params['sample'], self.size))
+        for page in pages:
+            results = [{'id': f"W{i}"} for i in ids[(page - 1) * per_page:page * per_page]]
+            if self.duplicates:
+                results = results[:1] + results[1:-1] + results[:1]
+            yield {'meta': {}, 'results': results}
+
+
+def test_sample_pages_seeded_sample_and_drops_duplicates():
+    api_caller = SamplingAPICaller(10000)
+    works = Works(api_caller).sample(450, seed=7, filters={"is_oa": "true"}, select=["doi"])
+    assert len(works) == 450
+    assert len({work['id'] for work in works}) == 450
+    # duplicates of the first sample are replaced by works of a sample with the next seed
+    first, second = api_caller.requests[:2]
+    assert first == ({'filter': "is_oa:true", 'search': None, 'select': "doi,id",
+                      'sample': 450, 'seed': 7}, [1, 2, 3])
+    assert (second[0]['sample'], second[0]['seed'], second[1]) == (3, 8, [1])
+
+
+def test_sample_is_reproducible_with_seed():
+    assert Works(SamplingAPICaller(1000)).sample(300, seed=1) \
+           == Works(SamplingAPICaller(1000)).sample(300, seed=1)
+
+
+def test_sample_stops_when_list_is_exhausted():
+    api_caller = SamplingAPICaller(5, duplicates=False)
+    assert len(Works(api_caller).sample(20, seed=1)) == 5
+    assert len(api_caller.requests) == 2
+
+
+def test_sample_splits_samples_larger_than_sample_max():
+    api_caller = SamplingAPICaller(30000)
+    assert len(Works(api_caller).sample(12000, seed=1)) == 12000
+    assert [params['sample'] for params, _ in api_caller.requests][:2] == [10000, 2050]
+
+
+def test_sample_not_valid_n_error():
+    with pytest.raises(ValueError):
+        Works(SamplingAPICaller(5)).sample(0)
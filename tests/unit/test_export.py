@@ -0,0 +1,101 @@
+"""All unit tests covering class 'export'."""
+
+import gzip
+import json
+import time
+
+import pytest
+from diophila.api_caller import APICaller
+from diophila.export import JSONLWriter, export_entities
+
+PAGES = [{'meta': {'next_cursor': "c1"},
+          'results': [{'id': f"W{n}", 'title': f"Work {n}", 'authorships': [{'author': n}]}
+                      for n in range(50)]},
+         {'meta': {'next_cursor': None},
+          'results': [{'id': f"W{n}", 'title': f"Work {n}", 'authorships': []}
+                      for n in range(50, 60)]}]
+
+
+def read_jsonl(files):
+    lines = []
+    for filename in files:
+        with gzip.open(filename, "rt", encoding="utf-8") as jsonl_file:
+            lines += [json.loads(line) for line in jsonl_file]
+    return lines
+
+
+def test_export_entities_writes_pages_to_jsonl(tmp_path):
+    files = export_entities(iter(PAGES), JSONLWriter(str(tmp_path / "works.jsonl.gz")))
+    entities = read_jsonl(files)
+    assert len(files) == 1
+    assert [entity['id'] for entity in entities] == [f"W{n}" for n in range(60)]
+
+
+def test_export_entities_writes_streamed_entities_with_select(tmp_path):
+    entities = (entity for page in PAGES for entity in page['results'])
+    files = export_entities(entities, JSONLWriter(str(tmp_path / "works.jsonl.gz")),
+                            select=["id"])
+    assert read_jsonl(files)[:2] == [{'id': "W0"}, {'id': "W1"}]
+
+
+def test_export_entities_does_not_advance_checkpoint_past_written_pages(tmp_path):
+    checkpoint_file = tmp_path / "harvest.json"
+    cursors = {"*": "c1", "c1": "c2", "c2": None}
+    api_caller = APICaller("https://api.openalex.org")
+    api_caller.get = lambda path, params: {'meta': {'next_cursor': cursors[params['cursor']]},
+                                           'results': [{'id': params['cursor']}]}
+    checkpointed_pages = []
+
+    class RecordingWriter(JSONLWriter):
+        def write(self, entity):
+            time.sleep(0.05)  # a slow writer, giving fetching ahead time to run
+            state = json.loads(checkpoint_file.read_text()) if checkpoint_file.exists() else {}
+            checkpointed_pages.append(state.get('pages', 0))
+            super().write(entity)
+
+    pages = api_caller.get_all("works", {}, 1, checkpoint=str(checkpoint_file))
+    export_entities(pages, RecordingWriter(str(tmp_path / "works.jsonl.gz")), prefetch_depth=4)
+    # while a page is written, the checkpoint only covers the pages before it
+    assert checkpointed_pages == [0, 1, 2]
+
+
+def test_jsonl_writer_rolls_over_files(tmp_path):
+    writer = JSONLWriter(str(tmp_path / "works-{index:02d}.jsonl"), compression=None,
+                         max_bytes=500)
+    files = export_entities(iter(PAGES), writer)
+    assert len(files) > 1
+    assert files[1].endswith("works-01.jsonl")
+    lines = [line for filename in files for line in open(filename, encoding="utf-8")]
+    assert len(lines) == 60
+
+
+def test_jsonl_writer_rollover_without_index_error(tmp_path):
+    with pytest.raises(ValueError):
+        JSONLWriter(str(tmp_path / "works.jsonl.gz"), max_bytes=500)
+
+
+def test_jsonl_writer_not_valid_compression_error(tmp_path):
+    with pytest.raises(ValueError):
+        JSONLWriter(str(tmp_path / "works.jsonl.bz2"), compression="bz2")
+
+
+def test_jsonl_writer_zstd(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    files = export_entities(iter(PAGES), JSONLWriter(str(tmp_path / "works.jsonl.zst"),
+                                                     compression="zstd"))
+    with open(files[0], "rb") as zstd_file:
+        data = zstandard.ZstdDecompressor().stream_reader(zstd_file).read()
+    assert len(data.splitlines()) == 60
+
+
+def test_parquet_writer_writes_row_groups(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+    from diophila.export import ParquetWriter
+
+    files = export_entities(iter(PAGES), ParquetWriter(str(tmp_path / "works.parquet"),
+                                                       row_group_size=25))
+    parquet_file = pyarrow.parquet.ParquetFile(files[0])
+    assert parquet_file.metadata.num_rows == 60
+    assert parquet_file.metadata.num_row_groups == 3
+    assert json.loads(parquet_file.read().to_pylist()[0]['authorships']) == [{'author': 0}]
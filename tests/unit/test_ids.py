@@ -0,0 +1,90 @@
+"""All unit tests covering class 'ids'."""
+
+import time
+
+import pytest
+from diophila.ids import pack_id, unpack_id, to_packed_ids, IdSet, IdMap
+
+
+# test methods "pack_id" and "unpack_id"
+def test_pack_id_round_trip_for_all_entity_types():
+    for prefix in "WAIVC":
+        openalex_id = f"https://openalex.org/{prefix}2741809807"
+        assert unpack_id(pack_id(openalex_id)) == openalex_id
+        assert unpack_id(pack_id(f"{prefix.lower()}2741809807"), short=True) == f"{prefix}2741809807"
+
+
+def test_pack_id_keeps_types_apart_and_fits_int64():
+    assert pack_id("W1") != pack_id("A1")
+    assert all(0 < pack_id(f"{prefix}999999999999") < 2 ** 63 for prefix in "WAIVC")
+
+
+def test_pack_id_not_valid_id_error():
+    for openalex_id in ("X123", "W12a", "https://doi.org/10.1/abc", ""):
+        with pytest.raises(ValueError):
+            pack_id(openalex_id)
+
+
+def test_unpack_id_not_packed_id_error():
+    with pytest.raises(ValueError):
+        unpack_id(123)
+
+
+def test_to_packed_ids_from_pages():
+    pages = [{'meta': {}, 'results': [{'id': "https://openalex.org/W1"}, {'id': "W2"}]}]
+    assert list(to_packed_ids(pages)) == [pack_id("W1"), pack_id("W2")]
+
+
+# test class "IdSet"
+def test_id_set_deduplicates_across_buffer_merges(monkeypatch):
+    monkeypatch.setattr(IdSet, "BUFFER_MAX", 3)
+    id_set = IdSet(f"W{n % 7}" for n in range(20))
+    assert len(id_set) == 7
+    assert "https://openalex.org/W3" in id_set
+    assert "W8" not in id_set
+    assert "not an id" not in id_set
+    assert list(id_set)[0] == "https://openalex.org/W0"
+
+
+
+def test_id_set_add_deduplicates_across_buffer_merges(monkeypatch):
+    monkeypatch.setattr(IdSet, "BUFFER_MAX", 3)
+    id_set = IdSet()
+    for n in range(20):
+        id_set.add(f"W{n % 7}")
+    assert len(id_set) == 7
+    assert list(id_set.packed_ids()) == sorted(pack_id(f"W{n}") for n in range(7))
+
+
+def test_id_set_insertion_time_scales_linearly(monkeypatch):
+    # with a fixed merge threshold, 4 times the IDs took about 16 times as long
+    monkeypatch.setattr(IdSet, "BUFFER_MAX", 256)
+
+    def insertion_time(size):
+        start = time.perf_counter()
+        id_set = IdSet()
+        for n in range(size):
+            id_set.add(n * 7919 % 1000003)
+        id_set.update(range(1000003, 1000003 + size))
+        return time.perf_counter() - start
+
+    small = min(insertion_time(25000) for _ in range(3))
+    large = min(insertion_time(100000) for _ in range(3))
+    assert large < 8 * small
+
+
+# test class "IdMap"
+def test_id_map_sets_and_overwrites_values(monkeypatch):
+    monkeypatch.setattr(IdMap, "BUFFER_MAX", 2)
+    id_map = IdMap()
+    for n in range(5):
+        id_map[f"A{n}"] = n * 10
+    id_map["A1"] = 11
+    id_map["https://openalex.org/A4"] = 44
+    assert len(id_map) == 5
+    assert id_map["A1"] == 11 and id_map[pack_id("A4")] == 44
+    assert id_map.get("A9") is None and "A0" in id_map
+    with pytest.raises(KeyError):
+        id_map["A9"]
+    assert list(id_map.items())[:2] == [("https://openalex.org/A0", 0),
+                                        ("https://openalex.org/A1", 11)]
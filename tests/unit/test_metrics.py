@@ -0,0 +1,72 @@
+"""All unit tests covering class 'metrics'."""
+
+import logging
+import time
+
+from diophila.metrics import RequestEvent, MetricsCollector
+
+
+def make_event(path, params=None, status=200, latency=0.2, **attributes):
+    event = RequestEvent(path, params)
+    event.finish()
+    event.status, event.latency = status, latency
+    for name, value in attributes.items():
+        setattr(event, name, value)
+    return event
+
+
+def test_request_event_derives_endpoint_and_paging_mode():
+    assert RequestEvent("works/W1").paging == "single"
+    assert RequestEvent("works", {'cursor': "*"}).paging == "cursor"
+    assert RequestEvent("works", {'page': 2}).paging == "basic"
+    assert RequestEvent("works", {'group_by': "type"}).paging == "group"
+    assert RequestEvent("works?filter=x", {}).endpoint == "works"
+
+
+def test_summary_reports_counts_and_percentiles():
+    collector = MetricsCollector()
+    for latency in range(1, 101):
+        collector.on_end(make_event("works", {'cursor': "c"}, latency=latency / 100, bytes=10))
+    collector.on_end(make_event("works", {'cursor': "c"}, status=None, latency=2.0))
+    summary = collector.summary()["works cursor"]
+    assert summary['requests'] == 101
+    assert summary['errors'] == 1
+    assert summary['bytes'] == 1000
+    assert summary['p50'] == 0.51
+    assert summary['p99'] == 1.0
+
+
+def test_to_prometheus_exports_counters_and_histograms():
+    collector = MetricsCollector()
+    collector.on_end(make_event("works/W1", latency=0.07, cache="hit"))
+    collector.on_end(make_event("works/W2", latency=0.3, retries=2, decode_time=0.002))
+    text = collector.to_prometheus()
+    assert 'diophila_requests_total{endpoint="works",paging="single",status="200"} 2' in text
+    assert 'diophila_retries_total{endpoint="works",paging="single"} 2' in text
+    assert 'diophila_cache_total{endpoint="works",paging="single",result="hit"} 1' in text
+    assert ('diophila_request_duration_seconds_bucket'
+            '{endpoint="works",paging="single",le="0.1"} 1') in text
+    assert ('diophila_request_duration_seconds_bucket'
+            '{endpoint="works",paging="single",le="+Inf"} 2') in text
+    assert 'diophila_decode_duration_seconds_count{endpoint="works",paging="single"} 1' in text
+    assert "# TYPE diophila_request_duration_seconds histogram" in text
+
+
+def test_start_reporting_reports_periodically():
+    collector = MetricsCollector()
+    collector.on_end(make_event("works/W1"))
+    reports = []
+    collector.start_reporting(interval=0.01, report=reports.append)
+    time.sleep(0.1)
+    collector.stop_reporting()
+    assert reports and reports[0]["works single"]['requests'] == 1
+
+
+def test_start_reporting_logs_by_default(caplog):
+    collector = MetricsCollector()
+    collector.on_end(make_event("works/W1"))
+    with caplog.at_level(logging.INFO, logger="diophila.metrics"):
+        collector.start_reporting(interval=0.01)
+        time.sleep(0.1)
+        collector.stop_reporting()
+    assert "works single" in caplog.text
@@ -0,0 +1,52 @@
+"""All unit tests covering class 'models'."""
+
+import pytest
+from diophila.models import Author, Work, to_model, to_models
+
+WORK = {'id': "https://openalex.org/W1",
+        'title': "A title",
+        'publication_year': 2020,
+        'authorships': [{'author': {'id': "https://openalex.org/A1"}}],
+        'counts_by_year': [{'year': 2021, 'cited_by_count': 3}],
+        'new_field': {'a': 1}}
+
+
+def test_model_decodes_nested_fields_on_first_access():
+    work = Work(WORK)
+    assert isinstance(work._authorships, bytes)
+    assert work.authorships == WORK['authorships']
+    assert work._authorships is work.authorships
+    assert work.title == "A title"
+    assert work.doi is None
+
+
+def test_model_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Work(WORK).__dict__
+
+
+def test_model_behaves_like_dict():
+    work = Work(WORK)
+    assert work['publication_year'] == 2020
+    assert work['new_field'] == {'a': 1}
+    with pytest.raises(KeyError):
+        work['missing']
+
+
+def test_to_dict_keeps_all_fields():
+    to_dict = Work(WORK).to_dict()
+    assert {k: v for k, v in to_dict.items() if v is not None} == WORK
+
+
+def test_to_model_derives_model_from_id():
+    assert isinstance(to_model(WORK), Work)
+    assert isinstance(to_model({'id': "https://openalex.org/A1"}), Author)
+    with pytest.raises(ValueError):
+        to_model({'display_name': "no id"})
+
+
+def test_to_models_converts_pages():
+    pages = [{'meta': {}, 'results': [WORK, WORK]}, {'meta': {}, 'results': [WORK]}]
+    models = list(to_models(pages, Work))
+    assert len(models) == 3
+    assert all(isinstance(model, Work) for model in models)
@@ -0,0 +1,127 @@
+"""All unit tests covering class 'prefetch'."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from diophila.prefetch import prefetch, aprefetch, merge, amerge
+
+
+def test_prefetch_yields_items_in_order():
+    assert list(prefetch(iter(range(10)), depth=3)) == list(range(10))
+
+
+def test_prefetch_fetches_next_item_while_current_is_processed():
+    fetched = []
+
+    def slow_pages():
+        for page in range(3):
+            time.sleep(0.05)
+            fetched.append(page)
+            yield page
+
+    start = time.monotonic()
+    for _ in prefetch(slow_pages(), depth=1):
+        time.sleep(0.05)  # process page
+    # sequential fetching and processing would take 0.3s
+    assert time.monotonic() - start < 0.25
+    assert fetched == [0, 1, 2]
+
+
+def test_prefetch_stays_at_most_depth_items_ahead():
+    fetched = []
+
+    def pages():
+        for page in range(100):
+            fetched.append(page)
+            yield page
+
+    items = prefetch(pages(), depth=2)
+    next(items)
+    time.sleep(0.1)
+    # one item consumed, two queued and one waiting to be queued
+    assert len(fetched) <= 4
+    items.close()
+
+
+def test_prefetch_reraises_exception_in_consumer():
+    def failing_pages():
+        yield 1
+        raise RuntimeError("API down")
+
+    items = prefetch(failing_pages())
+    assert next(items) == 1
+    with pytest.raises(RuntimeError):
+        next(items)
+
+
+def test_prefetch_stops_producer_when_consumer_stops():
+    def endless_pages():
+        page = 0
+        while True:
+            page += 1
+            yield page
+
+    threads_before = threading.active_count()
+    items = prefetch(endless_pages(), depth=1)
+    next(items)
+    items.close()
+    time.sleep(0.3)
+    assert threading.active_count() == threads_before
+
+
+def test_aprefetch_yields_items_in_order():
+    async def pages():
+        for page in range(5):
+            await asyncio.sleep(0)
+            yield page
+
+    async def collect():
+        return [page async for page in aprefetch(pages(), depth=2)]
+
+    assert asyncio.run(collect()) == list(range(5))
+
+
+# test method "merge"
+def slow_shard(name, size):
+    for i in range(size):
+        time.sleep(0.02)
+        yield (name, i)
+
+
+def test_merge_yields_all_items_keeping_order_within_iterables():
+    items = list(merge([slow_shard("a", 5), slow_shard("b", 3), slow_shard("c", 4)], workers=2))
+    assert sorted(items) == sorted([("a", i) for i in range(5)] + [("b", i) for i in range(3)]
+                                   + [("c", i) for i in range(4)])
+    for name in "abc":
+        positions = [i for shard, i in items if shard == name]
+        assert positions == sorted(positions)
+
+
+def test_merge_consumes_iterables_concurrently():
+    start = time.monotonic()
+    list(merge([slow_shard(name, 5) for name in "abcd"], workers=4))
+    # sequential consumption would take 0.4s
+    assert time.monotonic() - start < 0.3
+
+
+def test_merge_reraises_exceptions():
+    def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        list(merge([failing(), slow_shard("a", 3)], workers=2))
+
+
+def test_amerge_yields_all_items():
+    async def shard(name, size):
+        for i in range(size):
+            await asyncio.sleep(0.01)
+            yield (name, i)
+
+    async def collect():
+        return [item async for item in amerge([shard("a", 3), shard("b", 2)], workers=2)]
+
+    assert sorted(asyncio.run(collect())) == [("a", 0), ("a", 1), ("a", 2), ("b", 0), ("b", 1)]
@@ -0,0 +1,195 @@
+"""All unit tests covering class 'Query'."""
+
+import threading
+
+import pytest
+
+from diophila import OpenAlex
+from diophila.endpoints import Works
+from diophila.query import Query, not_, gt, lt, between
+
+
+class RecordingAPICaller:
+    """Records the parameters of every request and answers with a fixed response."""
+    PER_PAGE_MAX = 200
+
+    def __init__(self, response=None):
+        self.response = response
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, path, params=None):
+        self.requests.append((path, params))
+        return self.response
+
+    def get_all(self, path, params, per_page=None, pages=None, workers=None, stream=False,
+                checkpoint=None, resume=False):
+        with self.lock:
+            self.requests.append((path, params))
+        # API callers add the paging parameters to the params they are given
+        params['cursor'] = "*"
+        return iter([{'meta': {'next_cursor': None}, 'results': []}])
+
+    def iter_all(self, path, params, per_page=None, pages=None, prefetch_depth=2):
+        self.requests.append((path, params))
+        return iter([])
+
+
+def works():
+    return Query(Works(RecordingAPICaller()))
+
+
+# test compiling queries
+def test_query_compiles_filters_sort_and_select():
+    query = (works().filter(publication_year=2020, is_oa=True)
+             .filter({'concepts.id': ["C1", "C2"]})
+             .sort(cited_by_count="desc")
+             .select("id", "doi"))
+    assert query.params == {'filter': "concepts.id:C1|C2,is_oa:true,publication_year:2020",
+                            'search': None,
+                            'sort': "cited_by_count:desc",
+                            'select': "id,doi"}
+
+
+def test_query_compiles_operators():
+    query = (works().filter(type=not_("paratext"), cited_by_count=gt(10),
+                            publication_year=between(2010, 2015))
+             .filter(cited_by_count=lt(100)))
+    assert query.params['filter'] == ("cited_by_count:<100,cited_by_count:>10,"
+                                      "publication_year:2010-2015,type:!paratext")
+
+
+def test_query_compiles_none_to_null():
+    assert works().filter(doi=None).params['filter'] == "doi:null"
+
+
+def test_query_sort_replaces_direction_of_existing_key():
+    query = works().sort(cited_by_count="asc", publication_date="desc").sort(cited_by_count="desc")
+    assert query.params['sort'] == "cited_by_count:desc,publication_date:desc"
+
+
+def test_query_is_hashable_and_canonical():
+    first = works().filter(is_oa=True, type={"book", "article"})
+    second = works().filter(is_oa=True, type={"article", "book"})
+    assert first == second
+    assert len({first, second}) == 1
+    assert first != first.select("id")
+
+
+def test_query_is_independent_of_filter_order():
+    first = works().filter(publication_year=2020).filter(is_oa=True)
+    second = works().filter(is_oa=True, publication_year=2020)
+    assert first == second
+    assert str(first) == str(second)
+
+
+def test_query_steps_return_new_queries():
+    query = works().filter(is_oa=True)
+    query.sort(cited_by_count="desc")
+    assert query.params['sort'] is None
+
+
+def test_query_string_leaves_out_empty_params():
+    query = works().filter(is_oa=True).select("id")
+    assert str(query) == "works?filter=is_oa%3Atrue&select=id"
+    assert str(works()) == "works"
+
+
+def test_query_invalid_filter_error():
+    with pytest.raises(ValueError):
+        works().filter(not_a_filter=1)
+
+
+def test_query_too_many_or_values_error():
+    with pytest.raises(ValueError):
+        works().filter(doi=[f"10.1/{n}" for n in range(Works.OR_VALUES_MAX + 1)])
+
+
+def test_query_invalid_sort_error():
+    with pytest.raises(ValueError):
+        works().sort(cited_by_count="up")
+
+
+def test_query_invalid_select_error():
+    with pytest.raises(ValueError):
+        works().select("not_a_field")
+
+
+def test_query_sort_by_relevance_requires_search():
+    query = works().sort(relevance_score="desc")
+    with pytest.raises(ValueError):
+        query.get_list()
+    # search can be added after sorting
+    query.search("bioplastics").get_list()
+
+
+# test running queries
+def test_query_get_list_does_not_modify_compiled_params():
+    api_caller = RecordingAPICaller()
+    query = Query(Works(api_caller)).filter(is_oa=True)
+    list(query.get_list(per_page=200))
+    list(query.get_list(per_page=200))
+    assert api_caller.requests[1][1] == {'filter': "is_oa:true", 'search': None,
+                                         'sort': None, 'select': None, 'cursor': "*"}
+    assert 'cursor' not in query.params
+
+
+def test_query_is_reusable_across_threads():
+    api_caller = RecordingAPICaller()
+    query = Query(Works(api_caller)).filter(is_oa=True)
+    threads = [threading.Thread(target=lambda: list(query.get_list())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(api_caller.requests) == 8
+    assert all(params['filter'] == "is_oa:true" for _, params in api_caller.requests)
+
+
+def test_query_get_groups_uses_filters_of_query():
+    api_caller = RecordingAPICaller({'group_by': [{'key': "true", 'count': 1}]})
+    query = Query(Works(api_caller)).filter(publication_year=2020).sort(cited_by_count="desc")
+    groups = query.get_groups("is_oa", sort={'count': "desc"}, select=["key"])
+    assert groups['group_by'] == [{'key': "true"}]
+    assert api_caller.requests == [("works", {'group_by': "is_oa",
+                                              'filter': "publication_year:2020",
+                                              'search': None,
+                                              'sort': "count:desc"})]
+
+
+def test_query_get_groups_invalid_group_by_error():
+    with pytest.raises(ValueError):
+        works().get_groups("not_groupable")
+
+
+def test_openalex_offers_queries_per_endpoint():
+    openalex = OpenAlex()
+    assert openalex.works is openalex.works
+    assert openalex.authors.path == "authors"
+    assert str(openalex.works.filter(is_oa=True)) == "works?filter=is_oa%3Atrue"
+
+
+def test_query_count_sends_minimal_request():
+    api_caller = RecordingAPICaller({'meta': {'count': 42}, 'results': []})
+    query = Query(Works(api_caller)).filter(is_oa=True).sort(cited_by_count="desc").select("doi")
+    assert query.count() == 42
+    assert api_caller.requests == [("works", {'filter': "is_oa:true", 'search': None,
+                                              'per_page': 1, 'select': "id"})]
+
+
+def test_query_get_facets_uses_filters_of_query():
+    api_caller = RecordingAPICaller()
+    api_caller.get_all = lambda path, params, per_page: iter(
+        [{'meta': {}, 'group_by': [{'key': params['group_by'], 'count': 1}]}])
+    query = Query(Works(api_caller)).filter(publication_year=2020)
+    assert query.get_facets(["is_oa", "type"]) == {'is_oa': {'is_oa': 1}, 'type': {'type': 1}}
+    with pytest.raises(ValueError):
+        query.get_all_groups("title")
+
+
+def test_query_sample_uses_filters_of_query():
+    api_caller = RecordingAPICaller()
+    api_caller.get_all = lambda path, params, per_page, pages, workers: iter(
+        [{'meta': {}, 'results': [{'id': "W1"}, {'id': "W1"}]}])
+    query = Query(Works(api_caller)).filter(is_oa=True).sort(cited_by_count="desc")
+    assert query.sample(5, seed=3) == [{'id': "W1"}]
@@ -0,0 +1,89 @@
+"""All unit tests covering class 'rate_limiter'."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from diophila.rate_limiter import RateLimiter, DailyLimitExceeded
+
+
+def test_reserve_spaces_requests_evenly():
+    rate_limiter = RateLimiter(per_second=10, per_day=None)
+    waits = [rate_limiter.reserve() for _ in range(3)]
+    assert waits[0] == 0
+    assert waits[1] == pytest.approx(0.1, abs=0.01)
+    assert waits[2] == pytest.approx(0.2, abs=0.01)
+
+
+def test_reserve_allows_burst():
+    rate_limiter = RateLimiter(per_second=10, per_day=None, burst=3)
+    assert [rate_limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert rate_limiter.reserve() > 0
+
+
+def test_acquire_is_thread_safe():
+    rate_limiter = RateLimiter(per_second=100, per_day=None)
+    start = time.monotonic()
+    threads = [threading.Thread(target=rate_limiter.acquire) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.08
+    assert rate_limiter.used_today == 10
+
+
+def test_acquire_async_paces_tasks():
+    rate_limiter = RateLimiter(per_second=100, per_day=None)
+
+    async def run():
+        await asyncio.gather(*(rate_limiter.acquire_async() for _ in range(5)))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - start >= 0.035
+
+
+def test_daily_limit_exceeded_error():
+    rate_limiter = RateLimiter(per_second=1000, per_day=2)
+    rate_limiter.reserve()
+    rate_limiter.reserve()
+    with pytest.raises(DailyLimitExceeded):
+        rate_limiter.reserve()
+
+
+def test_daily_count_is_persisted(tmp_path):
+    state_file = str(tmp_path / "rate.json")
+    rate_limiter = RateLimiter(per_second=1000, per_day=3, state_file=state_file)
+    rate_limiter.reserve()
+    rate_limiter.reserve()
+    rate_limiter.close()
+
+    rate_limiter = RateLimiter(per_second=1000, per_day=3, state_file=state_file)
+    assert rate_limiter.used_today == 2
+    rate_limiter.reserve()
+    with pytest.raises(DailyLimitExceeded):
+        rate_limiter.reserve()
+
+
+def test_penalize_pauses_and_lowers_rate_then_recovers():
+    rate_limiter = RateLimiter(per_second=10, per_day=None)
+    rate_limiter.penalize(retry_after=2)
+    assert rate_limiter.rate == 5
+    assert rate_limiter.reserve() >= 2
+    for _ in range(20):
+        rate_limiter.record_success()
+    assert rate_limiter.rate == 10
+
+
+def test_parse_retry_after():
+    assert RateLimiter.parse_retry_after("3") == 3
+    assert RateLimiter.parse_retry_after(None) is None
+    assert RateLimiter.parse_retry_after("Mon, 01 Aug 2022 00:00:00 GMT") == 0
+    assert RateLimiter.parse_retry_after("soon") is None
+
+
+def test_parse_retry_after_date_without_zone_is_utc():
+    assert RateLimiter.parse_retry_after("Mon, 01 Aug 2022 00:00:00 -0000") == 0
+    assert 3000 < RateLimiter.parse_retry_after("Fri, 01 Jan 9999 00:00:00 -0000")
@@ -0,0 +1,54 @@
+"""All unit tests covering class 'streaming'."""
+
+import json
+
+import pytest
+from diophila.streaming import ResultsParser
+
+PAGE = {'meta': {'count': 3, 'next_cursor': 'IlsxNjA5\\"XQ=='},
+        'results': [{'id': "https://openalex.org/W1", 'title': 'Braces }] and "quotes" [{'},
+                    {'id': "https://openalex.org/W2", 'display_name': "Über ☃",
+                     'concepts': [{'id': "C1", 'score': 0.5}, {'id': "C2", 'score': None}]},
+                    {'id': "https://openalex.org/W3", 'is_oa': True, 'cited_by_count': -1.5e3}],
+        'group_by': []}
+
+
+def feed_in_chunks(body: bytes, chunk_size: int):
+    parser = ResultsParser()
+    results = []
+    for i in range(0, len(body), chunk_size):
+        results.extend(parser.feed(body[i:i + chunk_size]))
+    parser.close()
+    return parser, results
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 100000])
+def test_parser_yields_results_independent_of_chunk_size(chunk_size):
+    body = json.dumps(PAGE, ensure_ascii=False, indent=1).encode()
+    parser, results = feed_in_chunks(body, chunk_size)
+    assert results == PAGE['results']
+    assert parser.fields == {'meta': PAGE['meta'], 'group_by': []}
+
+
+def test_parser_yields_entity_as_soon_as_it_is_complete():
+    parser = ResultsParser()
+    assert parser.feed(b'{"meta": {}, "results": [{"id": 1}, {"id"') == [{'id': 1}]
+    assert parser.feed(b': 2}]}') == [{'id': 2}]
+
+
+def test_parser_empty_results():
+    parser, results = feed_in_chunks(b'{"meta": {"next_cursor": null}, "results": []}', 3)
+    assert results == []
+    assert parser.fields['meta']['next_cursor'] is None
+
+
+def test_parser_incomplete_body_error():
+    parser = ResultsParser()
+    parser.feed(b'{"meta": {}, "results": [{"id": 1}')
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_parser_no_json_object_error():
+    with pytest.raises(ValueError):
+        ResultsParser().feed(b'[1, 2]')
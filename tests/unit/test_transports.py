@@ -0,0 +1,134 @@
+"""All unit tests covering module 'transports'."""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+import pytest
+import requests
+
+from diophila import OpenAlex
+from diophila.api_caller import APICaller
+from diophila.transports import (_build_url, Response, RequestsTransport, Urllib3Transport,
+                                 HTTPXTransport, ReplayTransport)
+
+CASSETTES = os.path.join(os.path.dirname(__file__), os.pardir, "cassettes")
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    """Local server answering every request with its path and query parameters."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            split_url = urlsplit(self.path)
+            body = json.dumps({'meta': {'next_cursor': None}, 'path': split_url.path,
+                               'results': [dict(parse_qsl(split_url.query)), {'id': "W2"}],
+                               'connection': self.headers.get('Connection')}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_build_url_leaves_out_empty_params():
+    assert _build_url("https://x.org/works", {'filter': "a:b", 'select': None}) \
+           == "https://x.org/works?filter=a%3Ab"
+    assert _build_url("https://x.org/works", {}) == "https://x.org/works"
+
+
+def test_response_raises_http_error():
+    with pytest.raises(requests.HTTPError) as error:
+        Response(404, url="https://x.org/works/W1").raise_for_status()
+    assert error.value.response.status_code == 404
+    Response(200).raise_for_status()
+
+
+def test_response_iterates_content_in_chunks():
+    response = Response(200, content=b"abcdefg")
+    assert list(response.iter_content(3)) == [b"abc", b"def", b"g"]
+    closed = []
+    streamed = Response(200, stream=lambda size: iter([b"ab", b"c"]),
+                        close=lambda: closed.append(True))
+    assert streamed.content == b"abc"
+    assert closed == [True]
+
+
+# test network transports against a local server
+@pytest.mark.parametrize("transport", [RequestsTransport, Urllib3Transport])
+def test_transport_sends_params_and_headers(server_url, transport):
+    with APICaller(server_url, keep_alive=False, transport=transport()) as api_caller:
+        response = api_caller.get("works", {'filter': "a:b", 'select': None})
+    assert response['path'] == "/works"
+    assert response['results'][0] == {'filter': "a:b"}
+    assert response['connection'] == "close"
+
+
+@pytest.mark.parametrize("transport", [RequestsTransport, Urllib3Transport])
+def test_transport_streams_entities(server_url, transport):
+    with APICaller(server_url, transport=transport()) as api_caller:
+        entities = list(api_caller.get_all("works", {}, per_page=2, stream=True))
+    assert entities[0]['cursor'] == "*"
+    assert entities[1] == {'id': "W2"}
+
+
+def test_httpx_transport_sends_params(server_url):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    with APICaller(server_url, transport=HTTPXTransport()) as api_caller:
+        response = api_caller.get("works", {'filter': "a:b"})
+    assert response['results'][0] == {'filter': "a:b"}
+
+
+def test_default_transport_exposes_session():
+    assert APICaller("https://api.openalex.org").session is not None
+    assert APICaller("https://api.openalex.org", transport=ReplayTransport()).session is None
+
+
+# test replaying responses
+def test_replay_transport_serves_cassettes():
+    transport = ReplayTransport(os.path.join(CASSETTES, "test_grouped_entities"))
+    openalex = OpenAlex(transport=transport)
+    assert len(openalex.get_groups_of_authors("has_orcid")['group_by']) == 2
+    # the order of the query parameters does not matter
+    grouped = openalex.get_groups_of_authors("has_orcid", filters={"works_count": ">20000"})
+    assert grouped['group_by'][0]['count'] == 0
+
+
+def test_replay_transport_decodes_compressed_cassettes():
+    cassette = os.path.join(CASSETTES, "test_single_entity",
+                            "test_single_work_by_openalex_id.yaml")
+    openalex = OpenAlex(transport=ReplayTransport(cassette))
+    work = openalex.get_single_work("https://openalex.org/W2741809807")
+    assert work['id'] == "https://openalex.org/W2741809807"
+
+
+def test_replay_transport_answers_unknown_requests_with_404():
+    api_caller = APICaller("https://api.openalex.org", transport=ReplayTransport())
+    with pytest.raises(requests.HTTPError):
+        api_caller.get("works/W1")
+
+
+def test_replay_transport_serves_added_responses():
+    transport = ReplayTransport()
+    transport.add("/works?page=1&per_page=2",
+                  {'meta': {'page': 1}, 'results': [{'id': "W1"}, {'id': "W2"}]})
+    api_caller = APICaller("https://api.openalex.org", transport=transport)
+    pages = list(api_caller.get_all("works", {}, per_page=2, pages=[1]))
+    assert pages[0]['results'] == [{'id': "W1"}, {'id': "W2"}]
+    entities = list(api_caller.get_all("works", {}, per_page=2, pages=[1], stream=True))
+    assert entities == [{'id': "W1"}, {'id': "W2"}]